@@ -9,6 +9,9 @@ AutoScene - 自动化时间轴驱动的 ManimGL 场景类
 - 区域标注：annotate_region（纯色背景覆盖+标注）
 - 相机聚焦：camera_focus（动态聚焦+恢复）
 - 固定方向：add_fixed_subtitle, add_fixed_annotation（3D标签）
+- 试运行：DRY_RUN / AUTOSCENE_DRY_RUN=1，不渲染画面，只推进时间轴并导出事件、标记、SRT
+- 分段并行渲染：section() 标记阶段边界，section_render.py 多进程渲染各段后无损拼接
+- 性能剖析：PROFILE / AUTOSCENE_PROFILE=1，导出 Chrome trace 并按分段打印 Top-N
 
 使用示例：
     class MyScene(AutoScene):
@@ -37,6 +40,18 @@ from manimlib import (
     Axes, get_norm, angle_of_vector, DEFAULT_ARROW_TIP_WIDTH,
     DEFAULT_ARROW_TIP_LENGTH, GlowDot, interpolate, Tex
 )
+from manimlib.utils.sounds import get_full_sound_file_path
+
+
+class _HeldFrame:
+    """静止等待去重：代替相机交给 SceneFileWriter.write_frame，返回缓存的原始帧数据"""
+    
+    def __init__(self, raw_bytes: bytes):
+        self._raw_bytes = raw_bytes
+    
+    def get_raw_fbo_data(self, dtype: str = "f1") -> bytes:
+        return self._raw_bytes
+
 
 # ==================== GPU Glow 可用性集中检查 ====================
 
@@ -81,6 +96,24 @@ def is_gpu_glow_available():
 # 预先初始化检查
 is_gpu_glow_available()
 
+
+def _ensure_utils_importable(module: str) -> bool:
+    """确保 auto_manim/utils/<module> 可导入（必要时注入项目根目录）"""
+    try:
+        __import__(f"utils.{module}")
+        return True
+    except ImportError:
+        pass
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # auto_manim 目录
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    try:
+        __import__(f"utils.{module}")
+        return True
+    except ImportError as e:
+        print(f"⚠️ 无法导入 utils.{module}: {e}")
+        return False
+
 # ==================== StealthTip 坐标轴 API ====================
 
 class StealthTip(VMobject):
@@ -316,6 +349,8 @@ def create_stealth_axes(
         x_range=None,
         color=WHITE,
         n_samples=500,
+        adaptive=True,
+        pixel_tolerance=0.5,
         **glow_kwargs
     ):
         """
@@ -327,7 +362,9 @@ def create_stealth_axes(
             color: 辉光颜色
             glow_width: 辉光宽度
             glow_factor: 辉光衰减因子
-            n_samples: 采样点数
+            n_samples: 采样点数（adaptive 时作为对比基准）
+            adaptive: 按曲率/屏幕误差自适应采样，顶点数见 get_sampling_report()
+            pixel_tolerance: 自适应采样允许的屏幕误差（像素）
             
         Returns:
             GlowCurve: 与坐标系对齐的辉光曲线
@@ -341,6 +378,7 @@ def create_stealth_axes(
             x_range = [axes.x_range[0], axes.x_range[1]]
         
         # 创建参数函数，直接使用 axes.c2p 进行坐标转换
+        # （x 为数组时 c2p 返回 (n, 3)，GlowCurve 会整段向量化求值）
         def parametric_func(x):
             y = function(x)
             # 使用 axes.c2p 将数学坐标转换为场景坐标
@@ -352,6 +390,8 @@ def create_stealth_axes(
             function=parametric_func,
             t_range=tuple(x_range),
             n_samples=n_samples,
+            adaptive=adaptive,
+            pixel_tolerance=pixel_tolerance,
             color=color,
             glow_width=0.4,
             white_core_ratio=0.02,  # 白色核心宽度
@@ -622,6 +662,8 @@ def create_glow_function_graph(
     opacity=1.0,
     glow_width=0.15,
     glow_factor=2.5,
+    adaptive=True,
+    pixel_tolerance=0.5,
     **kwargs
 ):
     """
@@ -634,6 +676,9 @@ def create_glow_function_graph(
         opacity: 透明度
         glow_width: 辉光宽度
         glow_factor: 辉光衰减因子
+        adaptive: 按曲率/屏幕误差自适应采样（抛物线等平滑曲线顶点大幅减少，
+            尖峰处自动加密），节省情况见 graph.get_sampling_report()
+        pixel_tolerance: 自适应采样允许的屏幕误差（像素）
         
     Returns:
         GlowFunctionGraph: 辉光函数图像对象
@@ -656,6 +701,8 @@ def create_glow_function_graph(
         opacity=opacity,
         glow_width=glow_width,
         glow_factor=glow_factor,
+        adaptive=adaptive,
+        pixel_tolerance=pixel_tolerance,
         **kwargs
     )
 
@@ -1056,6 +1103,41 @@ class AutoScene(InteractiveScene):
     SUBTITLE_BG_BUFF = 0.15            # 背景与文字的内边距
     
     DEFAULT_VOICE = "zh-CN-XiaoxiaoNeural"
+    TTS_MAX_CONCURRENCY = 8  # 批量预合成并发数
+    
+    # Tex 预编译（结果进入 ManimGL 自带的磁盘缓存，跨场景、跨渲染共享）
+    PREWARM_TEX: list = []              # construct 之前在进程池中预编译的 Tex 字符串
+    TEX_PREWARM_PROCESSES = None        # 预编译进程数（None: CPU 数）
+    
+    # 音效选择种子（None: 随机；整数: 每次渲染选中相同音效，便于复现与缓存）
+    SOUND_SEED = None
+    
+    # 离线音频预混：add_sound 只记录事件，结束时混成一条音轨一次封装
+    PREMIX_AUDIO = True
+    AUDIO_MIX_SAMPLE_RATE = 44100
+    
+    # 试运行（不渲染画面、不合成配音）：也可用环境变量 AUTOSCENE_DRY_RUN=1 开启，
+    # AUTOSCENE_DRY_RUN=voices 时合成缺失配音，时长完全准确（分段渲染的预处理）
+    DRY_RUN = False
+    
+    # 静止等待去重：没有 updater 时 wait 只渲染一帧，其余帧重复写入编码器
+    STATIC_HOLD_ENABLED = True
+    
+    # 性能剖析（关闭时不安装任何包装）：也可用环境变量 AUTOSCENE_PROFILE=1 开启
+    PROFILE = False
+    PROFILE_TOP_N = 10
+    PROFILE_METHODS = {
+        "timeline": ("run_timeline", "speak", "subtitle", "clear_subtitle", "play", "wait"),
+        "voice": ("presynthesize_voices", "_generate_voice", "_get_audio_duration"),
+        "build": (
+            "make_subtitle", "_add_highlight_animation", "highlight_text", "focus_guide",
+            "annotate_region", "add_curved_annotation", "add_fixed_formula",
+            "create_glow_text", "create_glow_tex", "create_glow_underline", "create_glow_arc_arrow",
+            "create_pulse_glow_curve", "create_pulse_glow_function", "create_pulse_glow_circle",
+        ),
+        "render": ("update_frame", "emit_frame", "update_mobjects"),
+    }
+    DRY_RUN_CHARS_PER_SECOND = 4.5      # 未缓存配音按字数估算时长（+0% 语速）
     WRITE_DURATION = 0.5
     TRANSFORM_DURATION = 0.3
     FADE_DURATION = 0.3
@@ -1086,9 +1168,32 @@ class AutoScene(InteractiveScene):
     LAYOUT_EDGE_BUFF = 0.2              # 左右边距
     LAYOUT_DIVIDER_WIDTH_RATIO = 0.95   # 分割线宽度占屏幕比例
     
-    def __init__(self, **kwargs):
+    def __init__(self, dry_run: bool = None, **kwargs):
         super().__init__(**kwargs)
         
+        # 试运行：跳过所有帧的绘制与写入，play/wait 只推进场景时间
+        dry_run_env = os.environ.get("AUTOSCENE_DRY_RUN", "")
+        if dry_run is None:
+            dry_run = self.DRY_RUN or dry_run_env not in ("", "0")
+        self._dry_run = bool(dry_run)
+        self._dry_run_voices = dry_run_env == "voices"
+        if self._dry_run:
+            self.skip_animations = True
+            self.file_writer.write_to_movie = False
+            self.file_writer.save_last_frame = False
+        
+        # 分段渲染：本进程只渲染第 AUTOSCENE_SECTION 段（之前的段跳过绘制，之后的段不执行）
+        section = os.environ.get("AUTOSCENE_SECTION", "")
+        self._sections: list = []  # [{"name", "start"}]
+        self._render_section = int(section) if section and not self._dry_run else None
+        self._section_dir = os.environ.get("AUTOSCENE_SECTION_DIR")
+        if self._render_section is not None:
+            if self._render_section > 0:
+                self.skip_animations = True
+            if self._section_dir:
+                movie_path = getattr(self.file_writer, "movie_file_path", None) or "section.mp4"
+                self.file_writer.movie_file_path = self._section_path(os.path.splitext(movie_path)[1])
+        
         # 时间轴状态
         self._current_time: float = 0.0
         
@@ -1114,7 +1219,18 @@ class AutoScene(InteractiveScene):
         self._voice = self.DEFAULT_VOICE
         self._enable_voice = True
         self._sounds_dir = self._get_sounds_dir()
+        self._voice_rate = "+0%"
+        self._voice_pitch = "+0Hz"
         self._voice_count = 0  # 配音文件全局计数器
+        self._tts_backend = None  # TTS 合成后端（None 使用 edge-tts）
+        self._voice_store = self._init_voice_store()  # 跨场景内容寻址缓存
+        self._voice_manifest = (
+            self._voice_store.load_manifest(self.__class__.__name__)
+            if self._voice_store else {}
+        )
+        self._voice_lines_used = set()  # 本次运行登记过的清单行号
+        self._construct_finished = False  # construct 是否完整执行（未被 EndScene / 中断截断）
+        self._duration_index = None  # 音频时长索引（延迟创建）
         
         # 音效库（动画自动播放音效）
         self._sound_library = None
@@ -1122,6 +1238,16 @@ class AutoScene(InteractiveScene):
         self._enable_add_sounds = False  # add() 音效开关
         self._sound_gain = 0.6  # 音效音量 (0.0-1.0)
         self._init_sound_library()
+        # 分段渲染时声音必须经时间线交给父进程（分段视频里的音轨不会被封装进成片）
+        self._audio_timeline = (
+            self._init_audio_timeline()
+            if self.PREMIX_AUDIO or self._render_section is not None else None
+        )
+        self._gain_to_background_warned = False
+        
+        # 静止等待去重状态（wait 期间为 {"frame": 原始帧数据}）
+        self._static_hold = None
+        self._static_hold_stats = {"waits": 0, "frames": 0}
         
         # 辉光颜色轮询色盘（电影级彩色，禁止白色）
         self._glow_color_palette = [
@@ -1195,7 +1321,47 @@ class AutoScene(InteractiveScene):
         self._time_hud = None
         self._time_tracker = None
         self._markers: list = []
+        self._timeline_events: list = []  # [{"type", "start", "end", "label"}]
         self._debug_mode = False
+        
+        # 性能剖析：只在开启时用计时包装替换实例方法
+        profile = self.PROFILE or os.environ.get("AUTOSCENE_PROFILE", "") not in ("", "0")
+        self._profiler = self._init_profiler() if profile else None
+    
+    def _init_profiler(self):
+        """创建剖析器，并把 PROFILE_METHODS 中的方法替换为实例级计时包装"""
+        if not _ensure_utils_importable("profiler"):
+            return None
+        from utils.profiler import Profiler, instrument_updaters
+        profiler = Profiler()
+        for category, names in self.PROFILE_METHODS.items():
+            for name in names:
+                method = getattr(self, name, None)
+                if method is not None:
+                    setattr(self, name, profiler.wrap(method, name, category))
+        
+        # 每次更新前为新出现的 updater 安装计时包装（在计时区间之外）
+        update_mobjects = getattr(self, "update_mobjects", None)
+        if update_mobjects is not None:
+            def update_mobjects_profiled(*args, **kwargs):
+                instrument_updaters(profiler, self.mobjects)
+                return update_mobjects(*args, **kwargs)
+            self.update_mobjects = update_mobjects_profiled
+        return profiler
+    
+    def _finish_profile(self, output_dir: str = None) -> str:
+        """导出 Chrome trace（assets/profile/ 或 AUTOSCENE_PROFILE_DIR）并打印各分段 Top-N"""
+        output_dir = output_dir or os.environ.get("AUTOSCENE_PROFILE_DIR")
+        if output_dir is None:
+            parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            output_dir = os.path.join(parent_dir, "assets", "profile")
+        name = self.__class__.__name__
+        if self._render_section is not None:
+            name += f".section_{self._render_section:03d}"
+        path = self._profiler.export_chrome_trace(os.path.join(output_dir, f"{name}.trace.json"))
+        self._profiler.print_summary(self.PROFILE_TOP_N)
+        print(f"📄 Chrome trace 导出: {path}")
+        return path
     
     def get_shared(self, key: str, default=None, factory=None):
         """
@@ -1255,11 +1421,38 @@ class AutoScene(InteractiveScene):
         if anims:
             self.play(*anims, run_time=run_time)
     
+    def setup(self):
+        super().setup()
+        if self.PREWARM_TEX:
+            self.prewarm_tex(self.PREWARM_TEX)
+    
+    def prewarm_tex(self, strings: list, kind: str = "tex", **kwargs) -> dict:
+        """
+        预编译 Tex：在进程池中并行编译，结果写入 ManimGL 自带的磁盘缓存
+        
+        之后构建同样的 Tex 直接命中缓存；未改动的脚本重新渲染时不启动进程池。
+        kwargs 需与实际构建时一致（如 t2c、isolate 会改变 LaTeX 内容；字号不影响）。
+        
+        Args:
+            strings: Tex 字符串列表
+            kind: "tex" / "textext" / "text"
+            
+        Returns:
+            {"total", "cached", "compiled", "failed"}
+        """
+        if not _ensure_utils_importable("tex_cache"):
+            return {}
+        from utils.tex_cache import prewarm_tex
+        report = prewarm_tex(strings, kind=kind, processes=self.TEX_PREWARM_PROCESSES, **kwargs)
+        if self._debug_mode:
+            print(f"📐 Tex 预编译: {report['compiled']} 个编译, {report['cached']}/{report['total']} 命中缓存")
+        return report
+    
     def _init_sound_library(self) -> None:
         """初始化音效库"""
         try:
             from sound_library import SoundLibrary
-            self._sound_library = SoundLibrary()
+            self._sound_library = SoundLibrary(seed=self.SOUND_SEED)
         except ImportError:
             # 尝试从脚本目录导入
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1267,15 +1460,205 @@ class AutoScene(InteractiveScene):
                 sys.path.insert(0, script_dir)
             try:
                 from sound_library import SoundLibrary
-                self._sound_library = SoundLibrary()
+                self._sound_library = SoundLibrary(seed=self.SOUND_SEED)
             except ImportError:
                 # 音效库不可用，禁用相关功能
                 self._sound_library = None
                 if self._debug_mode:
                     print("ℹ️ SoundLibrary 未安装，音效功能已禁用")
     
+    def _init_audio_timeline(self):
+        """创建音频事件时间线（utils/audio_mixer 不可用时返回 None，回退到逐个 add_sound；分段渲染时报错）"""
+        if not _ensure_utils_importable("audio_mixer"):
+            if self._render_section is not None:
+                raise RuntimeError("分段渲染需要 utils.audio_mixer 记录声音事件")
+            return None
+        from utils.audio_mixer import AudioTimeline
+        return AudioTimeline(sample_rate=self.AUDIO_MIX_SAMPLE_RATE)
+    
+    def add_sound(self, sound_file: str, time_offset: float = 0, gain: float = None,
+                  gain_to_background: float = None) -> None:
+        """
+        重写 add_sound()：预混开启时只记录 (时间, 路径, 增益) 事件
+        
+        gain_to_background（压低背景）需要在叠加时修改已有音轨，仍交给父类逐个处理；
+        分段渲染时无法压低其他段的声音，照常记录事件并忽略该参数（提示一次）。
+        试运行时只记录到事件时间线。负的 time_offset 超出视频开头时从 0 开始。
+        """
+        start = max(self.get_time() + time_offset, 0.0)
+        if self._dry_run:
+            self._log_event("sound", start, start, os.path.basename(sound_file))
+            return
+        if self._render_section is None and (self._audio_timeline is None or gain_to_background is not None):
+            super().add_sound(sound_file, time_offset, gain, gain_to_background)
+            return
+        if gain_to_background is not None and not self._gain_to_background_warned:
+            self._gain_to_background_warned = True
+            print("⚠️ 分段渲染不支持 gain_to_background，声音照常混入，背景不压低")
+        if self.skip_animations:
+            return
+        # 与父类相同：在 ManimGL 声音目录中按扩展名解析，找不到时立即报错（混音时才发现会被静默跳过）
+        sound_path = str(get_full_sound_file_path(sound_file))
+        self._log_event("sound", start, start, os.path.basename(sound_path))
+        self._audio_timeline.add(start, sound_path, gain)
+    
+    def _flush_audio_timeline(self) -> None:
+        """把时间线混成一个 WAV，作为唯一一段声音交给 file_writer"""
+        timeline = self._audio_timeline
+        if timeline is None or len(timeline) == 0:
+            return
+        if self._render_section is not None and self._section_dir:
+            # 分段渲染：事件交给父进程，与其他段合并后统一混音封装
+            self._save_section_audio(timeline)
+            timeline.clear()
+            return
+        if not getattr(self.file_writer, "write_to_movie", False):
+            timeline.clear()
+            return
+        
+        import tempfile
+        import time
+        t0 = time.perf_counter()
+        fd, mix_path = tempfile.mkstemp(prefix=f"{self.__class__.__name__}_", suffix=".wav")
+        os.close(fd)
+        try:
+            if timeline.export_wav(mix_path) is not None:
+                self.file_writer.add_sound(mix_path, 0)
+            if self._debug_mode:
+                stats = timeline.clip_cache.stats
+                print(f"🎵 音频预混: {len(timeline)} 个事件, 解码 {stats['decoded']} 个片段, "
+                      f"{time.perf_counter() - t0:.2f}s")
+        finally:
+            timeline.clear()
+            if os.path.exists(mix_path):
+                os.remove(mix_path)
+    
+    # ==================== 分段渲染 ====================
+    
+    def section(self, name: str = None) -> None:
+        """
+        标记阶段边界（之后的内容属于新的一段）
+        
+        第一个 section() 之前的内容归入第 0 段。section_render.py 为每段启动一个
+        manimgl 进程：该进程跳过之前各段的绘制（仍按 1/fps 逐帧推进动画与 updater，
+        段首状态与整段渲染一致），渲染本段，到下一个边界时结束；
+        各段视频无损拼接，声音按场景时间统一混音后封装一次。
+        
+        各段要独立可运行：跨段使用的对象请通过 set_shared / get_shared 传递。
+        
+        Args:
+            name: 段名（默认 section_<序号>）
+        """
+        index = len(self._sections)
+        start = self.get_time()
+        name = name or f"section_{index}"
+        self._sections.append({"name": name, "start": start})
+        self._log_event("section", start, start, name)
+        if self._profiler is not None:
+            self._profiler.set_section(name)
+        if self._debug_mode:
+            print(f"🎞️ 分段 {index}: {name} @ {start:.2f}s")
+        
+        if self._render_section is None or index == 0:
+            return
+        if index == self._render_section:
+            self.stop_skipping()
+        elif index == self._render_section + 1:
+            from manimlib.scene.scene import EndScene
+            raise EndScene()
+    
+    def get_sections(self) -> list:
+        """
+        获取已标记的分段
+        
+        Returns:
+            [{"name", "start", "end"}, ...]（最后一段的 end 为当前场景时间）
+        """
+        sections = [dict(s) for s in self._sections]
+        if sections and sections[0]["start"] > 0:
+            sections[0]["start"] = 0.0
+        for current, following in zip(sections, sections[1:] + [None]):
+            current["end"] = following["start"] if following else self.get_time()
+        return sections
+    
+    def _skipping_section(self) -> bool:
+        """是否正在跳过本段之前的各段（分段渲染）"""
+        return self._render_section is not None and self.skip_animations
+
+    def get_time_progression(self, run_time, n_iterations=None, desc="", override_skip_animations=False):
+        """
+        跳过之前各段时仍按 1/fps 逐帧推进（update_frame / emit_frame 在跳过时不绘制、不写帧），
+        updater 收到的 dt 序列与整段渲染相同，段首状态与串行渲染一致
+        """
+        if self._skipping_section():
+            override_skip_animations = True
+        return super().get_time_progression(run_time, n_iterations, desc, override_skip_animations)
+
+    def finish_animations(self, animations) -> None:
+        # ManimGL 跳过模式会在结束时再以 dt=run_time 更新一次；逐帧推进后与整段渲染一样只做 dt=0 的收尾
+        if not self._skipping_section():
+            super().finish_animations(animations)
+            return
+        for animation in animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        self.update_mobjects(0)
+
+    def _section_path(self, ext: str) -> str:
+        return os.path.join(self._section_dir, f"section_{self._render_section:03d}{ext}")
+    
+    def _save_section_audio(self, timeline) -> None:
+        import json
+        data = {
+            "section": self._render_section,
+            "events": [[t, os.path.abspath(path), gain] for t, path, gain in timeline.events],
+        }
+        with open(self._section_path(".audio.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    
+    def tear_down(self):
+        if self._debug_mode and self._static_hold_stats["frames"]:
+            stats = self._static_hold_stats
+            print(f"🖼️ 静止等待去重: {stats['waits']} 次 wait, 省去 {stats['frames']} 帧绘制")
+        self._flush_audio_timeline()
+        self._prune_voice_manifest()
+        if self._dry_run:
+            self._finish_dry_run()
+        super().tear_down()
+        if self._profiler is not None:
+            self._finish_profile()
+    
+    def interact(self) -> None:
+        self._construct_finished = True
+        super().interact()
+    
+    def _prune_voice_manifest(self) -> None:
+        """
+        完整运行结束后，从场景清单删去本次没有用到的行（台词删减后残留的行号）
+        
+        只有 construct 完整执行且确实合成/登记了配音时才清理；
+        -n 截断、分段渲染的非末段、中断或不合成配音的试运行都不改动清单。
+        """
+        store = self._voice_store
+        if store is None or not self._construct_finished or not self._voice_lines_used:
+            return
+        if self._dry_run and not self._dry_run_voices:
+            return
+        stale = set(self._voice_manifest) - self._voice_lines_used
+        if stale:
+            store.save_manifest(self.__class__.__name__, self._voice_manifest, keep=self._voice_lines_used)
+            if self._debug_mode:
+                print(f"🧹 配音清单删去 {len(stale)} 行未使用的配音")
+    
+    def _init_voice_store(self):
+        """初始化配音内容寻址存储（assets/sounds/voice/_store）"""
+        if not _ensure_utils_importable("voice_store"):
+            return None
+        from utils.voice_store import VoiceStore
+        return VoiceStore(os.path.dirname(self._sounds_dir))
+    
     def _get_sounds_dir(self) -> str:
-        """获取配音输出目录（按类名存储）"""
+        """获取配音清单目录（按类名存储，音频 blob 在共享 _store 中）"""
         # 使用类名作为文件夹名
         class_name = self.__class__.__name__
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1309,7 +1692,77 @@ class AutoScene(InteractiveScene):
                         print(f"🔊 播放音效: {anim_name} -> {os.path.basename(sound_path)}")
         
         # 调用父类 play
+        start = self.get_time()
         super().play(*animations, **kwargs)
+        self._log_event("play", start, self.get_time(),
+                        ", ".join(anim.__class__.__name__ for anim in animations))
+    
+    def wait(self, *args, **kwargs):
+        start = self.get_time()
+        stop_condition = kwargs.get("stop_condition", args[1] if len(args) > 1 else None)
+        if stop_condition is None and self._can_hold_static():
+            self._static_hold = {"frame": None, "frames": 0}
+        try:
+            result = super().wait(*args, **kwargs)
+        finally:
+            hold, self._static_hold = self._static_hold, None
+        if hold is not None and hold["frames"] > 1:
+            self._static_hold_stats["waits"] += 1
+            self._static_hold_stats["frames"] += hold["frames"] - 1
+        self._log_event("wait", start, self.get_time())
+        return result
+    
+    # ==================== 静止等待去重 ====================
+    
+    def _can_hold_static(self) -> bool:
+        """
+        wait 期间画面是否一定不变
+        
+        只在写视频文件、无预览窗口、非演示模式时启用；
+        任何 mobject（含相机 frame）带 updater 即视为动态（着色器 time 等时间相关 uniform 都由 updater 推进）。
+        例外：InteractiveScene 常驻的选择高亮（selection_highlight）在没有选中对象时 updater 直接返回，不改变画面。
+        """
+        if not self.STATIC_HOLD_ENABLED or self.skip_animations:
+            return False
+        if not getattr(self.file_writer, "write_to_movie", False):
+            return False
+        if getattr(self, "window", None) is not None or getattr(self, "presenter_mode", False):
+            return False
+        if getattr(self, "always_update_mobjects", False):
+            return False
+        idle_highlight = None
+        highlight = getattr(self, "selection_highlight", None)
+        if highlight is not None and not len(self.selection) and not getattr(highlight, "tracked_mobjects", None):
+            idle_highlight = highlight
+        for mob in self.mobjects:
+            if mob is idle_highlight:
+                continue
+            for member in mob.get_family():
+                has_updaters = getattr(member, "has_updaters", False)
+                if callable(has_updaters):
+                    has_updaters = has_updaters()
+                if has_updaters:
+                    return False
+        return True
+    
+    def update_frame(self, dt: float = 0, force_draw: bool = False) -> None:
+        """静止等待中已捕获首帧时只推进时间，不重新绘制"""
+        hold = getattr(self, "_static_hold", None)
+        if hold is not None and hold["frame"] is not None and not force_draw:
+            self.time += dt
+            return
+        super().update_frame(dt, force_draw)
+    
+    def emit_frame(self) -> None:
+        """静止等待中首帧读取一次帧缓冲，之后重复写入同一份原始帧数据"""
+        hold = getattr(self, "_static_hold", None)
+        if hold is None or self.skip_animations:
+            super().emit_frame()
+            return
+        if hold["frame"] is None:
+            hold["frame"] = self.camera.get_raw_fbo_data()
+        self.file_writer.write_frame(_HeldFrame(hold["frame"]))
+        hold["frames"] += 1
     
     def add(self, *mobjects, **kwargs) -> None:
         """
@@ -1526,6 +1979,10 @@ class AutoScene(InteractiveScene):
         # 跳过时间轴验证，因为我们使用实时时间
         should_voice = generate_voice if generate_voice is not None else self._enable_voice
         
+        # 预合成：并发生成全部配音，播放阶段只命中缓存
+        if should_voice:
+            self.presynthesize_voices([event.get("text", "") for event in events])
+        
         for i, event in enumerate(events):
             # 使用当前实时时间作为开始时间（避免重叠）
             actual_start = self._current_time
@@ -1542,10 +1999,8 @@ class AutoScene(InteractiveScene):
             audio_duration = 0
             voice_path = None
             if should_voice and text:
-                voice_path = self._generate_voice(text, self._voice_count)
-                self._voice_count += 1
-                if voice_path and os.path.exists(voice_path):
-                    audio_duration = self._get_audio_duration(voice_path)
+                voice_path, audio_duration = self._voice_for(text)
+                if voice_path:
                     # 播放音频
                     self.add_sound(voice_path)
             
@@ -1605,6 +2060,7 @@ class AutoScene(InteractiveScene):
         display_text = subtitle if subtitle is not None else text
         
         start_time = self._current_time
+        scene_start = self.get_time()
         
         if self._debug_mode:
             print(f"\n{'='*50}")
@@ -1618,12 +2074,10 @@ class AutoScene(InteractiveScene):
         voice_path = None
         audio_duration = min_duration
         if self._enable_voice:
-            voice_path = self._generate_voice(text, self._voice_count)
-            self._voice_count += 1
-            if voice_path and os.path.exists(voice_path):
-                audio_duration = max(self._get_audio_duration(voice_path), min_duration)
-                if self._debug_mode:
-                    print(f"   音频时长: {audio_duration:.2f}s")
+            voice_path, voice_duration = self._voice_for(text)
+            audio_duration = max(voice_duration, min_duration)
+            if voice_path and self._debug_mode:
+                print(f"   音频时长: {audio_duration:.2f}s")
         
         # 创建字幕（使用 display_text）
         new_sub = self.make_subtitle(display_text, color_map)
@@ -1701,6 +2155,7 @@ class AutoScene(InteractiveScene):
         # 气口
         self.wait(self.VOICE_GAP_DURATION)
         self._current_time += self.VOICE_GAP_DURATION
+        self._log_event("speak", scene_start, self.get_time(), display_text)
         
         if self._debug_mode:
             total_duration = self._current_time - start_time
@@ -1727,6 +2182,13 @@ class AutoScene(InteractiveScene):
                 {"text": "重点是向量加法", "color_map": {"重点": YELLOW}}
             ])
         """
+        if self._enable_voice:
+            self.presynthesize_voices([
+                item if isinstance(item, str) else item.get("text", "")
+                for item in texts
+                if isinstance(item, (str, dict))
+            ])
+        
         for item in texts:
             if isinstance(item, str):
                 self.speak(item, min_duration=min_duration)
@@ -1878,6 +2340,7 @@ class AutoScene(InteractiveScene):
         
         # 同步到开始时间
         self.sync_to(t0)
+        scene_start = self.get_time()
         
         # 创建新字幕（支持着色）
         new_sub = self.make_subtitle(text, color_map)
@@ -1904,6 +2367,7 @@ class AutoScene(InteractiveScene):
         
         # 推进到结束时间
         self.advance_to(t1)
+        self._log_event("subtitle", scene_start, self.get_time(), text)
     
     def clear_subtitle(self, t: float = None) -> None:
         """
@@ -1949,14 +2413,18 @@ class AutoScene(InteractiveScene):
         """
         清理当前场景的配音缓存
         
-        用于脚本修改后强制重新生成所有配音
+        用于脚本修改后强制重新生成所有配音：删除本场景清单引用的 blob
+        （其他场景复用的同一句话也会随之重新合成）以及旧版 line_*.mp3 文件。
         
         Returns:
             删除的文件数量
         """
-        import glob
-        pattern = os.path.join(self._sounds_dir, "line_*.mp3")
-        files = glob.glob(pattern)
+        files = glob.glob(os.path.join(self._sounds_dir, "line_*.mp3"))
+        if self._voice_store:
+            keys = {entry.get("key") for entry in self._voice_manifest.values()}
+            files += [self._voice_store.blob_path(key) for key in keys if key]
+            self._voice_manifest = {}
+            self._voice_store.save_manifest(self.__class__.__name__, self._voice_manifest)
         deleted_count = 0
         for f in files:
             try:
@@ -1971,7 +2439,7 @@ class AutoScene(InteractiveScene):
     
     def _get_text_hash(self, text: str) -> str:
         """
-        获取文本的短哈希值（用于文件命名）
+        获取文本的短哈希值（旧版按行号命名的缓存文件使用）
         
         Args:
             text: 文本内容
@@ -1979,73 +2447,202 @@ class AutoScene(InteractiveScene):
         Returns:
             6位哈希字符串
         """
-        import hashlib
         return hashlib.md5(text.encode('utf-8')).hexdigest()[:6]
     
+    def set_tts_backend(self, backend) -> None:
+        """
+        设置 TTS 合成后端
+        
+        Args:
+            backend: 实现 async synthesize(text, output_path, voice, rate, pitch) 的对象，
+                     如 utils.tts_generator.OfflineTTSBackend；None 恢复 edge-tts
+        """
+        self._tts_backend = backend
+    
+    def _import_tts_generator(self):
+        """动态导入 TTSGenerator，失败返回 None"""
+        if not _ensure_utils_importable("tts_generator"):
+            print("⚠️ 无法导入 TTSGenerator，跳过配音生成")
+            return None
+        from utils.tts_generator import TTSGenerator
+        return TTSGenerator
+    
+    def _get_voice_key(self, text: str) -> str:
+        """配音内容键：(text, voice, rate, pitch) 的完整哈希"""
+        from utils.voice_store import VoiceStore
+        return VoiceStore.make_key(text, self._voice, self._voice_rate, self._voice_pitch)
+    
+    def _record_voice(self, event_id: int, text: str, key: str) -> bool:
+        """在场景清单中记录 行号 -> blob，返回清单是否变化"""
+        self._voice_lines_used.add(str(event_id))
+        entry = {"key": key, "text": text}
+        if self._voice_manifest.get(str(event_id)) == entry:
+            return False
+        self._voice_manifest[str(event_id)] = entry
+        return True
+    
+    def _adopt_legacy_voice(self, text: str, event_id: int, key: str) -> bool:
+        """把旧版 line_NNN_<md5[:6]>.mp3 缓存复制进内容寻址存储，避免重新合成"""
+        legacy = os.path.join(self._sounds_dir, f"line_{event_id:03d}_{self._get_text_hash(text)}.mp3")
+        if not os.path.exists(legacy):
+            return False
+        try:
+            self._voice_store.import_file(key, legacy)
+        except OSError:
+            return False
+        if self._debug_mode:
+            print(f"📦 迁移旧配音: {os.path.basename(legacy)}")
+        return True
+    
+    def presynthesize_voices(self, texts: list, max_concurrency: int = None) -> list:
+        """
+        预合成配音：并发生成后续 speak / 时间轴事件将用到的全部配音
+        
+        按 self._voice_count 起的行号登记场景清单，相同内容只合成一次，
+        已在共享存储中的句子（包括其他场景的）不会重新合成。
+        空文本不占用行号（与 run_timeline / speak 的计数方式一致）。
+        
+        Args:
+            texts: 文本列表（按播放顺序）
+            max_concurrency: 最大并发数（默认 TTS_MAX_CONCURRENCY）
+            
+        Returns:
+            配音文件路径列表（与非空文本一一对应，失败为 None）
+        """
+        if not self._enable_voice or self._voice_store is None or (self._dry_run and not self._dry_run_voices):
+            return []
+        
+        store = self._voice_store
+        keys = []
+        missing = {}
+        changed = False
+        event_id = self._voice_count
+        for text in texts:
+            if not text:
+                continue
+            key = self._get_voice_key(text)
+            keys.append(key)
+            changed |= self._record_voice(event_id, text, key)
+            if not store.has(key) and key not in missing and not self._adopt_legacy_voice(text, event_id, key):
+                missing[key] = {"text": text, "path": store.prepare(key)}
+            event_id += 1
+        
+        if changed:
+            store.save_manifest(self.__class__.__name__, self._voice_manifest)
+        
+        if missing:
+            TTSGenerator = self._import_tts_generator()
+            if TTSGenerator is not None:
+                concurrency = max_concurrency or self.TTS_MAX_CONCURRENCY
+                if self._debug_mode:
+                    print(f"🎤 预合成配音: {len(missing)}/{len(keys)} 条 (并发 {concurrency})")
+                try:
+                    tts = TTSGenerator(voice=self._voice, rate=self._voice_rate,
+                                       pitch=self._voice_pitch, backend=self._tts_backend)
+                    asyncio.run(tts.generate_batch(
+                        list(missing.values()), store.store_dir,
+                        max_concurrency=concurrency,
+                        raise_on_error=False
+                    ))
+                except Exception as e:
+                    print(f"❌ 配音预合成失败: {e}")
+        
+        for key in keys:
+            store.touch(key)
+        if missing:
+            store.evict()
+        
+        return [store.blob_path(key) if store.has(key) else None for key in keys]
+    
+    def _voice_for(self, text: str) -> tuple:
+        """
+        取一句配音的 (路径, 时长)，并占用一个行号
+        
+        试运行时不合成：已缓存的配音读取真实时长，否则按字数估算（路径为 None）。
+        生成失败时返回 (None, 0)。
+        """
+        event_id = self._voice_count
+        self._voice_count += 1
+        if self._dry_run and not self._dry_run_voices:
+            store = self._voice_store
+            if store is not None:
+                key = self._get_voice_key(text)
+                if store.has(key):
+                    path = store.blob_path(key)
+                    return path, self._get_audio_duration(path)
+            return None, self._estimate_voice_duration(text)
+        
+        voice_path = self._generate_voice(text, event_id)
+        if voice_path and os.path.exists(voice_path):
+            return voice_path, self._get_audio_duration(voice_path)
+        return None, 0.0
+    
+    def _estimate_voice_duration(self, text: str) -> float:
+        """按有效字数与语速（如 "+20%"）估算配音时长"""
+        n_chars = sum(1 for c in text if c.isalnum())
+        try:
+            speed = 1 + int(self._voice_rate.rstrip("%")) / 100
+        except ValueError:
+            speed = 1.0
+        return n_chars / (self.DRY_RUN_CHARS_PER_SECOND * max(speed, 0.1))
+    
     def _generate_voice(self, text: str, event_id: int) -> str:
         """
         生成配音文件
         
-        使用文本哈希确保缓存有效性：
-        - 文件名格式: line_001_a3f8c1.mp3
-        - 文本变化时哈希变化，自动生成新文件
+        音频按 (text, voice, rate, pitch) 内容寻址存入共享存储，
+        场景清单记录 行号 -> blob：行号变化、场景改名或跨场景复用都直接命中缓存。
         
         Args:
             text: 配音文本
-            event_id: 事件 ID（用于文件命名）
+            event_id: 事件 ID（场景清单中的行号）
             
         Returns:
             生成的音频文件路径
         """
-        try:
-            # 动态导入 TTSGenerator
-            from utils.tts_generator import TTSGenerator
-        except ImportError:
-            try:
-                # 尝试从父目录导入 (auto_manim/utils/)
-                import sys
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                parent_dir = os.path.dirname(script_dir)  # auto_manim 目录
-                if parent_dir not in sys.path:
-                    sys.path.insert(0, parent_dir)
-                from utils.tts_generator import TTSGenerator
-            except ImportError as e:
-                print(f"⚠️ 无法导入 TTSGenerator，跳过配音生成: {e}")
-                return None
-        
-        # 使用文本哈希确保缓存有效性
-        text_hash = self._get_text_hash(text)
-        output = os.path.join(self._sounds_dir, f"line_{event_id:03d}_{text_hash}.mp3")
-        
-        # 如果相同哈希的文件已存在，可以安全复用
-        if os.path.exists(output):
+        store = self._voice_store
+        if store is None:
+            return None
+        
+        key = self._get_voice_key(text)
+        if self._record_voice(event_id, text, key):
+            store.save_manifest(self.__class__.__name__, self._voice_manifest)
+        output = store.prepare(key)
+        
+        # 相同内容的 blob 已存在（含预合成结果），直接复用
+        if store.has(key) or self._adopt_legacy_voice(text, event_id, key):
+            store.touch(key)
             if self._debug_mode:
                 print(f"♻️ 复用配音: {output}")
             return output
         
-        # 清理同索引的旧文件（不同哈希的旧版本）
-        import glob
-        old_files = glob.glob(os.path.join(self._sounds_dir, f"line_{event_id:03d}_*.mp3"))
-        for old_file in old_files:
-            if old_file != output:
-                try:
-                    os.remove(old_file)
-                    if self._debug_mode:
-                        print(f"🗑️ 删除旧配音: {os.path.basename(old_file)}")
-                except OSError as e:
-                    if self._debug_mode:
-                        print(f"⚠️ 无法删除旧文件 {os.path.basename(old_file)}: {e}")
+        TTSGenerator = self._import_tts_generator()
+        if TTSGenerator is None:
+            return None
         
         try:
-            tts = TTSGenerator(voice=self._voice)
+            tts = TTSGenerator(voice=self._voice, rate=self._voice_rate,
+                               pitch=self._voice_pitch, backend=self._tts_backend)
             asyncio.run(tts.generate(text, output))
+            store.touch(key)
+            store.evict()
             if self._debug_mode:
                 print(f"🎤 生成配音: {output}")
             return output
         except Exception as e:
+            # generate 先写临时文件再原子替换，失败不会留下不完整的 blob
             print(f"❌ 配音生成失败: {e}")
             return None
     
+    def _get_duration_index(self):
+        """时长旁路索引（assets/sounds/voice/_durations.json，按内容哈希）"""
+        if self._duration_index is None and _ensure_utils_importable("audio_probe"):
+            from utils.audio_probe import DurationIndex
+            self._duration_index = DurationIndex(
+                os.path.join(os.path.dirname(self._sounds_dir), "_durations.json")
+            )
+        return self._duration_index
+    
     def _get_audio_duration(self, audio_path: str) -> float:
         """
         获取音频文件时长
@@ -2056,10 +2653,19 @@ class AutoScene(InteractiveScene):
         Returns:
             音频时长（秒），如果无法获取返回 0
         """
-        # 方法1: 使用 pydub (推荐)
+        # 方法1: 帧头解析 + 时长索引（纯 Python，不解码）
+        index = self._get_duration_index()
+        if index is not None:
+            duration = index.get_seconds(audio_path)
+            if duration is not None:
+                if self._debug_mode:
+                    print(f"   📊 帧头解析时长: {duration:.3f}s")
+                return duration
+        
+        # 方法2: 使用 pydub 解码
         try:
             from pydub import AudioSegment
-            audio = AudioSegment.from_mp3(audio_path)
+            audio = AudioSegment.from_file(audio_path)
             duration = len(audio) / 1000.0  # 毫秒转秒
             if self._debug_mode:
                 print(f"   📊 pydub 获取时长: {duration:.2f}s")
@@ -2070,7 +2676,7 @@ class AutoScene(InteractiveScene):
             if self._debug_mode:
                 print(f"   ⚠️ pydub 解析失败: {e}")
         
-        # 方法2: 使用文件大小估算 (edge-tts 约 48kbps = 6KB/s)
+        # 方法3: 使用文件大小估算 (edge-tts 约 48kbps = 6KB/s)
         try:
             file_size = os.path.getsize(audio_path)
             estimated_duration = file_size / 6000.0
@@ -2186,6 +2792,80 @@ class AutoScene(InteractiveScene):
         """
         return self._markers.copy()
     
+    def _log_event(self, kind: str, start: float, end: float, label: str = "") -> None:
+        self._timeline_events.append({"type": kind, "start": start, "end": end, "label": label})
+    
+    def get_timeline_events(self) -> list:
+        """
+        获取事件时间线（场景时间，即成片中的时间）
+        
+        Returns:
+            [{"type": "play"/"wait"/"speak"/"subtitle"/"sound", "start", "end", "label"}, ...]
+        """
+        return [dict(event) for event in self._timeline_events]
+    
+    def get_subtitle_events(self) -> list:
+        """speak / subtitle 显示过的字幕，格式与 export_srt 的 events 一致"""
+        return [
+            {"start": e["start"], "end": e["end"], "text": e["label"]}
+            for e in self._timeline_events if e["type"] in ("speak", "subtitle")
+        ]
+    
+    def get_timeline_report(self) -> dict:
+        """
+        时间轴报告
+        
+        Returns:
+            {"duration": 预计成片时长（秒）, "current_time", "events", "markers", "subtitles", "sections"}
+        """
+        return {
+            "duration": self.get_time(),
+            "current_time": self._current_time,
+            "events": self.get_timeline_events(),
+            "markers": self.get_markers(),
+            "subtitles": self.get_subtitle_events(),
+            "sections": self.get_sections(),
+        }
+    
+    def _finish_dry_run(self, output_dir: str = None) -> dict:
+        """打印试运行摘要，并把时间线 JSON 与 SRT 写入 assets/dry_run/（或 AUTOSCENE_DRY_RUN_DIR）"""
+        import json
+        report = self.get_timeline_report()
+        output_dir = output_dir or os.environ.get("AUTOSCENE_DRY_RUN_DIR")
+        if output_dir is None:
+            parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            output_dir = os.path.join(parent_dir, "assets", "dry_run")
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.join(output_dir, self.__class__.__name__)
+        with open(stem + ".timeline.json", "w", encoding="utf-8") as f:
+            # 场景时间可能是 numpy 标量（play 的 run_time 等），按浮点数写出
+            json.dump(report, f, ensure_ascii=False, indent=2, default=float)
+        self.export_srt(report["subtitles"], stem + ".srt")
+        
+        counts = {}
+        for event in report["events"]:
+            counts[event["type"]] = counts.get(event["type"], 0) + 1
+        print(f"🧪 试运行: 预计时长 {report['duration']:.2f}s "
+              f"({', '.join(f'{k} {v}' for k, v in counts.items())})")
+        for marker in report["markers"]:
+            print(f"   📍 {marker['label']} @ {marker['time']:.2f}s")
+        print(f"📄 时间线导出: {stem}.timeline.json")
+        self._dry_run_report = report
+        return report
+    
+    @classmethod
+    def dry_run(cls, **scene_kwargs) -> dict:
+        """
+        试运行场景：不渲染画面、不合成配音，返回 get_timeline_report()
+        
+        示例:
+            report = MyScene.dry_run()
+            print(report["duration"])
+        """
+        scene = cls(dry_run=True, **scene_kwargs)
+        scene.run()
+        return getattr(scene, "_dry_run_report", None) or scene.get_timeline_report()
+    
     # ==================== 文本高亮方法 ====================
     
     def _add_highlight_animation(self, target, effect, color, run_time=1.0):
@@ -4432,6 +5112,7 @@ class AutoScene(InteractiveScene):
         # 尝试使用 GlowWrapperEffect
         try:
             from mobject.glow_wrapper import GlowWrapperEffect
+            from mobject.glyph_sample_cache import get_glyph_sample_cache
         except ImportError:
             # 如果导入失败，返回普通文字
             if self._debug_mode:
@@ -4467,6 +5148,7 @@ class AutoScene(InteractiveScene):
             curve_sample_factor=30,
             min_curve_samples=150,
             core_width_ratio=0.15,
+            sample_cache=get_glyph_sample_cache(),  # 逐字形复用轮廓采样（跨渲染持久化）
         )
         
         # 关闭深度测试避免棱刺
@@ -4531,6 +5213,7 @@ class AutoScene(InteractiveScene):
             if shaderscene_path not in sys.path:
                 sys.path.insert(0, shaderscene_path)
             from mobject.glow_wrapper import GlowWrapperEffect
+            from mobject.glyph_sample_cache import get_glyph_sample_cache
         except ImportError:
             from manimlib import Tex
             return Tex(tex_string, font_size=font_size, color=color or WHITE)
@@ -4560,6 +5243,7 @@ class AutoScene(InteractiveScene):
             render_mode="point",
             curve_sample_factor=30,
             min_curve_samples=150,
+            sample_cache=get_glyph_sample_cache(),
         )
         glow.deactivate_depth_test()
         
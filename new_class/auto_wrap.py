@@ -2,10 +2,12 @@
 自动换行工具模块 - 用于 ManimGL 的 Tex/Text 自动换行
 
 核心功能：
-1. 基于 .get_width() 的贪心断行算法
+1. 基于宽度测量的贪心断行算法
 2. 支持中英文混排
 3. 支持 Tex 和 Text 两种模式
 4. 包含调试信息输出
+5. Text 模式默认使用字体度量（font_metrics）测宽：读取字体一次、前缀和 O(1)，
+   仅用一次 Pango 测量校准；字体不可用时回退到逐行构建 Text 测宽
 
 使用方法：
     from auto_wrap import AutoWrap, wrap_text_to_width, wrap_tex_to_width
@@ -17,12 +19,25 @@
     wrapper = AutoWrap(max_width_ratio=0.95, debug=True)
     mob = wrapper.create_wrapped_text("很长的文本...")
 
+基准（1000 字中英混排段落，字体度量 vs Pango）:
+    python auto_wrap.py --benchmark
+
 作者：AutoScene 工具集
 """
 
 import re
+import sys
+import time
 from typing import List, Tuple, Dict, Any, Union, Optional
 
+try:
+    from .font_metrics import get_font_metrics
+except ImportError:
+    try:
+        from font_metrics import get_font_metrics
+    except ImportError:
+        get_font_metrics = None
+
 
 class AutoWrap:
     """
@@ -42,6 +57,8 @@ class AutoWrap:
         line_buff: float = 0.15,
         font_size: int = 24,
         font: str = "STKaiti",
+        width_backend: str = "metrics",
+        verify_metrics: bool = False,
     ):
         """
         初始化自动换行工具
@@ -54,13 +71,20 @@ class AutoWrap:
             line_buff: 行间距
             font_size: 字体大小
             font: 字体名称
+            width_backend: Text 模式的测宽方式。"metrics" 读取字体度量（前缀和 O(1)），
+                不可用时自动回退；"pango" 每次试探构建 Text
+            verify_metrics: 字体度量断行后再用 Pango 测量每一行，记录最大相对误差
         """
+        if width_backend not in ("metrics", "pango"):
+            raise ValueError(f"width_backend must be 'metrics' or 'pango', got '{width_backend}'")
         self.max_width_ratio = max_width_ratio
         self.frame_width = frame_width
         self.debug = debug
         self.line_buff = line_buff
         self.font_size = font_size
         self.font = font
+        self.width_backend = width_backend
+        self.verify_metrics = verify_metrics
         
         # 计算最大宽度
         if max_width_absolute is not None:
@@ -70,6 +94,8 @@ class AutoWrap:
         
         # 缓存：避免重复编译相同文本
         self._width_cache: Dict[str, float] = {}
+        # 字体度量缩放（字体单位 -> Manim 单位），按 (字体, 字号) 用 Pango 校准一次
+        self._metric_scales: Dict[Tuple[str, float], Optional[float]] = {}
         
         # 统计信息
         self._stats = {
@@ -77,6 +103,8 @@ class AutoWrap:
             "line_count": 0,
             "tex_compilations": 0,
             "cache_hits": 0,
+            "metric_wraps": 0,
+            "metric_max_error": 0.0,
         }
     
     def _log(self, msg: str):
@@ -206,8 +234,121 @@ class AutoWrap:
             self._log(f"测量 Tex 宽度失败: {e}")
             return len(tex_string) * 0.12
     
+    # ==================== 字体度量测宽 ====================
+    
+    def _get_metric_scale(self, metrics, font: str, font_size: float) -> Optional[float]:
+        """
+        字体单位 -> Manim 单位的比例
+        
+        用一段字体覆盖的校准文本做一次 Pango 测量；失败时返回 None（回退 Pango 断行）
+        """
+        key = (font, font_size)
+        if key in self._metric_scales:
+            return self._metric_scales[key]
+        
+        sample = "".join(ch for ch in "HAMBURGEFONSTIV hamburgefonstiv 汉字宽度校准" if metrics.covers(ch))
+        sample = sample.strip()
+        scale = None
+        if sample:
+            try:
+                from manimlib import Text
+                pango_width = Text(sample, font=font, font_size=font_size).get_width()
+                self._stats["tex_compilations"] += 1
+                metric_width = metrics.text_width(sample)
+                if pango_width > 0 and metric_width > 0:
+                    scale = pango_width / metric_width
+            except Exception as e:
+                self._log(f"字体度量校准失败: {e}")
+        self._metric_scales[key] = scale
+        return scale
+    
+    def _wrap_tokens_metrics(self, tokens: List[str], **kwargs) -> Optional[List[str]]:
+        """
+        字体度量断行：整段只排版一次，每次试探宽度是一次前缀和相减
+        
+        字体度量不可用（无 fontTools、找不到字体、字形未覆盖、校准失败）时返回 None
+        """
+        if get_font_metrics is None:
+            return None
+        font = kwargs.get("font", self.font)
+        font_size = kwargs.get("font_size", self.font_size)
+        metrics = get_font_metrics(font)
+        if metrics is None:
+            return None
+        
+        full, spans = self._join_tokens_with_spans(tokens)
+        if not metrics.covers(full):
+            self._log("字体未覆盖全部字符，回退 Pango 测宽")
+            return None
+        scale = self._get_metric_scale(metrics, font, font_size)
+        if scale is None:
+            return None
+        
+        layout = metrics.layout(full)
+        lines = []
+        line_start = None
+        line_end = None
+        for i, (start, end) in enumerate(spans):
+            if line_start is None:
+                line_start, line_end = start, end
+                continue
+            trial_width = layout.span_width(line_start, end) * scale
+            
+            if self.debug and i % 10 == 0:
+                self._log(f"  Token {i}: '{tokens[i]}' | "
+                         f"试探宽度: {trial_width:.3f} / {self.max_width:.3f}")
+            
+            if trial_width <= self.max_width:
+                line_end = end
+            else:
+                lines.append(full[line_start:line_end])
+                line_width = layout.span_width(line_start, line_end) * scale
+                self._log(f"  断行 #{len(lines)}: '{lines[-1][:20]}...' | "
+                         f"宽度: {line_width:.3f} ({line_width / self.max_width * 100:.1f}%)")
+                line_start, line_end = start, end
+        if line_start is not None:
+            lines.append(full[line_start:line_end])
+        
+        self._stats["metric_wraps"] += 1
+        if self.verify_metrics:
+            self._verify_metric_lines(lines, layout, full, spans, scale, **kwargs)
+        return lines
+    
+    def _verify_metric_lines(self, lines, layout, full, spans, scale, **kwargs):
+        """用 Pango 逐行测量，记录字体度量的最大相对误差"""
+        max_error = 0.0
+        offset = 0
+        for line in lines:
+            start = full.index(line, offset)
+            offset = start + len(line)
+            metric_width = layout.span_width(start, offset) * scale
+            pango_width = self._measure_width_text(line, **kwargs)
+            if pango_width > 0:
+                max_error = max(max_error, abs(metric_width - pango_width) / pango_width)
+        self._stats["metric_max_error"] = max(self._stats["metric_max_error"], max_error)
+        self._log(f"字体度量校验: 最大相对误差 {max_error * 100:.2f}%")
+    
     # ==================== Token 合并 ====================
     
+    @staticmethod
+    def _needs_space(prev: str, curr: str) -> bool:
+        """只有前后都是英文/数字时才加空格"""
+        return bool(re.match(r'^[A-Za-z0-9]+$', prev)) and bool(re.match(r'^[A-Za-z0-9]+$', curr))
+    
+    def _join_tokens_with_spans(self, tokens: List[str]) -> Tuple[str, List[Tuple[int, int]]]:
+        """合并 token，同时返回每个 token 在结果中的 [start, end) 区间"""
+        parts = []
+        spans = []
+        length = 0
+        for i, token in enumerate(tokens):
+            if i and self._needs_space(tokens[i - 1], token):
+                parts.append(" ")
+                length += 1
+            parts.append(token)
+            spans.append((length, length + len(token)))
+            length += len(token)
+        return "".join(parts), spans
+    
     def _join_tokens(self, tokens: List[str]) -> str:
         """
         将 token 列表合并为字符串
@@ -217,26 +358,7 @@ class AutoWrap:
         - 英文单词之间加空格
         - 中英文交界处不加空格
         """
-        if not tokens:
-            return ""
-        
-        result = tokens[0]
-        
-        for i in range(1, len(tokens)):
-            prev = tokens[i - 1]
-            curr = tokens[i]
-            
-            # 判断是否需要空格
-            prev_is_alnum = bool(re.match(r'^[A-Za-z0-9]+$', prev))
-            curr_is_alnum = bool(re.match(r'^[A-Za-z0-9]+$', curr))
-            
-            # 只有前后都是英文/数字时才加空格
-            if prev_is_alnum and curr_is_alnum:
-                result += " " + curr
-            else:
-                result += curr
-        
-        return result
+        return self._join_tokens_with_spans(tokens)[0]
     
     # ==================== 贪心断行算法 ====================
     
@@ -265,6 +387,13 @@ class AutoWrap:
         if not tokens:
             return []
         
+        if mode == "text" and self.width_backend == "metrics":
+            lines = self._wrap_tokens_metrics(tokens, **kwargs)
+            if lines is not None:
+                self._stats["line_count"] = len(lines)
+                self._log(f"断行完成（字体度量）: {len(lines)} 行")
+                return lines
+        
         measure_func = (
             self._measure_width_text if mode == "text" 
             else self._measure_width_tex
@@ -418,6 +547,10 @@ class AutoWrap:
             print(f"  编译次数: {self._stats['tex_compilations']}")
             print(f"  缓存命中: {self._stats['cache_hits']}")
             print(f"  缓存命中率: {self._stats['cache_hits'] / max(1, self._stats['tex_compilations'] + self._stats['cache_hits']) * 100:.1f}%")
+            if self._stats["metric_wraps"]:
+                print(f"  字体度量断行: {self._stats['metric_wraps']} 次")
+            if self.verify_metrics:
+                print(f"  字体度量最大误差: {self._stats['metric_max_error'] * 100:.2f}%")
 
 
 # ==================== 便捷函数 ====================
@@ -449,7 +582,7 @@ def wrap_text_to_width(
         max_width_absolute=max_width,
         frame_width=frame_width,
         debug=debug,
-        **{k: v for k, v in kwargs.items() if k in ["font_size", "font", "line_buff"]}
+        **{k: v for k, v in kwargs.items() if k in ["font_size", "font", "line_buff", "width_backend", "verify_metrics"]}
     )
     
     tokens = wrapper.tokenize(text)
@@ -490,9 +623,73 @@ def wrap_tex_to_width(
     return wrapper.wrap_tokens(tokens, mode="tex", **kwargs)
 
 
+# ==================== 基准 ====================
+
+BENCHMARK_SAMPLE = (
+    "在ManimGL中，Text对象由Pango排版后再解析SVG，每次构建都要几十毫秒。"
+    "Greedy line breaking measures every trial line, so the cost grows quickly with paragraph length. "
+    "字体度量后端只读取一次字体文件的advance width与kerning，之后每次试探都是O(1)的前缀和相减。"
+    "We compare both backends on long mixed paragraphs, 包括标点、数字123和English words。"
+)
+
+
+def make_benchmark_paragraph(n_chars: int = 1000) -> str:
+    """重复示例文本，截取 n_chars 个字符的中英混排段落"""
+    repeats = n_chars // len(BENCHMARK_SAMPLE) + 1
+    return (BENCHMARK_SAMPLE * repeats)[:n_chars]
+
+
+def benchmark_wrap_backends(
+    n_chars: int = 1000,
+    n_paragraphs: int = 3,
+    frame_width: float = 6.75,
+    font_size: int = 24,
+    font: str = "STKaiti",
+) -> Dict[str, Dict[str, float]]:
+    """
+    对比字体度量与 Pango 两种测宽后端的断行耗时
+    
+    Returns:
+        {backend: {"seconds", "lines", "text_builds"}}，以及 metrics 的 "max_error"
+        （字体度量逐行宽度相对 Pango 的最大误差）
+    """
+    paragraphs = [make_benchmark_paragraph(n_chars + 37 * i) for i in range(n_paragraphs)]
+    report = {}
+    for backend in ("metrics", "pango"):
+        wrapper = AutoWrap(
+            frame_width=frame_width, font_size=font_size, font=font,
+            width_backend=backend, verify_metrics=False,
+        )
+        t0 = time.perf_counter()
+        n_lines = sum(len(wrapper.wrap_tokens(wrapper.tokenize(p), mode="text")) for p in paragraphs)
+        report[backend] = {
+            "seconds": time.perf_counter() - t0,
+            "lines": n_lines,
+            "text_builds": wrapper._stats["tex_compilations"],
+            "metric_wraps": wrapper._stats["metric_wraps"],
+        }
+    
+    checker = AutoWrap(frame_width=frame_width, font_size=font_size, font=font, verify_metrics=True)
+    for p in paragraphs:
+        checker.wrap_tokens(checker.tokenize(p), mode="text")
+    report["metrics"]["max_error"] = checker._stats["metric_max_error"]
+    return report
+
+
 # ==================== 测试代码 ====================
 
-if __name__ == "__main__":
+if __name__ == "__main__" and "--benchmark" in sys.argv:
+    result = benchmark_wrap_backends()
+    for backend, stats in result.items():
+        print(f"{backend:>8}: {stats['seconds']:.2f}s  {stats['lines']} 行  "
+              f"Text 构建 {stats['text_builds']} 次")
+    if not result["metrics"]["metric_wraps"]:
+        print("⚠️ 字体度量不可用（需要 fontTools 与对应字体文件），metrics 实际回退到了 Pango")
+    else:
+        print(f"⚡ 加速 {result['pango']['seconds'] / max(result['metrics']['seconds'], 1e-9):.1f}x  "
+              f"字体度量最大误差 {result['metrics']['max_error'] * 100:.2f}%")
+
+elif __name__ == "__main__":
     print("=" * 60)
     print("AutoWrap 自动换行测试")
     print("=" * 60)
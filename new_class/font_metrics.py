@@ -0,0 +1,333 @@
+"""
+字体度量宽度模型 - AutoWrap 的快速宽度测量后端
+
+AutoWrap 原先每次试探都构建一个 manimlib.Text（Pango 排版 + SVG 解析）来读宽度，
+断行是 O(n²) 次 mobject 构建。这里直接读取字体文件一次：
+
+- hmtx 步进宽度、字形墨迹左右边界（BoundsPen）
+- GPOS 成对调整（PairPos format 1/2），没有 GPOS 字距时使用 kern 表（format 0）
+- 整段文本的步进前缀和，任意子串 [a, b) 的墨迹宽度都是 O(1)
+
+字体单位到 Manim 单位的比例用一次 Pango（Text）测量校准，
+Pango 测量仍作为校验与回退路径（字体缺失、字形未覆盖、fontTools 不可用时）。
+
+依赖 fontTools（可选）；找不到字体文件时返回 None，由调用方回退到 Pango。
+
+使用方法:
+    from font_metrics import get_font_metrics
+
+    metrics = get_font_metrics("STKaiti")
+    if metrics is not None and metrics.covers(text):
+        layout = metrics.layout(text)
+        width = layout.span_width(0, len(text))  # 字体单位
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from fontTools.ttLib import TTFont, TTCollection
+    from fontTools.pens.boundsPen import BoundsPen
+    _FONTTOOLS_AVAILABLE = True
+except ImportError:
+    _FONTTOOLS_AVAILABLE = False
+
+
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc", ".otc")
+
+
+def _font_dirs() -> List[str]:
+    """各平台的系统与用户字体目录"""
+    home = os.path.expanduser("~")
+    if sys.platform == "darwin":
+        return [
+            "/System/Library/Fonts",
+            "/System/Library/Fonts/Supplemental",
+            "/Library/Fonts",
+            os.path.join(home, "Library", "Fonts"),
+        ]
+    if sys.platform.startswith("win"):
+        windir = os.environ.get("WINDIR", r"C:\Windows")
+        return [
+            os.path.join(windir, "Fonts"),
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"),
+        ]
+    return [
+        "/usr/share/fonts",
+        "/usr/local/share/fonts",
+        os.path.join(home, ".fonts"),
+        os.path.join(home, ".local", "share", "fonts"),
+    ]
+
+
+# ==================== 字体查找 ====================
+
+_font_index: Optional[Dict[str, Tuple[str, int]]] = None
+
+
+def _build_font_index() -> Dict[str, Tuple[str, int]]:
+    """扫描字体目录，建立 {小写族名/全名: (路径, 集合内序号)}（含本地化名称，如"华文楷体"）"""
+    index = {}
+    for font_dir in _font_dirs():
+        if not os.path.isdir(font_dir):
+            continue
+        for root, _, files in os.walk(font_dir):
+            for name in sorted(files):
+                if not name.lower().endswith(FONT_EXTENSIONS):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    if name.lower().endswith((".ttc", ".otc")):
+                        fonts = TTCollection(path, lazy=True).fonts
+                    else:
+                        fonts = [TTFont(path, lazy=True)]
+                except Exception:
+                    continue
+                for number, font in enumerate(fonts):
+                    try:
+                        records = font["name"].names
+                    except Exception:
+                        continue
+                    for record in records:
+                        if record.nameID not in (1, 4, 16):
+                            continue
+                        try:
+                            family = record.toUnicode().strip().lower()
+                        except Exception:
+                            continue
+                        if family:
+                            index.setdefault(family, (path, number))
+    return index
+
+
+def _fc_match(family: str) -> Optional[Tuple[str, int]]:
+    """通过 fontconfig（Pango 在 Linux 上的字体后端）解析字体族"""
+    try:
+        result = subprocess.run(
+            ["fc-match", "--format=%{file}\n%{index}", family],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines or not os.path.isfile(lines[0]):
+        return None
+    number = int(lines[1]) if len(lines) > 1 and lines[1].isdigit() else 0
+    return lines[0], number
+
+
+def find_font_file(family: str) -> Optional[Tuple[str, int]]:
+    """
+    查找字体族对应的字体文件
+
+    Returns:
+        (路径, 集合内序号)，找不到返回 None
+    """
+    global _font_index
+    if not _FONTTOOLS_AVAILABLE:
+        return None
+    if os.path.isfile(family):
+        return family, 0
+    if _font_index is None:
+        _font_index = _build_font_index()
+    found = _font_index.get(family.strip().lower())
+    if found is not None:
+        return found
+    return _fc_match(family)
+
+
+# ==================== 字距 ====================
+
+class _PairAdjustments:
+    """GPOS PairPos 查找（每个 lookup 内取第一个匹配的子表，各 lookup 累加）"""
+
+    def __init__(self, font):
+        self.lookups = []
+        if "GPOS" not in font:
+            return
+        gpos = font["GPOS"].table
+        if gpos.LookupList is None:
+            return
+        for lookup in gpos.LookupList.Lookup:
+            subtables = []
+            for subtable in lookup.SubTable:
+                lookup_type = lookup.LookupType
+                if lookup_type == 9:
+                    lookup_type = subtable.ExtensionLookupType
+                    subtable = subtable.ExtSubTable
+                if lookup_type != 2:
+                    continue
+                parsed = self._parse_subtable(subtable)
+                if parsed is not None:
+                    subtables.append(parsed)
+            if subtables:
+                self.lookups.append(subtables)
+
+    @staticmethod
+    def _x_advance(value) -> int:
+        return int(getattr(value, "XAdvance", 0) or 0) if value is not None else 0
+
+    def _parse_subtable(self, subtable):
+        coverage = subtable.Coverage.glyphs
+        if subtable.Format == 1:
+            pairs = {}
+            for first, pair_set in zip(coverage, subtable.PairSet):
+                for record in pair_set.PairValueRecord:
+                    pairs[(first, record.SecondGlyph)] = self._x_advance(record.Value1)
+            return ("pairs", set(coverage), pairs)
+        if subtable.Format == 2:
+            matrix = [
+                [self._x_advance(record.Value1) for record in class1.Class2Record]
+                for class1 in subtable.Class1Record
+            ]
+            return (
+                "classes", set(coverage),
+                subtable.ClassDef1.classDefs if subtable.ClassDef1 else {},
+                subtable.ClassDef2.classDefs if subtable.ClassDef2 else {},
+                matrix,
+            )
+        return None
+
+    def value(self, left: str, right: str) -> int:
+        total = 0
+        for subtables in self.lookups:
+            for subtable in subtables:
+                if left not in subtable[1]:
+                    continue
+                if subtable[0] == "pairs":
+                    adjust = subtable[2].get((left, right))
+                    if adjust is None:
+                        continue
+                    total += adjust
+                else:
+                    _, _, class1, class2, matrix = subtable
+                    total += matrix[class1.get(left, 0)][class2.get(right, 0)]
+                break
+        return total
+
+
+# ==================== 度量 ====================
+
+class TextLayout:
+    """
+    一段文本的步进前缀和
+
+    origins[j] 为第 j 个字符的原点（相对第 0 个字符），包含其前所有字距；
+    子串 [a, b) 的墨迹宽度 = (origins[b-1] + ink_right[b-1]) - (origins[a] + ink_left[a])。
+    """
+
+    def __init__(self, origins: np.ndarray, ink_left: np.ndarray, ink_right: np.ndarray):
+        self.origins = origins
+        self.ink_left = ink_left
+        self.ink_right = ink_right
+
+    def span_width(self, start: int, stop: int) -> float:
+        """子串 [start, stop) 的墨迹宽度（字体单位），O(1)"""
+        if stop <= start:
+            return 0.0
+        last = stop - 1
+        return float(
+            self.origins[last] + self.ink_right[last]
+            - self.origins[start] - self.ink_left[start]
+        )
+
+
+class FontMetrics:
+    """
+    单个字体文件的度量
+
+    - 步进宽度：hmtx
+    - 墨迹边界：字形轮廓 BoundsPen（按需计算并缓存；空白字形取 [0, 步进]）
+    - 字距：GPOS PairPos，没有时使用 kern 表（按需计算并缓存）
+    """
+
+    def __init__(self, path: str, font_number: int = 0):
+        self.path = path
+        font = TTFont(path, fontNumber=font_number, lazy=True)
+        self.units_per_em = font["head"].unitsPerEm
+        self._cmap = font.getBestCmap() or {}
+        self._hmtx = font["hmtx"].metrics
+        self._glyph_set = font.getGlyphSet()
+
+        # 与 HarfBuzz 一致：有 GPOS 字距时忽略旧式 kern 表
+        self._gpos = _PairAdjustments(font)
+        self._kern_pairs = {}
+        if not self._gpos.lookups and "kern" in font:
+            for table in font["kern"].kernTables:
+                if getattr(table, "format", None) == 0:
+                    self._kern_pairs.update(table.kernTable)
+
+        self._char_cache: Dict[str, Tuple[int, float, float]] = {}
+        self._kern_cache: Dict[Tuple[str, str], int] = {}
+
+    def covers(self, text: str) -> bool:
+        """字体是否包含 text 的全部字符（否则 Pango 会使用回退字体，度量不可信）"""
+        return all(ord(ch) in self._cmap for ch in set(text))
+
+    def _char_metrics(self, ch: str) -> Tuple[int, float, float]:
+        """(步进, 墨迹左边界, 墨迹右边界)，字体单位"""
+        cached = self._char_cache.get(ch)
+        if cached is not None:
+            return cached
+        glyph = self._cmap[ord(ch)]
+        advance = self._hmtx[glyph][0]
+        pen = BoundsPen(self._glyph_set)
+        self._glyph_set[glyph].draw(pen)
+        if pen.bounds is None:
+            metrics = (advance, 0.0, float(advance))
+        else:
+            metrics = (advance, float(pen.bounds[0]), float(pen.bounds[2]))
+        self._char_cache[ch] = metrics
+        return metrics
+
+    def kerning(self, left: str, right: str) -> int:
+        key = (left, right)
+        cached = self._kern_cache.get(key)
+        if cached is None:
+            left_glyph = self._cmap[ord(left)]
+            right_glyph = self._cmap[ord(right)]
+            cached = self._kern_pairs.get((left_glyph, right_glyph), 0) + self._gpos.value(left_glyph, right_glyph)
+            self._kern_cache[key] = cached
+        return cached
+
+    def layout(self, text: str) -> TextLayout:
+        """计算 text 的前缀和（每个字符一次字典查询）"""
+        n = len(text)
+        advances = np.empty(n)
+        ink_left = np.empty(n)
+        ink_right = np.empty(n)
+        kerns = np.zeros(n)
+        for i, ch in enumerate(text):
+            advances[i], ink_left[i], ink_right[i] = self._char_metrics(ch)
+            if i:
+                kerns[i] = self.kerning(text[i - 1], ch)
+        origins = np.zeros(n)
+        if n > 1:
+            origins[1:] = np.cumsum(advances[:-1] + kerns[1:])
+        return TextLayout(origins, ink_left, ink_right)
+
+    def text_width(self, text: str) -> float:
+        """整段文本的墨迹宽度（字体单位）"""
+        return self.layout(text).span_width(0, len(text))
+
+
+_metrics_cache: Dict[str, Optional[FontMetrics]] = {}
+
+
+def get_font_metrics(family: str) -> Optional[FontMetrics]:
+    """按字体族获取（缓存的）FontMetrics；fontTools 不可用或找不到字体时返回 None"""
+    if family in _metrics_cache:
+        return _metrics_cache[family]
+    metrics = None
+    found = find_font_file(family)
+    if found is not None:
+        try:
+            metrics = FontMetrics(*found)
+        except Exception:
+            metrics = None
+    _metrics_cache[family] = metrics
+    return metrics
@@ -0,0 +1,230 @@
+"""
+AutoScene 分段并行渲染
+
+长视频按 section() 标记的阶段边界切段，每段在独立的 manimgl 进程中渲染：
+
+1. 预处理：AUTOSCENE_DRY_RUN=voices 试运行一次，合成缺失配音，得到各段的场景时间范围
+2. 渲染：每段一个进程（AUTOSCENE_SECTION=k），跳过之前各段的绘制（动画与 updater 仍逐帧推进），
+   只输出本段的分段视频；
+   声音事件（绝对场景时间）写入 section_XXX.audio.json，不进入分段视频
+3. 拼接：ffmpeg concat 分离器 -c copy，无重新编码
+4. 声音：合并各段事件，AudioTimeline 一次混音，封装进拼接结果
+
+各段帧数与整段渲染完全一致（每个 play 的帧数只取决于自身 run_time），
+声音按场景时间（即 _current_time 所跟踪的时间）放置，与整段渲染对齐方式相同。
+跳过的段不绘制、不写帧，但 updater 收到的 dt 序列与整段渲染相同（不同于 manimgl -n 的
+每个动画一步推进），依赖逐帧 dt 积分的 updater 在段首的状态与串行渲染一致。
+
+命令行:
+    python section_render.py xianyu/newton_cooling_demo.py NewtonCoolingDemo --workers 8
+    python section_render.py demo.py MyScene -o out.mp4 -- --hd
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+try:
+    from utils.audio_mixer import AudioTimeline
+except ImportError:
+    _parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # auto_manim 目录
+    if _parent_dir not in sys.path:
+        sys.path.insert(0, _parent_dir)
+    from utils.audio_mixer import AudioTimeline
+
+
+def _run(command: List[str], env: Dict[str, str], cwd: str, what: str) -> None:
+    result = subprocess.run(
+        command, cwd=cwd, env=dict(os.environ, **env),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        tail = result.stderr.decode("utf-8", "replace").strip().splitlines()[-20:]
+        raise RuntimeError(f"{what} 失败 (退出码 {result.returncode}):\n" + "\n".join(tail))
+
+
+def plan_sections(script: str, scene_name: str, work_dir: str, manimgl: str = "manimgl",
+                  extra_args: Sequence[str] = ()) -> dict:
+    """
+    试运行场景（合成缺失配音，不渲染画面），返回时间线报告
+
+    Returns:
+        AutoScene.get_timeline_report() 的内容（含 "sections"）
+    """
+    script = os.path.abspath(script)
+    # -w 避免打开预览窗口；试运行模式下 AutoScene 不写视频与末帧
+    _run(
+        [manimgl, script, scene_name, "-s", "-w", *extra_args],
+        {"AUTOSCENE_DRY_RUN": "voices", "AUTOSCENE_DRY_RUN_DIR": work_dir},
+        os.path.dirname(script), "试运行",
+    )
+    with open(os.path.join(work_dir, f"{scene_name}.timeline.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def render_section(script: str, scene_name: str, index: int, work_dir: str,
+                   manimgl: str = "manimgl", extra_args: Sequence[str] = ()) -> float:
+    """渲染第 index 段到 work_dir/section_XXX.mp4，返回耗时（秒）"""
+    script = os.path.abspath(script)
+    t0 = time.perf_counter()
+    _run(
+        [manimgl, script, scene_name, "-w", *extra_args],
+        {"AUTOSCENE_SECTION": str(index), "AUTOSCENE_SECTION_DIR": work_dir},
+        os.path.dirname(script), f"第 {index} 段渲染",
+    )
+    return time.perf_counter() - t0
+
+
+def concat_videos(paths: Sequence[str], output: str) -> None:
+    """ffmpeg concat 分离器无损拼接（各段编码参数相同）"""
+    list_path = output + ".txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", r"'\''")
+            f.write(f"file '{escaped}'\n")
+    try:
+        _run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_path, "-c", "copy", output],
+            {}, os.path.dirname(os.path.abspath(output)), "拼接",
+        )
+    finally:
+        os.remove(list_path)
+
+
+def load_section_audio(work_dir: str, indices: Sequence[int]) -> list:
+    """合并各段的声音事件 [(场景时间, 路径, 增益), ...]"""
+    events = []
+    for index in indices:
+        path = os.path.join(work_dir, f"section_{index:03d}.audio.json")
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            events.extend(tuple(event) for event in json.load(f)["events"])
+    return sorted(events)
+
+
+def mux_audio(video: str, events: list, output: str, sample_rate: int = 44100) -> None:
+    """把声音事件混成一条音轨并封装（参数与 ManimGL SceneFileWriter 相同）"""
+    timeline = AudioTimeline(sample_rate=sample_rate)
+    for t, path, gain in events:
+        timeline.add(t, path, gain)
+    wav_path = os.path.splitext(output)[0] + "_mix.wav"
+    if timeline.export_wav(wav_path) is None:
+        shutil.copyfile(video, output)
+        return
+    try:
+        _run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", video, "-i", wav_path,
+             "-c:v", "copy", "-c:a", "aac", "-b:a", "320k",
+             "-map", "0:v:0", "-map", "1:a:0", output],
+            {}, os.path.dirname(os.path.abspath(output)), "音频封装",
+        )
+    finally:
+        os.remove(wav_path)
+
+
+def render_in_sections(
+    script: str,
+    scene_name: str,
+    output: Optional[str] = None,
+    workers: Optional[int] = None,
+    manimgl: str = "manimgl",
+    extra_args: Sequence[str] = (),
+    sample_rate: int = 44100,
+    keep_parts: bool = False,
+) -> dict:
+    """
+    分段并行渲染整个场景
+
+    Args:
+        script: 场景脚本路径
+        scene_name: 场景类名（需继承 AutoScene 并调用 section()）
+        output: 输出视频路径（默认 <脚本目录>/videos/<场景名>.mp4）
+        workers: 并行进程数（默认 CPU 数）
+        manimgl: manimgl 命令
+        extra_args: 透传给 manimgl 的参数（如 --hd）
+        sample_rate: 音轨采样率
+        keep_parts: 保留分段文件
+
+    Returns:
+        {"duration", "sections", "plan_s", "render_s", "section_s", "assemble_s", "output"}
+    """
+    script = os.path.abspath(script)
+    script_dir = os.path.dirname(script)
+    output = os.path.abspath(output or os.path.join(script_dir, "videos", f"{scene_name}.mp4"))
+    work_dir = os.path.splitext(output)[0] + "_sections"
+    os.makedirs(work_dir, exist_ok=True)
+
+    t0 = time.perf_counter()
+    report = plan_sections(script, scene_name, work_dir, manimgl, extra_args)
+    plan_time = time.perf_counter() - t0
+    sections = report.get("sections") or [{"name": "section_0", "start": 0.0, "end": report["duration"]}]
+    indices = [i for i, s in enumerate(sections) if s["end"] - s["start"] > 0]
+    print(f"🎞️ {scene_name}: {len(indices)} 段, 预计 {report['duration']:.1f}s")
+
+    # 长段先渲染，均衡各进程负载
+    order = sorted(indices, key=lambda i: sections[i]["start"] - sections[i]["end"])
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {
+            i: pool.submit(render_section, script, scene_name, i, work_dir, manimgl, extra_args)
+            for i in order
+        }
+        section_times = {i: future.result() for i, future in futures.items()}
+    render_time = time.perf_counter() - t0
+    for i in indices:
+        print(f"   ✅ {i}: {sections[i]['name']} ({sections[i]['end'] - sections[i]['start']:.1f}s) "
+              f"渲染 {section_times[i]:.1f}s")
+
+    t0 = time.perf_counter()
+    parts = [os.path.join(work_dir, f"section_{i:03d}.mp4") for i in indices]
+    video_path = os.path.join(work_dir, "video.mp4")
+    concat_videos(parts, video_path)
+    mux_audio(video_path, load_section_audio(work_dir, indices), output, sample_rate)
+    assemble_time = time.perf_counter() - t0
+    if not keep_parts:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    serial = sum(section_times.values())
+    print(f"⏱️ 试运行 {plan_time:.1f}s  渲染 {render_time:.1f}s（各段合计 {serial:.1f}s, "
+          f"{serial / max(render_time, 1e-9):.1f}x）  拼接 {assemble_time:.1f}s")
+    print(f"🎬 输出: {output}")
+    return {
+        "duration": report["duration"],
+        "sections": [dict(sections[i], index=i) for i in indices],
+        "plan_s": plan_time,
+        "render_s": render_time,
+        "section_s": section_times,
+        "assemble_s": assemble_time,
+        "output": output,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    argv = sys.argv[1:]
+    extra = []
+    if "--" in argv:
+        extra = argv[argv.index("--") + 1:]
+        argv = argv[:argv.index("--")]
+
+    parser = argparse.ArgumentParser(description="AutoScene 分段并行渲染")
+    parser.add_argument("script", help="场景脚本")
+    parser.add_argument("scene", help="场景类名")
+    parser.add_argument("-o", "--output", default=None, help="输出视频路径")
+    parser.add_argument("--workers", type=int, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument("--manimgl", default="manimgl", help="manimgl 命令")
+    parser.add_argument("--keep-parts", action="store_true", help="保留分段文件")
+    args = parser.parse_args(argv)
+
+    render_in_sections(
+        args.script, args.scene, output=args.output, workers=args.workers,
+        manimgl=args.manimgl, extra_args=extra, keep_parts=args.keep_parts,
+    )
@@ -9,13 +9,121 @@ SoundLibrary - ManimGL 动画音效映射库
     
     lib = SoundLibrary()
     sound = lib.get_sound("ShowCreation")  # 从对应文件夹随机返回音效
+    sound = lib.get_sound("Write", max_duration=0.5)  # 只在真实时长 ≤ 0.5s 的音效中选
+
+    lib = SoundLibrary(seed=42)  # 确定性选择：同一脚本每次渲染选中相同音效
+
+元数据索引：
+    每个音效的时长、大小、采样率、mtime 持久化到 <音效库>/.sound_index.json，
+    按 (size, mtime) 失效，只有新增或修改的文件才重新探测帧头。
+    文件夹按真实时长排序一次，之后每次选择都是 O(1)（max_duration 为一次二分查找）。
 """
 
 import os
+import sys
 import json
 import random
+import hashlib
+from bisect import bisect_right
 from typing import Dict, Optional, List
 
+try:
+    from utils.audio_probe import probe_duration_us, probe_sample_rate
+except ImportError:
+    _parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # auto_manim 目录
+    if _parent_dir not in sys.path:
+        sys.path.insert(0, _parent_dir)
+    try:
+        from utils.audio_probe import probe_duration_us, probe_sample_rate
+    except ImportError:
+        probe_duration_us = probe_sample_rate = None
+
+
+class SoundIndex:
+    """
+    音效元数据索引
+
+    {相对路径: {"size", "mtime_ns", "duration", "sample_rate"}}，
+    size 或 mtime 变化时重新探测；只在有变化时原子回写 JSON。
+    """
+
+    INDEX_NAME = ".sound_index.json"
+    VERSION = 1
+
+    def __init__(self, library_path: str):
+        self.library_path = library_path
+        self.index_path = os.path.join(library_path, self.INDEX_NAME)
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self._entries = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def _probe(self, path: str, st: os.stat_result) -> dict:
+        duration = sample_rate = None
+        if probe_duration_us is not None:
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                us = probe_duration_us(path, data)
+                duration = None if us is None else us / 1_000_000
+                sample_rate = probe_sample_rate(path, data)
+            except OSError:
+                pass
+        return {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "duration": duration,
+            "sample_rate": sample_rate,
+        }
+
+    def scan_folder(self, folder_path: str, extensions) -> List[dict]:
+        """
+        扫描文件夹，返回 [{"path", "size", "mtime_ns", "duration", "sample_rate"}, ...]
+
+        未变化的文件直接使用索引；文件夹中已删除的文件从索引移除。
+        """
+        prefix = os.path.relpath(folder_path, self.library_path) + os.sep
+        seen = set()
+        items = []
+        for entry in os.scandir(folder_path):
+            if not entry.is_file() or os.path.splitext(entry.name)[1].lower() not in extensions:
+                continue
+            rel = os.path.relpath(entry.path, self.library_path)
+            st = entry.stat()
+            meta = self._entries.get(rel)
+            if meta is None or meta.get("size") != st.st_size or meta.get("mtime_ns") != st.st_mtime_ns:
+                meta = self._probe(entry.path, st)
+                self._entries[rel] = meta
+                self._dirty = True
+            seen.add(rel)
+            items.append(dict(meta, path=entry.path))
+
+        for rel in [r for r in self._entries if r.startswith(prefix) and r not in seen]:
+            del self._entries[rel]
+            self._dirty = True
+        return items
+
+    def get(self, path: str) -> Optional[dict]:
+        return self._entries.get(os.path.relpath(path, self.library_path))
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp = self.index_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "files": self._entries}, f,
+                          ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp, self.index_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"⚠️ 音效索引写入失败: {e}")
+
 
 class SoundLibrary:
     """
@@ -134,13 +242,15 @@ class SoundLibrary:
     # 支持的音频扩展名
     AUDIO_EXTENSIONS = {'.mp3', '.wav', '.ogg', '.m4a'}
     
-    def __init__(self, library_path: str = None, config_path: str = None):
+    def __init__(self, library_path: str = None, config_path: str = None, seed: Optional[int] = None):
         """
         初始化音效库
         
         Args:
             library_path: 音效库根目录（默认 assets/sounds/library/）
             config_path: 自定义配置文件路径（可选）
+            seed: 设置后按 (seed, 文件夹, 第几次选择) 确定性选择，渲染结果可复现、可缓存；
+                None 为随机选择
         """
         # 设置音效库路径
         if library_path:
@@ -160,8 +270,14 @@ class SoundLibrary:
         # 音效开关
         self._enabled = True
         
-        # 缓存文件夹内容（提高性能）
+        # 缓存文件夹内容（按真实时长升序，时长未知的排在最后）
         self._folder_cache: Dict[str, List[str]] = {}
+        self._folder_durations: Dict[str, List[float]] = {}
+        self._index: Optional[SoundIndex] = None
+        
+        # 选择模式
+        self._seed = seed
+        self._pick_counts: Dict[str, int] = {}
     
     def _load_config(self, config_path: str) -> None:
         """
@@ -195,24 +311,60 @@ class SoundLibrary:
         
         if not os.path.exists(folder_path):
             self._folder_cache[folder_name] = []
+            self._folder_durations[folder_name] = []
             return []
         
-        files = []
-        for filename in os.listdir(folder_path):
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in self.AUDIO_EXTENSIONS:
-                files.append(os.path.join(folder_path, filename))
-        
+        if self._index is None:
+            self._index = SoundIndex(self._library_path)
+        items = self._index.scan_folder(folder_path, self.AUDIO_EXTENSIONS)
+        self._index.save()
+        
+        # 时长未知时按文件大小排在已知时长之后
+        items.sort(key=lambda m: (
+            m["duration"] is None,
+            m["duration"] if m["duration"] is not None else m["size"],
+            os.path.basename(m["path"]),
+        ))
+        files = [m["path"] for m in items]
         self._folder_cache[folder_name] = files
+        self._folder_durations[folder_name] = [
+            m["duration"] if m["duration"] is not None else float("inf") for m in items
+        ]
         return files
     
+    def _pick(self, stream: str, count: int) -> int:
+        """
+        在 [0, count) 中选一个下标
+        
+        无 seed 时随机；有 seed 时由 (seed, stream, 该 stream 第几次选择) 的哈希决定，
+        与其他类别的选择次数无关。
+        """
+        if self._seed is None:
+            return random.randrange(count)
+        n = self._pick_counts.get(stream, 0)
+        self._pick_counts[stream] = n + 1
+        digest = hashlib.blake2b(f"{self._seed}:{stream}:{n}".encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % count
+    
+    def set_seed(self, seed: Optional[int]) -> None:
+        """设置选择种子（None 恢复随机），并重置选择计数"""
+        self._seed = seed
+        self._pick_counts.clear()
+    
+    def get_sound_info(self, path: str) -> Optional[dict]:
+        """音效元数据 {"size", "mtime_ns", "duration", "sample_rate"}（需已扫描所在文件夹）"""
+        if self._index is None:
+            return None
+        return self._index.get(path)
+    
     def get_sound(self, animation_name: str, max_duration: float = None) -> Optional[str]:
         """
-        获取动画对应的音效文件路径（从文件夹随机选择，优先选择较短的）
+        获取动画对应的音效文件路径（优先选择较短的）
         
         Args:
             animation_name: 动画类名（如 "ShowCreation"）
-            max_duration: 最大时长（秒），如果指定则优先选择较短的音效
+            max_duration: 最大时长（秒）。指定时在真实时长不超过它的音效中选择
+                （都超过时返回最短的）；不指定时在较短的一半中选择
             
         Returns:
             音效文件绝对路径，如果没有映射或文件不存在则返回 None
@@ -235,16 +387,12 @@ class SoundLibrary:
         if len(files) == 1:
             return files[0]
         
-        # 优先选择文件大小较小的（通常时长较短）
-        # 按文件大小排序，取前半部分中随机选择
-        try:
-            sorted_files = sorted(files, key=lambda f: os.path.getsize(f))
-            # 从较小的一半文件中随机选择
-            half_count = max(1, len(sorted_files) // 2)
-            return random.choice(sorted_files[:half_count])
-        except:
-            # 如果排序失败，回退到纯随机
-            return random.choice(files)
+        # 文件已按真实时长升序排列
+        if max_duration is not None:
+            count = max(1, bisect_right(self._folder_durations[folder_name], max_duration))
+        else:
+            count = max(1, len(files) // 2)
+        return files[self._pick(folder_name, count)]
     
     def get_add_sound(self) -> Optional[str]:
         """
@@ -261,7 +409,7 @@ class SoundLibrary:
         if not files:
             return None
         
-        return random.choice(files)
+        return files[self._pick("add", len(files))]
     
     def get_random_from_folder(self, folder_name: str) -> Optional[str]:
         """
@@ -281,7 +429,7 @@ class SoundLibrary:
         if not files:
             return None
         
-        return random.choice(files)
+        return files[self._pick(folder_name, len(files))]
     
     def set_enabled(self, enabled: bool) -> None:
         """启用/禁用音效"""
@@ -325,6 +473,7 @@ class SoundLibrary:
     def clear_cache(self) -> None:
         """清除文件夹缓存（当添加新音效后调用）"""
         self._folder_cache.clear()
+        self._folder_durations.clear()
     
     def list_folder_contents(self, folder_name: str) -> List[str]:
         """
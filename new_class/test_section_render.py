@@ -0,0 +1,121 @@
+"""
+分段渲染测试（真实 ManimGL 渲染，需要 OpenGL 上下文、manimgl 命令与 ffmpeg）
+
+两段场景带逐帧积分 dt 的 updater：分段渲染并拼接后，与整段串行渲染逐帧比较。
+
+运行方式:
+    python -m pytest new_class/test_section_render.py -q
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+# ManimGL 导入时解析命令行参数，避免把 pytest 的参数当作 manimgl 参数
+sys.argv = sys.argv[:1]
+pytest.importorskip("manimlib")
+if shutil.which("ffmpeg") is None or shutil.which("manimgl") is None:
+    pytest.skip("需要 ffmpeg 与 manimgl 命令", allow_module_level=True)
+
+from manimlib import BLUE, DOWN, LEFT, RED, RIGHT, Dot, Square
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from auto_scene import AutoScene
+from section_render import render_in_sections
+
+
+# ManimGL 1.7.2 的 --fps 参数以字符串传入相机，这里沿用默认帧率
+WIDTH, HEIGHT, FPS = 320, 180, 30
+ARGS = ["-r", f"{WIDTH}x{HEIGHT}"]
+
+
+class TwoSectionScene(AutoScene):
+    def construct(self):
+        spinner = Square().shift(LEFT * 3)
+        spinner.add_updater(lambda m, dt: m.rotate(dt))
+        # 指数逼近目标点：单步大 dt 与逐帧积分结果不同
+        follower = Dot(radius=0.3).shift(LEFT * 2 + DOWN)
+        follower.add_updater(lambda m, dt: m.shift(dt * (RIGHT * 3 + DOWN - m.get_center())))
+        marker = Square(side_length=1).shift(RIGHT * 4)
+        self.add(spinner, follower, marker)
+
+        self.section("intro")
+        self.play(marker.animate.set_color(RED), run_time=1)
+        self.wait(0.5)
+        self.section("outro")
+        self.play(marker.animate.set_color(BLUE), run_time=0.5)
+        self.wait(0.5)
+
+
+class SectionSoundScene(AutoScene):
+    # 不预混、带 gain_to_background：分段渲染仍须把声音交给父进程统一混音
+    PREMIX_AUDIO = False
+
+    def construct(self):
+        self.section("intro")
+        self.wait(1)
+        self.section("outro")
+        self.add_sound(os.environ["SECTION_TEST_BEEP"], gain_to_background=-6)
+        self.wait(1)
+
+
+def _decode(path):
+    raw = subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-i", path, "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+        check=True, stdout=subprocess.PIPE,
+    ).stdout
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, HEIGHT, WIDTH, 3).astype(np.int16)
+
+
+def test_sections_concat_matches_serial_render(tmp_path):
+    script = os.path.abspath(__file__)
+    subprocess.run(
+        ["manimgl", script, "TwoSectionScene", "-w", *ARGS, "--video_dir", str(tmp_path / "serial")],
+        check=True, cwd=os.path.dirname(script), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    result = render_in_sections(
+        script, "TwoSectionScene", output=str(tmp_path / "sections.mp4"), workers=2, extra_args=ARGS,
+    )
+    assert [s["name"] for s in result["sections"]] == ["intro", "outro"]
+
+    serial = _decode(str(tmp_path / "serial" / "TwoSectionScene.mp4"))
+    sections = _decode(result["output"])
+    assert len(serial) == len(sections) == round(2.5 * FPS)
+    # 只允许编码误差：段首 updater 状态不一致时，旋转方块与跟随点的位置差异远超此阈值
+    diff = np.abs(serial - sections).mean(axis=(1, 2, 3))
+    assert diff.max() < 1.0, diff
+
+
+def _write_beep(path, seconds=0.3, rate=44100):
+    t = np.arange(int(seconds * rate)) / rate
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes((np.sin(2 * np.pi * 440 * t) * 12000).astype(np.int16).tobytes())
+
+
+def test_section_sounds_reach_final_audio(tmp_path, monkeypatch):
+    beep = tmp_path / "beep.wav"
+    _write_beep(beep)
+    monkeypatch.setenv("SECTION_TEST_BEEP", str(beep))
+    result = render_in_sections(
+        os.path.abspath(__file__), "SectionSoundScene", output=str(tmp_path / "sound.mp4"),
+        workers=2, extra_args=ARGS,
+    )
+    rate = 8000
+    raw = subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-i", result["output"], "-vn", "-ac", "1", "-ar", str(rate),
+         "-f", "s16le", "-"],
+        check=True, stdout=subprocess.PIPE,
+    ).stdout
+    samples = np.abs(np.frombuffer(raw, dtype=np.int16))
+    loud = np.flatnonzero(samples > 2000)
+    assert len(loud), "声音没有进入成片"
+    # 第二段从场景时间 1s 开始
+    assert loud[0] / rate == pytest.approx(1.0, abs=0.05)
@@ -0,0 +1,91 @@
+"""
+静止等待去重测试（真实 ManimGL 渲染，需要 OpenGL 上下文与 ffmpeg）
+
+AutoScene 继承自 InteractiveScene，其 setup() 会加入带常驻 updater 的 selection_highlight；
+这里确认没有选中对象时 wait 只读取一次帧缓冲，其余帧重复写入。
+
+运行方式:
+    python -m pytest new_class/test_static_hold.py -q
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+# ManimGL 导入时解析命令行参数，避免把 pytest 的参数当作 manimgl 参数
+sys.argv = sys.argv[:1]
+pytest.importorskip("manimlib")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("需要 ffmpeg", allow_module_level=True)
+
+from manimlib import InteractiveScene, Square
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from auto_scene import AutoScene
+
+
+FPS = 30
+
+
+class StaticWaitScene(AutoScene):
+    def construct(self):
+        self.add(Square())
+        self.wait(2)
+
+
+class DynamicWaitScene(AutoScene):
+    def construct(self):
+        square = Square()
+        square.add_updater(lambda m, dt: m.rotate(dt))
+        self.add(square)
+        self.wait(2)
+
+
+def _render(scene_class, tmp_path, **attrs):
+    """渲染场景，返回 (场景, 读取帧缓冲次数, 写入帧数)"""
+    scene_class = type(scene_class.__name__, (scene_class,), attrs)
+    scene = scene_class(
+        camera_config=dict(resolution=(320, 180), fps=FPS),
+        file_writer_config=dict(
+            write_to_movie=True, output_directory=str(tmp_path),
+            file_name=scene_class.__name__, quiet=True,
+        ),
+    )
+    counts = {"reads": 0, "writes": 0}
+    read_fbo, write_frame = scene.camera.get_raw_fbo_data, scene.file_writer.write_frame
+
+    def counting_read(*args, **kwargs):
+        counts["reads"] += 1
+        return read_fbo(*args, **kwargs)
+
+    def counting_write(*args, **kwargs):
+        counts["writes"] += 1
+        return write_frame(*args, **kwargs)
+
+    scene.camera.get_raw_fbo_data = counting_read
+    scene.file_writer.write_frame = counting_write
+    scene.run()
+    return scene, counts["reads"], counts["writes"]
+
+
+def test_static_wait_reads_one_frame(tmp_path):
+    scene, reads, writes = _render(StaticWaitScene, tmp_path)
+    assert isinstance(scene, InteractiveScene)
+    assert scene.selection_highlight.has_updaters()
+    assert writes == 2 * FPS
+    assert reads == 1
+    assert scene._static_hold_stats["frames"] == 2 * FPS - 1
+
+
+def test_static_hold_matches_full_render(tmp_path):
+    _, held_reads, held_writes = _render(StaticWaitScene, tmp_path / "held")
+    _, full_reads, full_writes = _render(StaticWaitScene, tmp_path / "full", STATIC_HOLD_ENABLED=False)
+    assert held_writes == full_writes == full_reads
+    assert held_reads == 1
+
+
+def test_updaters_disable_static_hold(tmp_path):
+    _, reads, writes = _render(DynamicWaitScene, tmp_path)
+    assert reads == writes == 2 * FPS
@@ -36,49 +36,13 @@ uniform float decay_factor;   // 衰减指数
 uniform float show_intensity; // 0: 显示振幅, 1: 显示强度
 
 /*
- * 点光源位置数组
+ * 点光源位置纹理（RGB32F）
  * 
- * 由于 ModernGL 对数组 uniform 的支持有限，
- * 这里使用单独的 vec3 uniform 变量来存储每个光源的位置。
- * 最多支持 32 个点光源的同时渲染。
- * 
- * 注意：在实际使用中，只有前 n_sources 个光源会参与计算
+ * 第 i 个光源位于纹素 (i % 宽度, i / 宽度)，只在光源 DotCloud 变化时上传。
+ * 光源数量不再受 uniform 个数限制，只有前 n_sources 个纹素参与计算。
+ * 本 Mobject 只有这一个纹理，采样器使用默认纹理单元 0。
  */
-
-// ModernGL 在处理数组类型的 uniform 时存在问题，
-// 因此这里使用单独的 vec3 uniform 变量而非数组
-uniform vec3 point_source0;
-uniform vec3 point_source1;
-uniform vec3 point_source2;
-uniform vec3 point_source3;
-uniform vec3 point_source4;
-uniform vec3 point_source5;
-uniform vec3 point_source6;
-uniform vec3 point_source7;
-uniform vec3 point_source8;
-uniform vec3 point_source9;
-uniform vec3 point_source10;
-uniform vec3 point_source11;
-uniform vec3 point_source12;
-uniform vec3 point_source13;
-uniform vec3 point_source14;
-uniform vec3 point_source15;
-uniform vec3 point_source16;
-uniform vec3 point_source17;
-uniform vec3 point_source18;
-uniform vec3 point_source19;
-uniform vec3 point_source20;
-uniform vec3 point_source21;
-uniform vec3 point_source22;
-uniform vec3 point_source23;
-uniform vec3 point_source24;
-uniform vec3 point_source25;
-uniform vec3 point_source26;
-uniform vec3 point_source27;
-uniform vec3 point_source28;
-uniform vec3 point_source29;
-uniform vec3 point_source30;
-uniform vec3 point_source31;
+uniform sampler2D point_source_texture;
 
 // 输入输出变量
 in vec3 frag_point;    // 从顶点着色器传入的片段世界坐标
@@ -123,46 +87,12 @@ void main() {
     // 设置基础颜色
     frag_color.rgb = color;
     
-    // 将所有光源位置组织成数组以便遍历
-    vec3 point_sources[32] = vec3[32](
-        point_source0,
-        point_source1,
-        point_source2,
-        point_source3,
-        point_source4,
-        point_source5,
-        point_source6,
-        point_source7,
-        point_source8,
-        point_source9,
-        point_source10,
-        point_source11,
-        point_source12,
-        point_source13,
-        point_source14,
-        point_source15,
-        point_source16,
-        point_source17,
-        point_source18,
-        point_source19,
-        point_source20,
-        point_source21,
-        point_source22,
-        point_source23,
-        point_source24,
-        point_source25,
-        point_source26,
-        point_source27,
-        point_source28,
-        point_source29,
-        point_source30,
-        point_source31
-    );
-    
-    // 累加所有活动光源的复数振幅
+    // 累加所有活动光源的复数振幅（逐个从纹理读取光源位置）
+    int texture_width = textureSize(point_source_texture, 0).x;
     vec2 amp = vec2(0);
     for(int i = 0; i < int(n_sources); i++){
-        amp += amp_from_source(point_sources[i]);
+        vec3 source = texelFetch(point_source_texture, ivec2(i % texture_width, i / texture_width), 0).xyz;
+        amp += amp_from_source(source);
     }
     
     // 根据显示模式选择输出值
@@ -205,18 +205,6 @@ class HighPerformanceTracingTailDemo(ThreeDScene):
         
         print(f"使用Taichi预计算了 {total_points} 个粒子的轨迹参数")
         
-        # 批量创建追踪函数（仍需要Python函数，但数据已预计算）
-        tracer_functions = []
-        for i in range(total_points):
-            def create_tracer(idx):
-                def tracer():
-                    current_positions = positions.to_numpy()
-                    if idx < len(current_positions):
-                        return current_positions[idx]
-                    return ORIGIN
-                return tracer
-            tracer_functions.append(create_tracer(i))
-        
         # 使用预计算的电影级别颜色和参数创建轨迹
         # 取平均值作为基础参数，避免过多变化
         avg_tail_length = int(np.mean(tail_params_np[:, 0]))
@@ -230,7 +218,7 @@ class HighPerformanceTracingTailDemo(ThreeDScene):
         
         # 创建多轨迹管理器，使用Taichi预计算的参数
         self.multi_tails = MultiTracingTails(
-            traced_functions=tracer_functions,
+            position_provider=positions.to_numpy,   # 批量来源：整场一次拷贝喂给所有轨迹
             colors=cinematic_colors_np,             # 使用电影级别颜色
             max_tail_length=avg_tail_length,        # 使用平均轨迹长度
             tail_lifetime=avg_tail_lifetime,        # 使用平均生命周期
@@ -285,7 +273,7 @@ class HighPerformanceTracingTailDemo(ThreeDScene):
                 self.dot_cloud.data['rgba'] = rgba_colors
             
             # 5. GPU shader并行更新所有轨迹（已经是最优化的）
-            self.multi_tails.update_all_tails(dt)
+            self.multi_tails.update_all_tails(dt, new_positions)
         
         # 添加超高性能更新器
         self.dot_cloud.add_updater(ultra_high_performance_updater)
@@ -16,12 +16,27 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from TracingTailPMobject import TracingTailPMobject
+from TracingTailPMobject import TracingTailPMobject, SharedPositionSource
 from glow_line import GlowLine
+from arc_length_sampler import get_arc_length_lut
+from palette import get_palette
 
 __all__ = ["GlowFlashRectangle", "GlowVMobjectTracer", "GlowSurroundingRect", "GlowRoundedRectangle", "StillSurroundingRect"]
 
 
+def _wrap_position_provider(position_provider):
+    """
+    把批量位置来源统一为 (SharedPositionSource, 是否由本对象负责刷新)
+
+    外部传入的 SharedPositionSource 由调用方每帧 refresh() 或 invalidate()（可被多个对象共享）。
+    """
+    if position_provider is None:
+        return None, False
+    if isinstance(position_provider, SharedPositionSource):
+        return position_provider, False
+    return SharedPositionSource(position_provider), True
+
+
 def _refine_vmobject_corners(vmob: VMobject, refinement: int = 6, smooth_passes: int = 2) -> VMobject:
     """Insert extra curves and smoothing rounds to make rounded corners look cleaner."""
     if not isinstance(vmob, VMobject):
@@ -36,60 +51,27 @@ def _refine_vmobject_corners(vmob: VMobject, refinement: int = 6, smooth_passes:
     return vmob
 
 
+# 本模块一直支持的命名方案；其他名称（包括调色盘新增的 "cinematic"、"rainbow"）仍回退到默认色
+_RAINBOW_SCHEMES = ("dark", "bright", "neon")
+
+
+def _rainbow_palette(color_scheme):
+    """颜色方案 -> 共享调色盘（平方空间插值，与 interpolate_color 一致）"""
+    if isinstance(color_scheme, str) and color_scheme in _RAINBOW_SCHEMES:
+        return get_palette(color_scheme, interpolation="rms")
+    colors = color_scheme if isinstance(color_scheme, list) else [RED, BLUE, GREEN, YELLOW]
+    return get_palette(colors, interpolation="rms")
+
+
+def calculate_rainbow_colors(total_points, color_scheme="bright"):
+    """一次计算 total_points 个彩虹渐变色（第 i 个位于 i / total_points），返回 HEX 列表"""
+    return _rainbow_palette(color_scheme).hex_gradient(total_points, endpoint=False)
+
+
 def calculate_rainbow_color(index, total_points, color_scheme="bright"):
-    """计算彩虹渐变色"""
-    progress = index / total_points
-    
-    if color_scheme == "dark":
-        # 深色彩虹色调
-        colors = [
-            "#2D1B69",  # 深紫色
-            "#4A0E4E",  # 深洋红
-            "#8B0000",  # 深红色  
-            "#B8860B",  # 深金色
-            "#006400",  # 深绿色
-            "#191970",  # 深蓝色
-            "#4B0082",  # 深靛色
-            "#2D1B69"   # 回到起始颜色形成循环
-        ]
-    elif color_scheme == "bright":
-        # 明亮彩虹色调
-        colors = [
-            "#FF0080",  # 亮粉色
-            "#FF4000",  # 橙红色
-            "#FF8000",  # 橙色
-            "#FFFF00",  # 黄色
-            "#80FF00",  # 黄绿色
-            "#00FF80",  # 青绿色
-            "#0080FF",  # 蓝色
-            "#8000FF",  # 紫色
-            "#FF0080"   # 回到起始颜色
-        ]
-    elif color_scheme == "neon":
-        # 霓虹色调
-        colors = [
-            "#FF006E",  # 霓虹粉
-            "#FB5607",  # 霓虹橙
-            "#FFBE0B",  # 霓虹黄
-            "#8338EC",  # 霓虹紫
-            "#3A86FF",  # 霓虹蓝
-            "#06FFA5",  # 霓虹绿
-            "#FF006E"   # 循环
-        ]
-    else:  # 自定义颜色数组
-        colors = color_scheme if isinstance(color_scheme, list) else [RED, BLUE, GREEN, YELLOW]
-    
-    # 计算颜色段和插值
-    num_segments = len(colors) - 1
-    segment_idx = int(progress * num_segments)
-    segment_idx = min(segment_idx, num_segments - 1)
-    
-    segment_progress = (progress * num_segments) - segment_idx
-    
-    color1 = colors[segment_idx]
-    color2 = colors[segment_idx + 1]
-    
-    return interpolate_color(color1, color2, segment_progress)
+    """计算单个彩虹渐变色（批量请用 calculate_rainbow_colors）"""
+    rgba = _rainbow_palette(color_scheme).sample([index / total_points])
+    return rgb_to_hex(rgba[0, :3])
 
 
 class GlowFlashRectangle(Group):
@@ -135,6 +117,10 @@ class GlowFlashRectangle(Group):
         # 显示配置
         show_dots: bool = True,
         show_rectangle: bool = False,
+
+        # 批量位置来源：返回 (N, 3) 的函数、共享数组或 SharedPositionSource
+        # 设置后点位由来源驱动（每帧一次拷贝），不再沿矩形路径运动
+        position_provider = None,
         **kwargs
     ):
         super().__init__(**kwargs)
@@ -159,6 +145,9 @@ class GlowFlashRectangle(Group):
         self.show_rectangle = show_rectangle
         self.corner_refinement = corner_refinement
         self.corner_smooth_passes = corner_smooth_passes
+        self.position_source, self._owns_position_source = _wrap_position_provider(position_provider)
+        if self.position_source is not None:
+            self.num_points = len(self.position_source)
         
         # 创建基础路径
         self.path = RoundedRectangle(
@@ -178,7 +167,21 @@ class GlowFlashRectangle(Group):
         
         # 添加到组中
         self._add_to_group()
-    
+
+        # ManimGL 先更新子对象（轨迹）再执行组更新器：轨迹每帧第一次读取时刷新快照，
+        # 组更新器移动点后让快照过期，下一帧轨迹读到的是新位置（不滞后一帧）
+        if self.position_source is not None:
+            self.add_updater(lambda mob, dt: mob.sync_from_source())
+    
+    def sync_from_source(self):
+        """把所有点移到本帧快照，并让自建来源的快照过期"""
+        source = self.position_source
+        for dot, position in zip(self.dots, source.current()):
+            dot.move_to(position)
+        if self._owns_position_source:
+            source.invalidate()
+        return self
+
     def _create_components(self):
         """创建所有点、轨迹和动画组件"""
         
@@ -192,13 +195,17 @@ class GlowFlashRectangle(Group):
             return lambda mob, dt: target_trace.update_tail(dt)
         
         # 创建所有组件
+        rainbow_colors = calculate_rainbow_colors(self.num_points, self.color_scheme)
         for i in range(self.num_points):
             # 重要修复：避开首尾连接点，使用 0.5 的偏移确保均匀分布
             start_t = (i + 0.5) / self.num_points
-            start_point = self.path.point_from_proportion(start_t)
+            if self.position_source is not None:
+                start_point = self.position_source.positions[i]
+            else:
+                start_point = self.path.point_from_proportion(start_t)
             
             # 计算颜色
-            current_color = calculate_rainbow_color(i, self.num_points, self.color_scheme)
+            current_color = rainbow_colors[i]
             
             # 创建点
             dot = Dot(radius=self.dot_radius, color=current_color).move_to(start_point)
@@ -220,8 +227,11 @@ class GlowFlashRectangle(Group):
                 run_time=self.speed
             )
             
-            # 使用工厂函数创建轨迹追踪函数
-            traced_func = make_traced_point_func(dot)
+            # 使用工厂函数创建轨迹追踪函数（批量来源时直接读快照）
+            if self.position_source is not None:
+                traced_func = self.position_source.point_func(i)
+            else:
+                traced_func = make_traced_point_func(dot)
             debug_name = None
             if self.tail_debug_names is not None and i < len(self.tail_debug_names):
                 debug_name = self.tail_debug_names[i]
@@ -254,7 +264,8 @@ class GlowFlashRectangle(Group):
             # 更新器已添加（调试信息已移除）
             
             self.dots.append(dot)
-            self.animations.append(anim)
+            if self.position_source is None:
+                self.animations.append(anim)
             self.traces.append(trace)
             
             # 验证追踪函数（静默）
@@ -285,6 +296,11 @@ class GlowFlashRectangle(Group):
             loop: 是否循环播放
             loop_delay: 循环间隔时间
         """
+        if not self.animations:
+            # 批量来源驱动：只需让更新器运行
+            scene.wait(self.speed)
+            return
+
         if loop:
             # 无限循环模式
             while True:
@@ -299,8 +315,9 @@ class GlowFlashRectangle(Group):
         """动态更新颜色方案"""
         self.color_scheme = new_color_scheme
         
+        rainbow_colors = calculate_rainbow_colors(self.num_points, new_color_scheme)
         for i, (dot, trace) in enumerate(zip(self.dots, self.traces)):
-            new_color = calculate_rainbow_color(i, self.num_points, new_color_scheme)
+            new_color = rainbow_colors[i]
             dot.set_color(new_color)
             trace.base_color = new_color
     
@@ -313,8 +330,7 @@ class GlowFlashRectangle(Group):
     def clear_trails(self):
         """清除所有轨迹"""
         for trace in self.traces:
-            trace.tail_points.clear()
-            trace.tail_times.clear()
+            trace.tail_buffer.clear()
     
     def set_glow_intensity(self, intensity):
         """设置辉光强度"""
@@ -324,6 +340,8 @@ class GlowFlashRectangle(Group):
     
     def get_animation_group(self):
         """获取动画组，用于与其他动画组合"""
+        if not self.animations:
+            return Wait(self.speed)
         return AnimationGroup(*self.animations)
 
 
@@ -391,7 +409,7 @@ class GlowVMobjectTracer(Group):
     
     def __init__(
         self,
-        vmobject: VMobject,
+        vmobject: VMobject | None = None,
         
         # 点和轨迹配置
         num_points: int = 8,
@@ -417,9 +435,18 @@ class GlowVMobjectTracer(Group):
         # 显示配置
         show_dots: bool = True,
         auto_update: bool = True,  # 是否自动更新位置
+
+        # 批量位置来源：返回 (N, 3) 的函数、共享数组或 SharedPositionSource
+        # 设置后点位由来源驱动（每帧一次拷贝），vmobject 可省略
+        position_provider = None,
         **kwargs
     ):
         super().__init__(**kwargs)
+        self.position_source, self._owns_position_source = _wrap_position_provider(position_provider)
+        if vmobject is None and self.position_source is None:
+            raise ValueError("GlowVMobjectTracer 需要 vmobject 或 position_provider")
+        if self.position_source is not None:
+            num_points = len(self.position_source)
         
         # 保存配置参数
         self.vmobject = vmobject
@@ -466,21 +493,28 @@ class GlowVMobjectTracer(Group):
             """为每个轨迹创建独立的更新器函数 - 关键修复！"""
             return lambda mob, dt: target_trace.update_tail(dt)
         
+        rainbow_colors = calculate_rainbow_colors(self.num_points, self.color_scheme)
         for i in range(self.num_points):
             # 重要修复：避开首尾连接点，使用 0.5 的偏移
             start_alpha = (i + 0.5) / self.num_points
-            start_point = self.vmobject.point_from_proportion(start_alpha)
+            if self.position_source is not None:
+                start_point = self.position_source.positions[i]
+            else:
+                start_point = get_arc_length_lut(self.vmobject).evaluate([start_alpha])[0]
             
             # 计算颜色
-            current_color = calculate_rainbow_color(i, self.num_points, self.color_scheme)
+            current_color = rainbow_colors[i]
             
             # 创建点
             dot = Dot(radius=self.dot_radius, color=current_color).move_to(start_point)
             
             # 调试输出已移除
             
-            # 使用工厂函数创建轨迹追踪函数
-            traced_func = make_traced_point_func(dot)
+            # 使用工厂函数创建轨迹追踪函数（批量来源时直接读快照）
+            if self.position_source is not None:
+                traced_func = self.position_source.point_func(i)
+            else:
+                traced_func = make_traced_point_func(dot)
             
             # 为边界点设置更宽松的传送阈值
             is_boundary = (i == 0 or i == self.num_points - 1)
@@ -529,6 +563,15 @@ class GlowVMobjectTracer(Group):
         
         # 更新时间
         self.time += dt * self.speed
+
+        # 批量来源：轨迹（子对象先于本更新器执行）已按需刷新本帧快照，这里复用后让其过期
+        if self.position_source is not None:
+            source = self.position_source
+            for dot, position in zip(self.dots, source.current()):
+                dot.move_to(position)
+            if self._owns_position_source:
+                source.invalidate()
+            return self
         
         # 计算当前周期进度 [0, 1]
         cycle_progress = (self.time / self.time_per_cycle) % 1.0
@@ -537,16 +580,10 @@ class GlowVMobjectTracer(Group):
         if hasattr(self.rate_function, '__call__'):
             cycle_progress = self.rate_function(cycle_progress)
         
-        # 更新每个点的位置
-        for i, dot in enumerate(self.dots):
-            # 计算该点在路径上的位置（带偏移）
-            point_offset = i / self.num_points
-            alpha = (cycle_progress + point_offset) % 1.0
-            
-            # 从 VMobject 获取对应位置的点
-            new_position = self.vmobject.point_from_proportion(alpha)
-            
-            # 更新点的位置
+        # 所有点的路径比例（带偏移），经弧长 LUT 一次求出位置
+        alphas = (cycle_progress + np.arange(self.num_points) / self.num_points) % 1.0
+        positions = get_arc_length_lut(self.vmobject).evaluate(alphas)
+        for dot, new_position in zip(self.dots, positions):
             dot.move_to(new_position)
         
         return self
@@ -555,8 +592,9 @@ class GlowVMobjectTracer(Group):
         """动态更新颜色方案"""
         self.color_scheme = new_color_scheme
         
+        rainbow_colors = calculate_rainbow_colors(self.num_points, new_color_scheme)
         for i, (dot, trace) in enumerate(zip(self.dots, self.traces)):
-            new_color = calculate_rainbow_color(i, self.num_points, new_color_scheme)
+            new_color = rainbow_colors[i]
             dot.set_color(new_color)
             trace.base_color = new_color
     
@@ -571,8 +609,7 @@ class GlowVMobjectTracer(Group):
     def clear_trails(self):
         """清除所有轨迹"""
         for trace in self.traces:
-            trace.tail_points.clear()
-            trace.tail_times.clear()
+            trace.tail_buffer.clear()
     
     def set_glow_intensity(self, intensity):
         """设置辉光强度"""
@@ -825,14 +862,15 @@ class GlowSurroundingRect(Group):
         # 存储额外的白色备用轨迹（已移除数字标签）
         self.backup_traces = []  # 存储白色备用轨迹
         
+        rainbow_colors = calculate_rainbow_colors(self.num_points, self.color_scheme)
         for i in range(self.num_points):
             # 重要修复：避开首尾连接点（0.0 和 1.0），使用更大的偏移
             # 将所有点向中间偏移 0.25，避免边界点触发传送判定
             start_alpha = (i + 0.5) / self.num_points
-            start_point = self.rect_path.point_from_proportion(start_alpha)
+            start_point = get_arc_length_lut(self.rect_path).evaluate([start_alpha])[0]
             
             # 计算颜色
-            current_color = calculate_rainbow_color(i, self.num_points, self.color_scheme)
+            current_color = rainbow_colors[i]
             
             # 创建点
             dot = Dot(radius=self.dot_radius, color=current_color).move_to(start_point)
@@ -937,19 +975,11 @@ class GlowSurroundingRect(Group):
         if hasattr(self.rate_function, '__call__'):
             cycle_progress = self.rate_function(cycle_progress)
         
-        # 更新每个点的位置
-        for i, dot in enumerate(self.dots):
-            # 计算该点在路径上的位置（带偏移）
-            point_offset = i / self.num_points
-            alpha = (cycle_progress + point_offset) % 1.0
-            
-            # 从矩形路径获取对应位置的点
-            new_position = self.rect_path.point_from_proportion(alpha)
-            
-            # 更新点的位置
+        # 所有点的路径比例（带偏移），经弧长 LUT 一次求出位置
+        alphas = (cycle_progress + np.arange(self.num_points) / self.num_points) % 1.0
+        positions = get_arc_length_lut(self.rect_path).evaluate(alphas)
+        for dot, new_position in zip(self.dots, positions):
             dot.move_to(new_position)
-            
-            # labels 已移除，故不再更新标签位置
         
         return self
     
@@ -966,9 +996,9 @@ class GlowSurroundingRect(Group):
         self._update_rect_path()
         
         # 更新点的位置
-        for i, dot in enumerate(self.dots):
-            alpha = i / self.num_points
-            new_position = self.rect_path.point_from_proportion(alpha)
+        alphas = np.arange(self.num_points) / self.num_points
+        positions = get_arc_length_lut(self.rect_path).evaluate(alphas)
+        for dot, new_position in zip(self.dots, positions):
             dot.move_to(new_position)
         
         return self
@@ -977,8 +1007,9 @@ class GlowSurroundingRect(Group):
         """动态更新颜色方案"""
         self.color_scheme = new_color_scheme
         
+        rainbow_colors = calculate_rainbow_colors(self.num_points, new_color_scheme)
         for i, (dot, trace) in enumerate(zip(self.dots, self.traces)):
-            new_color = calculate_rainbow_color(i, self.num_points, new_color_scheme)
+            new_color = rainbow_colors[i]
             dot.set_color(new_color)
             trace.base_color = new_color
     
@@ -993,8 +1024,7 @@ class GlowSurroundingRect(Group):
     def clear_trails(self):
         """清除所有轨迹"""
         for trace in self.traces:
-            trace.tail_points.clear()
-            trace.tail_times.clear()
+            trace.tail_buffer.clear()
     
     def set_glow_intensity(self, intensity):
         """设置辉光强度"""
@@ -1138,20 +1168,17 @@ class GlowRoundedRectangle(Group):
         )
         _refine_vmobject_corners(path, self.corner_refinement, self.corner_smooth_passes)
         
-        # 获取路径上的点
-        points = []
+        # 获取路径上的点（沿弧长均匀）
         effective_segments = max(
             self.num_segments,
             int(self.num_segments * self.corner_sample_boost),
             4 * max(1, self.corner_refinement)
         )
 
-        for i in range(effective_segments + 1):
-            alpha = i / effective_segments
-            point = path.point_from_proportion(alpha)
-            points.append(point)
+        points = list(get_arc_length_lut(path).sample(effective_segments + 1, endpoint=True))
         
         # 根据颜色方案创建线段
+        rainbow_colors = calculate_rainbow_colors(len(points) - 1, self.color_scheme)
         for i in range(len(points) - 1):
             start = points[i]
             end = points[i + 1]
@@ -1160,7 +1187,7 @@ class GlowRoundedRectangle(Group):
             if self.color_scheme == "single":
                 color = self.single_color
             else:
-                color = calculate_rainbow_color(i, len(points) - 1, self.color_scheme)
+                color = rainbow_colors[i]
             
             # 创建 GlowLine
             line = GlowLine(
@@ -8,7 +8,11 @@ from __future__ import annotations
 
 __all__ = [
     "TracingTailPMobject", 
-    "MultiTracingTails"
+    "MultiTracingTails",
+    "TailRingBuffer",
+    "TailRingBuffer2D",
+    "SharedPositionSource",
+    "IncrementalTracingTails",
 ]
 
 import math
@@ -33,47 +37,30 @@ if TYPE_CHECKING:
 
 
 def _compute_neighbor_directions(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-    """为给定序列的轨迹点计算相邻方向向量。"""
+    """为给定序列的轨迹点计算相邻方向向量（向量化，无逐点循环）。"""
     n_points = len(points)
     prev_dirs = np.zeros((n_points, 3), dtype=np.float32)
     next_dirs = np.zeros((n_points, 3), dtype=np.float32)
 
-    if n_points == 0:
+    if n_points < 2:
         return prev_dirs, next_dirs
-    if n_points == 1:
-        return prev_dirs, next_dirs
-
-    last_valid = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-
-    for i in range(n_points):
-        if i == 0:
-            forward = points[1] - points[0]
-            backward = forward
-        elif i == n_points - 1:
-            backward = points[i] - points[i - 1]
-            forward = backward
-        else:
-            backward = points[i] - points[i - 1]
-            forward = points[i + 1] - points[i]
-
-        def _normalize(vec: np.ndarray, fallback: np.ndarray) -> np.ndarray:
-            norm = np.linalg.norm(vec)
-            if norm < 1e-6:
-                return fallback
-            return (vec / norm).astype(np.float32)
-
-        prev_dir = _normalize(backward, last_valid)
-        next_dir = _normalize(forward, prev_dir)
-
-        if np.linalg.norm(prev_dir) < 1e-6:
-            prev_dir = last_valid
-        if np.linalg.norm(next_dir) < 1e-6:
-            next_dir = prev_dir
-
-        prev_dirs[i] = prev_dir
-        next_dirs[i] = next_dir
-        last_valid = next_dir
 
+    # 每段的单位方向；退化段（长度过小）沿用之前最近的有效方向，开头默认 +x
+    seg = np.diff(points, axis=0).astype(np.float32)
+    norms = np.linalg.norm(seg, axis=1)
+    valid = norms >= 1e-6
+    seg_dirs = np.zeros_like(seg)
+    seg_dirs[valid] = seg[valid] / norms[valid, None]
+    if not np.all(valid):
+        last_valid_idx = np.where(valid, np.arange(len(seg)), -1)
+        np.maximum.accumulate(last_valid_idx, out=last_valid_idx)
+        filled = np.vstack([np.array([[1.0, 0.0, 0.0]], dtype=np.float32), seg_dirs])
+        seg_dirs = filled[last_valid_idx + 1]
+
+    prev_dirs[1:] = seg_dirs
+    prev_dirs[0] = seg_dirs[0]
+    next_dirs[:-1] = seg_dirs
+    next_dirs[-1] = seg_dirs[-1]
     return prev_dirs, next_dirs
 
 
@@ -154,6 +141,307 @@ def _compute_dynamic_jump_threshold(
     return dynamic
 
 
+def _sorted_row_percentile(sorted_rows: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """对已按行升序排列（NaN 在末尾）的矩阵，按每行有效个数做线性插值分位数。"""
+    last = np.maximum(counts - 1, 0)
+    pos = q * last
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, last)
+    rows = np.arange(len(counts))
+    v_lo = sorted_rows[rows, lo]
+    v_hi = sorted_rows[rows, hi]
+    return v_lo + (v_hi - v_lo) * (pos - lo)
+
+
+def _compute_dynamic_jump_thresholds(
+    distance_history: np.ndarray,
+    fallback: float = 3.0,
+    min_threshold: float = 0.6,
+) -> np.ndarray:
+    """
+    _compute_dynamic_jump_threshold 的批量版本
+
+    Args:
+        distance_history: (n_tails, history) 步长矩阵，缺失位置为 NaN
+
+    Returns:
+        (n_tails,) 每条轨迹的传送判定阈值
+    """
+    counts = np.count_nonzero(np.isfinite(distance_history), axis=1)
+    result = np.full(len(counts), max(fallback, min_threshold), dtype=np.float64)
+    has_data = counts > 0
+    if not np.any(has_data):
+        return result
+
+    history = distance_history[has_data]
+    counts = counts[has_data]
+    sorted_rows = np.sort(history, axis=1)
+
+    median = _sorted_row_percentile(sorted_rows, counts, 0.5)
+    deviation = np.sort(np.abs(history - median[:, None]), axis=1)
+    mad = _sorted_row_percentile(deviation, counts, 0.5) + 1e-6
+    perc90 = _sorted_row_percentile(sorted_rows, counts, 0.9)
+    perc99 = np.where(counts > 1, _sorted_row_percentile(sorted_rows, counts, 0.99), perc90)
+
+    dynamic = np.maximum.reduce([
+        np.full_like(median, min_threshold),
+        median + mad * 6.0,
+        perc90 * 1.8,
+        perc99 * 1.4,
+    ])
+    max_val = sorted_rows[np.arange(len(counts)), counts - 1]
+    few = counts <= 3
+    dynamic[few] = np.maximum(dynamic[few], max_val[few] * 4.5 + min_threshold * 0.5)
+
+    result[has_data] = dynamic
+    return result
+
+
+def _compute_batch_neighbor_directions(points: np.ndarray, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    _compute_neighbor_directions 的批量版本
+
+    Args:
+        points: (n_tails, L, 3) 右对齐的轨迹窗口，第 i 行有效部分为 [starts[i], L)
+        starts: (n_tails,) 每行第一个有效点的列号
+    """
+    n_tails, length = points.shape[:2]
+    starts = np.minimum(starts, max(length - 1, 0))
+    prev_dirs = np.zeros((n_tails, length, 3), dtype=np.float32)
+    next_dirs = np.zeros((n_tails, length, 3), dtype=np.float32)
+    if length < 2:
+        return prev_dirs, next_dirs
+
+    seg = np.diff(points, axis=1).astype(np.float32)
+    norms = np.linalg.norm(seg, axis=2)
+    cols = np.arange(length - 1)
+    valid = (norms >= 1e-6) & (cols[None, :] >= starts[:, None])
+    seg_dirs = np.zeros_like(seg)
+    seg_dirs[valid] = seg[valid] / norms[valid][:, None]
+    if not np.all(valid):
+        # 逐行前向填充最近的有效方向，行首默认 +x
+        last_valid_idx = np.where(valid, cols[None, :], -1)
+        np.maximum.accumulate(last_valid_idx, axis=1, out=last_valid_idx)
+        filled = np.concatenate([
+            np.broadcast_to(np.array([1.0, 0.0, 0.0], dtype=np.float32), (n_tails, 1, 3)),
+            seg_dirs,
+        ], axis=1)
+        seg_dirs = np.take_along_axis(filled, (last_valid_idx + 1)[:, :, None], axis=1)
+
+    prev_dirs[:, 1:] = seg_dirs
+    next_dirs[:, :-1] = seg_dirs
+    next_dirs[:, -1] = seg_dirs[:, -1]
+    # 每行首个有效点的 prev_dir 取其后一段方向
+    rows = np.arange(n_tails)
+    first_seg = np.minimum(starts, length - 2)
+    prev_dirs[rows, starts] = seg_dirs[rows, first_seg]
+    return prev_dirs, next_dirs
+
+
+def _color_to_rgb(color) -> np.ndarray:
+    """把 ManimColor 或 RGB/RGBA 数组转换为 float32 RGB。"""
+    if isinstance(color, np.ndarray):
+        if len(color) == 3:
+            return color.astype(np.float32)
+        if len(color) == 4:
+            return color[:3].astype(np.float32)
+        return np.array([1.0, 1.0, 1.0], dtype=np.float32)
+    color_rgba = color_to_rgba(color)
+    return np.array(color_rgba[:3], dtype=np.float32)
+
+
+class TailRingBuffer:
+    """
+    固定容量的轨迹环形缓冲（点 + 时间戳）
+
+    采用镜像双写：每个元素同时写入槽位 i 与 i + capacity，
+    因此有效窗口 [head, head + size) 在底层数组中始终连续，
+    points / times 直接返回切片视图，无需拷贝或逐点 Python 循环。
+    """
+
+    def __init__(self, capacity: int, dim: int = 3):
+        self.capacity = max(2, int(capacity))
+        self._points = np.zeros((2 * self.capacity, dim), dtype=np.float32)
+        self._times = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def points(self) -> np.ndarray:
+        """按时间顺序（旧 -> 新）的连续点视图"""
+        return self._points[self._head:self._head + self._size]
+
+    @property
+    def times(self) -> np.ndarray:
+        """按时间顺序（旧 -> 新）的连续时间戳视图"""
+        return self._times[self._head:self._head + self._size]
+
+    def append(self, point: Vect3, time: float) -> None:
+        cap = self.capacity
+        idx = (self._head + self._size) % cap
+        if self._size == cap:
+            self._head = (self._head + 1) % cap
+        else:
+            self._size += 1
+        self._points[idx] = point
+        self._points[idx + cap] = point
+        self._times[idx] = time
+        self._times[idx + cap] = time
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+    def drop_oldest(self, count: int) -> int:
+        """丢弃最老的 count 个点，返回实际丢弃数"""
+        count = int(min(max(count, 0), self._size))
+        if count:
+            self._head = (self._head + count) % self.capacity
+            self._size -= count
+        return count
+
+    def keep_last(self, count: int) -> int:
+        """只保留最新的 count 个点，返回丢弃数"""
+        return self.drop_oldest(self._size - count)
+
+    def expire(self, current_time: float, lifetime: float, min_keep: int = 2) -> int:
+        """
+        向量化过期清理：时间戳单调递增，二分定位第一个未过期的点
+
+        Returns:
+            丢弃的点数（至少保留 min_keep 个）
+        """
+        if self._size <= min_keep:
+            return 0
+        n_expired = int(np.searchsorted(self.times, current_time - lifetime, side="left"))
+        return self.drop_oldest(min(n_expired, self._size - min_keep))
+
+    def set(self, points: np.ndarray, times: np.ndarray) -> None:
+        """用数组整体替换内容（超出容量时保留最新部分）"""
+        n = min(len(points), self.capacity)
+        cap = self.capacity
+        self._head = 0
+        self._size = n
+        if n:
+            # 先拷贝：输入可能是本缓冲 window() 的视图，写前半段会改掉镜像要读的数据
+            points = np.array(points[-n:], dtype=np.float32)
+            times = np.array(times[-n:], dtype=self._times.dtype)
+            self._points[:n] = points
+            self._points[cap:cap + n] = points
+            self._times[:n] = times
+            self._times[cap:cap + n] = times
+
+
+class TailRingBuffer2D:
+    """
+    多轨迹的结构数组环形缓冲：points 形状 (n_tails, capacity, 3)
+
+    所有轨迹每帧同时写入一列，因此共享写指针与时间戳数组；
+    每条轨迹只用 lengths[i] 记录自己保留的最新列数。
+    与 TailRingBuffer 一样采用镜像双写，window() 返回连续视图。
+    """
+
+    def __init__(self, n_tails: int, capacity: int, dim: int = 3):
+        self.n_tails = int(n_tails)
+        self.capacity = max(2, int(capacity))
+        self._points = np.zeros((self.n_tails, 2 * self.capacity, dim), dtype=np.float32)
+        self._times = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._end = 0
+        self.lengths = np.zeros(self.n_tails, dtype=np.intp)
+
+    def _write_column(self, col: int, points: np.ndarray, rows=slice(None)) -> None:
+        self._points[rows, col] = points
+        self._points[rows, col + self.capacity] = points
+
+    def append(self, points: np.ndarray, time: float) -> None:
+        """所有轨迹各追加一个点"""
+        col = self._end
+        self._write_column(col, points)
+        self._times[col] = time
+        self._times[col + self.capacity] = time
+        self._end = (col + 1) % self.capacity
+        np.minimum(self.lengths + 1, self.capacity, out=self.lengths)
+
+    def last_points(self) -> np.ndarray:
+        """每条轨迹最新的点 (n_tails, 3)（副本）"""
+        return self._points[:, (self._end - 1) % self.capacity].copy()
+
+    def set_previous(self, mask: np.ndarray, points: np.ndarray) -> None:
+        """改写 mask 选中轨迹的倒数第二列（沿用该列的时间戳）"""
+        self._write_column((self._end - 2) % self.capacity, points, rows=mask)
+
+    def window(self, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """最新 length 列的 (points 视图 (n_tails, length, 3), times 视图 (length,))"""
+        length = int(min(max(length, 0), self.capacity))
+        stop = self._end + self.capacity
+        return self._points[:, stop - length:stop], self._times[stop - length:stop]
+
+    def resize(self, capacity: int) -> None:
+        """调整容量，保留每条轨迹最新的数据"""
+        capacity = max(2, int(capacity))
+        keep = min(capacity, self.capacity)
+        points, times = self.window(keep)
+        points, times = points.copy(), times.copy()
+        self.capacity = capacity
+        self._points = np.zeros((self.n_tails, 2 * capacity, points.shape[2]), dtype=np.float32)
+        self._times = np.zeros(2 * capacity, dtype=np.float64)
+        self._points[:, :keep] = points
+        self._points[:, capacity:capacity + keep] = points
+        self._times[:keep] = times
+        self._times[capacity:capacity + keep] = times
+        self._end = keep % capacity
+        np.minimum(self.lengths, keep, out=self.lengths)
+
+
+class SharedPositionSource:
+    """
+    多条轨迹共享的批量位置来源
+
+    provider 可以是返回 (N, 3) 数组的函数（如 Taichi 场的 ``field.to_numpy``），
+    也可以是直接共享的 (N, 2|3) 数组缓冲。每帧调用一次 refresh()，或调用 invalidate()
+    让本帧第一次读取时再刷新，只做一次设备到主机的拷贝；各轨迹通过 point_func(i)
+    读取快照的第 i 行。
+    """
+
+    def __init__(self, provider: Callable[[], np.ndarray] | np.ndarray):
+        self.provider = provider
+        self.positions = np.zeros((0, 3), dtype=np.float32)
+        self._stale = False
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def refresh(self) -> np.ndarray:
+        """读取一次 provider，返回 (N, 3) float32 快照"""
+        data = self.provider() if callable(self.provider) else self.provider
+        data = np.asarray(data, dtype=np.float32)
+        if data.ndim == 1:
+            data = data.reshape(-1, 3)
+        if data.shape[1] == 2:
+            data = np.column_stack([data, np.zeros(len(data), dtype=np.float32)])
+        self.positions = data
+        self._stale = False
+        return data
+
+    def invalidate(self) -> None:
+        """标记快照过期，下一次读取时才调用 provider"""
+        self._stale = True
+
+    def current(self) -> np.ndarray:
+        """当前快照（过期时先刷新）"""
+        if self._stale:
+            self.refresh()
+        return self.positions
+
+    def point_func(self, index: int) -> Callable[[], Vect3]:
+        """第 index 个位置的读取函数（读快照；快照过期时由第一次读取触发刷新）"""
+        return lambda: self.current()[index]
+
+
 class TracingTailPMobject(PMobject):
     """
     高性能轨迹尾迹 PMobject
@@ -222,9 +510,8 @@ class TracingTailPMobject(PMobject):
         self._recent_distances: Deque[float] = deque(maxlen=self._distance_history_limit)
         self._bootstrap_pending: bool = True
         
-        # 轨迹历史存储
-        self.tail_points: Deque[Vect3] = deque(maxlen=max_tail_length)
-        self.tail_times: Deque[float] = deque(maxlen=max_tail_length)
+        # 轨迹历史存储（固定容量 NumPy 环形缓冲）
+        self.tail_buffer = TailRingBuffer(max_tail_length)
         self.current_time: float = 0.0
         
         # 预分配缓冲区（避免每次更新都创建新数组）
@@ -254,8 +541,16 @@ class TracingTailPMobject(PMobject):
         self._rgba_cache = np.zeros((buffer_size, 4), dtype=np.float32)
         self._prev_dir_cache = np.zeros((buffer_size, 3), dtype=np.float32)
         self._next_dir_cache = np.zeros((buffer_size, 3), dtype=np.float32)
-        self._points_temp = np.zeros((max_length, 3), dtype=np.float32)
-        self._times_temp = np.zeros(max_length, dtype=np.float32)
+
+    @property
+    def tail_points(self) -> np.ndarray:
+        """当前轨迹点（旧 -> 新，只读视图）"""
+        return self.tail_buffer.points
+
+    @property
+    def tail_times(self) -> np.ndarray:
+        """当前轨迹时间戳（旧 -> 新，只读视图）"""
+        return self.tail_buffer.times
 
     def _reset_distance_history_from_array(self, points: np.ndarray) -> None:
         """根据当前轨迹点重建步长历史。"""
@@ -265,10 +560,8 @@ class TracingTailPMobject(PMobject):
         diffs = np.linalg.norm(np.diff(points, axis=0), axis=1)
         if diffs.size == 0:
             return
-        limit = self._distance_history_limit
-        for value in diffs[-limit:]:
-            if np.isfinite(value):
-                self._recent_distances.append(float(value))
+        diffs = diffs[-self._distance_history_limit:]
+        self._recent_distances.extend(diffs[np.isfinite(diffs)].tolist())
 
     def _register_step_distance(self, distance: float) -> None:
         if distance >= 1e-6:
@@ -296,10 +589,8 @@ class TracingTailPMobject(PMobject):
 
         self._bootstrap_pending = True
         self._recent_distances.clear()
-        self.tail_points.append(initial_point)
-        self.tail_points.append(second_point)
-        self.tail_times.append(0.0)
-        self.tail_times.append(0.001)  # 极小的时间差
+        self.tail_buffer.append(initial_point, 0.0)
+        self.tail_buffer.append(second_point, 0.001)  # 极小的时间差
         self._register_step_distance(float(np.linalg.norm(second_point - initial_point)))
         self._update_tail_data()
         self._log("init empty tail")
@@ -325,32 +616,28 @@ class TracingTailPMobject(PMobject):
             return self
         new_point = np.array(new_point, dtype=np.float32)
         
-        history_rebuild_required = False
-
+        buffer = self.tail_buffer
         last_point_before_append = None
 
         # 检查是否与最后一个点距离过大（防止首尾相连）
-        if len(self.tail_points) > 0:
-            last_point_before_append = self.tail_points[-1]
+        if len(buffer) > 0:
+            last_point_before_append = buffer.points[-1].copy()
             distance = float(np.linalg.norm(new_point - last_point_before_append))
             threshold = self._current_jump_threshold()
-            self._log(f"distance={distance:.4f}, threshold={threshold:.4f}, len={len(self.tail_points)}")
+            self._log(f"distance={distance:.4f}, threshold={threshold:.4f}, len={len(buffer)}")
             if distance > threshold:
                 self._log("distance exceeds threshold, reset tail")
-                self.tail_points.clear()
-                self.tail_times.clear()
+                buffer.clear()
                 self._recent_distances.clear()
                 self._recent_distances.append(distance)
-                self.tail_points.append(new_point)
-                self.tail_times.append(self.current_time)
+                buffer.append(new_point, self.current_time)
                 self._update_tail_data()
                 self._bootstrap_pending = False
                 return self
             self._register_step_distance(distance)
         
         # 始终添加新点
-        self.tail_points.append(new_point)
-        self.tail_times.append(self.current_time)
+        buffer.append(new_point, self.current_time)
 
         if self._bootstrap_pending and last_point_before_append is not None:
             direction = new_point - last_point_before_append
@@ -365,12 +652,9 @@ class TracingTailPMobject(PMobject):
             prev_point = (new_point - direction_unit * offset_length).astype(np.float32)
             prev_time = max(self.current_time - max(dt, 1e-3), 0.0)
 
-            self.tail_points.clear()
-            self.tail_times.clear()
-            self.tail_points.append(prev_point)
-            self.tail_points.append(new_point)
-            self.tail_times.append(prev_time)
-            self.tail_times.append(self.current_time)
+            buffer.clear()
+            buffer.append(prev_point, prev_time)
+            buffer.append(new_point, self.current_time)
 
             self._recent_distances.clear()
             self._register_step_distance(float(np.linalg.norm(new_point - prev_point)))
@@ -379,61 +663,31 @@ class TracingTailPMobject(PMobject):
             self._log("bootstrap resolved")
             return self
         
-        # 基于时间和最大长度管理点的数量
+        n_dropped = 0
         if self.tail_lifetime < np.inf:
-            # 计算相关点的数量
+            # 基于帧间隔估算的相关点数量，保留最新的点（至少2个）
             n_relevant_points = max(2, int(self.tail_lifetime / (dt + 1e-8)))
-            n_current_points = len(self.tail_points)
-            
-            if n_current_points > n_relevant_points:
-                # 如果点太多，保留最新的点
-                excess_points = n_current_points - n_relevant_points
-                for _ in range(excess_points):
-                    if len(self.tail_points) > 2:  # 至少保留2个点
-                        self.tail_points.popleft()
-                        self.tail_times.popleft()
-                        history_rebuild_required = True
-                if excess_points > 0:
-                    self._log(f"trimmed {excess_points} points for lifetime")
-            
-            # 定期清理
-            if n_current_points > 10 * n_relevant_points:
-                # 保留最新的相关点
-                points_to_keep = list(self.tail_points)[-n_relevant_points:]
-                times_to_keep = list(self.tail_times)[-n_relevant_points:]
-                self.tail_points.clear()
-                self.tail_times.clear()
-                self.tail_points.extend(points_to_keep)
-                self.tail_times.extend(times_to_keep)
-                history_rebuild_required = True
-                self._log("mass trim applied")
+            n_dropped += buffer.keep_last(n_relevant_points)
         
-        # 移除过老的点（基于时间的额外清理）
-        while (len(self.tail_times) > 2 and 
-               self.current_time - self.tail_times[0] > self.tail_lifetime):
-            self.tail_points.popleft()
-            self.tail_times.popleft()
-            history_rebuild_required = True
-            self._log("removed expired point")
-
-        if history_rebuild_required:
-            if len(self.tail_points) >= 2:
-                points_snapshot = np.array(list(self.tail_points), dtype=np.float32)
-                self._reset_distance_history_from_array(points_snapshot)
-            else:
-                self._recent_distances.clear()
+        # 移除过老的点（基于时间戳的向量化清理，至少保留2个）
+        n_dropped += buffer.expire(self.current_time, self.tail_lifetime, min_keep=2)
+        if n_dropped:
+            self._log(f"trimmed {n_dropped} points for lifetime")
+            self._reset_distance_history_from_array(buffer.points)
             self._log("rebuilt distance history")
         
         # 更新渲染数据
         self._update_tail_data()
-        self._log(f"update complete, len={len(self.tail_points)}")
+        self._log(f"update complete, len={len(buffer)}")
         return self
 
     def _update_tail_data(self) -> None:
         """更新轨迹的渲染数据 - 完全向量化优化版本"""
-        if len(self.tail_points) < 2:
+        buffer = self.tail_buffer
+        if len(buffer) < 2:
             # 如果点不够，创建最小数据
-            points = np.array([self.tail_points[0], self.tail_points[0] + np.array([0.001, 0, 0])]) if len(self.tail_points) == 1 else np.array([ORIGIN, ORIGIN + np.array([0.001, 0, 0])])
+            anchor = buffer.points[0] if len(buffer) == 1 else ORIGIN
+            points = np.array([anchor, anchor + np.array([0.001, 0, 0])])
             self.set_points(points)
             self._bootstrap_pending = True
             self._recent_distances.clear()
@@ -453,23 +707,15 @@ class TracingTailPMobject(PMobject):
                 self.data['next_dir'][:] = zero_dirs
             return
 
-        # 转换为numpy数组（复用缓冲区）
-        n_points = len(self.tail_points)
-        points_view = self._points_temp[:n_points]
-        times_view = self._times_temp[:n_points]
-        
-        for i, (pt, tm) in enumerate(zip(self.tail_points, self.tail_times)):
-            points_view[i] = pt
-            times_view[i] = tm
-        
-        points = points_view.copy()  # 复制避免引用问题
-        times = times_view.copy()
+        # 环形缓冲的连续视图（旧 -> 新）
+        points = buffer.points
+        times = buffer.times
         
         # 检测并修复首尾相连问题（强化版）
         points, times, trimmed = self._detect_and_fix_wraparound(points, times)
         if trimmed:
-            self.tail_points = deque(list(points), maxlen=self.max_tail_length)
-            self.tail_times = deque(list(times), maxlen=self.max_tail_length)
+            buffer.set(points, times)
+            points, times = buffer.points, buffer.times
             self._reset_distance_history_from_array(points)
             if len(points) < 2:
                 self._recent_distances.clear()
@@ -486,10 +732,8 @@ class TracingTailPMobject(PMobject):
                 # 找到异常跳跃的位置
                 anomaly_idx = np.argmax(distances)
                 # 只保留异常点之后的部分
-                points = points[anomaly_idx + 1:]
-                times = times[anomaly_idx + 1:]
-                self.tail_points = deque(list(points), maxlen=self.max_tail_length)
-                self.tail_times = deque(list(times), maxlen=self.max_tail_length)
+                buffer.drop_oldest(anomaly_idx + 1)
+                points, times = buffer.points, buffer.times
                 self._reset_distance_history_from_array(points)
                 if len(points) < 2:
                     self._recent_distances.clear()
@@ -501,7 +745,7 @@ class TracingTailPMobject(PMobject):
         
         # 向量化计算年龄和进度
         ages = self.current_time - times
-        progress = np.clip(ages / self.tail_lifetime, 0.0, 1.0)
+        progress = np.clip(ages / self.tail_lifetime, 0.0, 1.0).astype(np.float32)
         
         n_segments = len(points) - 1
         if n_segments <= 0:
@@ -607,8 +851,7 @@ class TracingTailPMobject(PMobject):
 
     def clear_tail(self) -> Self:
         """清空轨迹历史"""
-        self.tail_points.clear()
-        self.tail_times.clear()
+        self.tail_buffer.clear()
         self.current_time = 0.0
         self._recent_distances.clear()
         self._init_empty_tail()
@@ -650,6 +893,14 @@ class MultiTracingTails(PMobject):
     
     高效管理多个轨迹尾迹，支持批量更新和渲染。
     用于大量粒子系统的轨迹追踪。
+
+    两种输入模式:
+    - traced_functions: 每条轨迹一个位置函数（逐轨迹更新）
+    - initial_positions: 数组模式，每帧通过 update_all_tails(dt, positions)
+      传入一个 (n_tails, 3) 位置数组；传送检测、过期清理、平滑和顶点构建
+      都在 (n_tails, capacity) 的 TailRingBuffer2D 上以数组运算完成
+    - position_provider: 批量位置来源（返回 (N, 3) 的函数、共享数组或
+      SharedPositionSource），数组模式下 update_all_tails(dt) 每帧只读取一次
     """
     
     shader_folder: str = str(Path(Path(__file__).parent.parent, "tracing_tail_glow_shader"))
@@ -669,7 +920,7 @@ class MultiTracingTails(PMobject):
 
     def __init__(
         self,
-        traced_functions: Sequence[Callable[[], Vect3]],
+        traced_functions: Optional[Sequence[Callable[[], Vect3]]] = None,
         colors: Optional[Sequence[ManimColor]] = None,
         max_tail_length: int = 100,
         tail_lifetime: float = 2.0,
@@ -683,10 +934,27 @@ class MultiTracingTails(PMobject):
         teleport_fallback: float | None = None,
         teleport_min_threshold: float = 0.6,
         teleport_history: int = 64,
+        initial_positions: Optional[Vect3Array] = None,
+        position_provider: Callable[[], Vect3Array] | np.ndarray | SharedPositionSource | None = None,
         **kwargs
     ):
+        if traced_functions is None and initial_positions is None and position_provider is None:
+            raise ValueError("MultiTracingTails 需要 traced_functions、initial_positions 或 position_provider")
         self.traced_functions = traced_functions
-        self.n_tails = len(traced_functions)
+        # 自建的来源由本对象每帧刷新；外部传入的 SharedPositionSource 由调用方刷新
+        self._owns_position_source = not isinstance(position_provider, SharedPositionSource)
+        if position_provider is None or traced_functions is not None:
+            self._position_source = None
+        elif self._owns_position_source:
+            self._position_source = SharedPositionSource(position_provider)
+        else:
+            self._position_source = position_provider
+        if traced_functions is None:
+            if initial_positions is None:
+                initial_positions = self._position_source.positions.copy()
+            initial_positions = np.asarray(initial_positions, dtype=np.float32).reshape(-1, 3)
+        self._initial_positions = initial_positions if traced_functions is None else None
+        self.n_tails = len(traced_functions) if traced_functions is not None else len(initial_positions)
         self.max_tail_length = max_tail_length
         self._validate_smoothing_mode(smoothing_mode)
         self.smoothing_mode = smoothing_mode
@@ -710,12 +978,23 @@ class MultiTracingTails(PMobject):
             colors = [np.array([1.0, 0.5, 0.2]) for _ in range(self.n_tails)]
         self.colors = colors
         
-        # 轨迹历史存储（每个轨迹独立）
-        self.tail_histories = [deque(maxlen=self._history_capacity) for _ in range(self.n_tails)]
-        self.tail_time_histories = [deque(maxlen=self._history_capacity) for _ in range(self.n_tails)]
-        self._distance_histories = [deque(maxlen=self._distance_history_limit) for _ in range(self.n_tails)]
-        self._bootstrap_flags = [True for _ in range(self.n_tails)]
         self.current_time = 0.0
+        if self.batch_mode:
+            # 数组模式：结构数组存储，步长历史为 (n_tails, history) 的 NaN 填充矩阵
+            self._batch_store = TailRingBuffer2D(self.n_tails, self._history_capacity)
+            self._batch_distance_history = np.full(
+                (self.n_tails, self._distance_history_limit), np.nan, dtype=np.float32
+            )
+            self._batch_history_col = 0
+            self._batch_bootstrap = np.ones(self.n_tails, dtype=bool)
+            self._batch_colors = None
+            self._batch_colors_source = None
+        else:
+            # 轨迹历史存储（每个轨迹独立）
+            self.tail_histories = [deque(maxlen=self._history_capacity) for _ in range(self.n_tails)]
+            self.tail_time_histories = [deque(maxlen=self._history_capacity) for _ in range(self.n_tails)]
+            self._distance_histories = [deque(maxlen=self._distance_history_limit) for _ in range(self.n_tails)]
+            self._bootstrap_flags = [True for _ in range(self.n_tails)]
 
         # 预分配 GPU 侧缓冲区容量
         base_capacity = max(2, self.n_tails * max(2, self._history_capacity - 1) * 2)
@@ -724,6 +1003,11 @@ class MultiTracingTails(PMobject):
         super().__init__(**kwargs)
         self._init_all_tails()
 
+    @property
+    def batch_mode(self) -> bool:
+        """是否为数组输入模式"""
+        return self.traced_functions is None
+
     def _allocate_gpu_cache(self, capacity: int) -> None:
         """预分配并缓存 GPU 顶点及属性缓冲，避免频繁重建。"""
         self._vertex_capacity = max(2, capacity)
@@ -789,6 +1073,13 @@ class MultiTracingTails(PMobject):
 
     def _init_all_tails(self) -> None:
         """初始化所有轨迹"""
+        if self.batch_mode:
+            self._batch_store.append(self._initial_positions, 0.0)
+            self._record_batch_distances(np.full(self.n_tails, 1e-4, dtype=np.float32))
+            self._initial_positions = None
+            self._update_all_tail_data()
+            return
+
         for i in range(self.n_tails):
             try:
                 initial_point = self.traced_functions[i]()
@@ -803,11 +1094,31 @@ class MultiTracingTails(PMobject):
         
         self._update_all_tail_data()
 
-    def update_all_tails(self, dt: float) -> Self:
-        """批量更新所有轨迹 - 优化版本，参考TracedPath逻辑"""
+    def update_all_tails(self, dt: float, positions: Optional[Vect3Array] = None) -> Self:
+        """
+        批量更新所有轨迹 - 优化版本，参考TracedPath逻辑
+
+        Args:
+            dt: 时间步长
+            positions: 数组模式下本帧的 (n_tails, 3) 位置数组；
+                省略时从 position_provider 读取一次
+        """
         if dt == 0:
             return self
-            
+
+        if self.batch_mode:
+            if positions is None and self._position_source is not None:
+                source = self._position_source
+                positions = source.refresh() if self._owns_position_source else source.current()
+            if positions is None:
+                raise ValueError("数组模式下 update_all_tails 需要传入 positions 或设置 position_provider")
+            self.current_time += dt
+            self._update_batch_tails(dt, positions)
+            self._update_all_tail_data()
+            return self
+        if positions is not None:
+            raise ValueError("positions 仅用于数组模式（以 initial_positions 构造）")
+
         self.current_time += dt
         history_rebuild_flags = [False] * self.n_tails
         
@@ -919,8 +1230,194 @@ class MultiTracingTails(PMobject):
         self._update_all_tail_data()
         return self
 
+    # ==================== 数组模式 ====================
+
+    def _record_batch_distances(self, distances: np.ndarray, reset: np.ndarray | None = None) -> None:
+        """
+        向步长历史矩阵写入一列；reset 选中的轨迹先清空历史
+
+        小于 1e-6 的步长记为缺失（NaN），与逐轨迹模式的登记规则一致。
+        """
+        history = self._batch_distance_history
+        if reset is not None and np.any(reset):
+            history[reset] = np.nan
+        col = self._batch_history_col
+        history[:, col] = np.where(distances >= 1e-6, distances, np.nan)
+        self._batch_history_col = (col + 1) % history.shape[1]
+
+    def _reset_batch_distances(self, mask: np.ndarray, distances: np.ndarray) -> None:
+        """用单个步长重置 mask 选中轨迹的历史（写在最近一列）"""
+        history = self._batch_distance_history
+        history[mask] = np.nan
+        history[mask, (self._batch_history_col - 1) % history.shape[1]] = distances[mask]
+
+    def _update_batch_tails(self, dt: float, positions: Vect3Array) -> None:
+        """数组模式的单帧更新：所有判定都是 (n_tails,) 掩码运算"""
+        store = self._batch_store
+        new_points = np.asarray(positions, dtype=np.float32).reshape(self.n_tails, 3)
+        last_points = store.last_points()
+
+        # 无效位置视为静止（共享写指针要求每条轨迹每帧都写一列）
+        finite = np.all(np.isfinite(new_points), axis=1)
+        if not np.all(finite):
+            new_points = np.where(finite[:, None], new_points, last_points)
+
+        distances = np.linalg.norm(new_points - last_points, axis=1)
+        thresholds = _compute_dynamic_jump_thresholds(
+            self._batch_distance_history,
+            fallback=self._teleport_fallback,
+            min_threshold=self._teleport_min_threshold,
+        )
+        teleport = finite & (distances > thresholds)
+
+        store.append(new_points, self.current_time)
+        self._record_batch_distances(np.where(finite, distances, 0.0))
+
+        # 传送：只保留新点，重新开始
+        if np.any(teleport):
+            store.lengths[teleport] = 1
+            self._reset_batch_distances(teleport, distances)
+            self._batch_bootstrap[teleport] = False
+
+        # 引导：用沿运动方向的短偏移点替换上一点，得到第一段
+        bootstrap = self._batch_bootstrap & finite & ~teleport
+        if np.any(bootstrap):
+            direction = new_points[bootstrap] - last_points[bootstrap]
+            norm = distances[bootstrap]
+            moving = norm >= 1e-7
+            unit = np.tile(np.array([1.0, 0.0, 0.0], dtype=np.float32), (len(norm), 1))
+            unit[moving] = direction[moving] / norm[moving, None]
+            offset = np.where(moving, np.clip(norm * 0.25, 1e-4, 5e-2), 1e-4).astype(np.float32)
+            store.set_previous(bootstrap, new_points[bootstrap] - unit * offset[:, None])
+            store.lengths[bootstrap] = 2
+            offsets = np.zeros(self.n_tails, dtype=np.float32)
+            offsets[bootstrap] = offset
+            self._reset_batch_distances(bootstrap, offsets)
+            self._batch_bootstrap[bootstrap] = False
+
+        # 基于时间和最大长度管理点
+        regular = ~teleport & ~bootstrap
+        lengths = store.lengths
+        if self.tail_lifetime < np.inf:
+            n_relevant_points = max(2, int(self.tail_lifetime / (dt + 1e-8)))
+            np.minimum(lengths, np.where(regular, n_relevant_points, lengths), out=lengths)
+
+        # 时间戳在所有轨迹间共享，二分一次即可得到未过期的列数
+        window_len = int(lengths.max())
+        _, times = store.window(window_len)
+        n_alive = window_len - int(np.searchsorted(times, self.current_time - self.tail_lifetime, side="left"))
+        expire = regular & (lengths > 2)
+        lengths[expire] = np.maximum(np.minimum(lengths[expire], n_alive), 2)
+
+        self._batch_bootstrap[regular & (lengths < 2)] = True
+
+    def _get_batch_colors(self) -> np.ndarray:
+        """(n_tails, 3) 颜色矩阵，仅在 colors 被替换时重建"""
+        if self._batch_colors is None or self._batch_colors_source is not self.colors:
+            rgb = np.ones((self.n_tails, 3), dtype=np.float32)
+            for idx, color in enumerate(self.colors[:self.n_tails]):
+                rgb[idx] = _color_to_rgb(color)
+            self._batch_colors = rgb
+            self._batch_colors_source = self.colors
+        return self._batch_colors
+
+    def _batch_fast_average(self, points: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """_fast_average 的批量版本：每行首个有效点与最后一个点保持不动"""
+        rows = np.arange(len(starts))
+        smoothed = points.copy()
+        for _ in range(2):
+            source = smoothed.copy()
+            smoothed[:, 1:-1] = 0.25 * source[:, :-2] + 0.5 * source[:, 1:-1] + 0.25 * source[:, 2:]
+            smoothed[rows, starts] = source[rows, starts]
+        return smoothed
+
+    def _update_batch_tail_data(self) -> None:
+        """数组模式的渲染数据构建：一次性对所有轨迹向量化"""
+        store = self._batch_store
+        lengths = store.lengths
+        window_len = int(lengths.max())
+        if window_len < 2:
+            self._set_empty_tail_data()
+            return
+
+        points, times = store.window(window_len)
+        starts = window_len - lengths
+        if window_len >= 3:
+            # 数组模式下所有平滑模式都使用双通道均值滤波（贝塞尔重采样长度不一致，无法批量化）
+            points = self._batch_fast_average(points, starts)
+
+        progress = np.clip((self.current_time - times) / self.tail_lifetime, 0.0, 1.0).astype(np.float32)
+        prev_dirs, next_dirs = _compute_batch_neighbor_directions(points, starts)
+
+        # 第 j 段（j -> j+1）有效当且仅当 j >= starts[i]；按行优先展开，保持每条轨迹连续
+        seg_valid = np.arange(window_len - 1)[None, :] >= starts[:, None]
+        rows, cols = np.nonzero(seg_valid)
+        n_verts = len(rows) * 2
+        if n_verts == 0:
+            self._set_empty_tail_data()
+            return
+        self._ensure_gpu_capacity(n_verts)
+
+        self._line_points_buffer[0:n_verts:2] = points[rows, cols]
+        self._line_points_buffer[1:n_verts:2] = points[rows, cols + 1]
+        self._prev_dir_buffer[0:n_verts:2] = prev_dirs[rows, cols]
+        self._prev_dir_buffer[1:n_verts:2] = prev_dirs[rows, cols + 1]
+        self._next_dir_buffer[0:n_verts:2] = next_dirs[rows, cols]
+        self._next_dir_buffer[1:n_verts:2] = next_dirs[rows, cols + 1]
+
+        prog_view = self._progress_buffer[:n_verts]
+        prog_view[0::2] = progress[cols]
+        prog_view[1::2] = progress[cols + 1]
+
+        width_start, width_end = self.width_fade
+        opacity_start, opacity_end = self.opacity_fade
+        self._width_buffer[:n_verts] = width_start + (width_end - width_start) * prog_view
+        self._opacity_buffer[:n_verts] = opacity_start + (opacity_end - opacity_start) * prog_view
+        self._glow_buffer[:n_verts] = self.glow_factor * (1.0 - prog_view * 0.5)
+
+        colors = self._get_batch_colors()[rows]
+        self._color_buffer[0:n_verts:2] = colors
+        self._color_buffer[1:n_verts:2] = colors
+
+        self._upload_vertex_data(n_verts)
+
+    def _set_empty_tail_data(self) -> None:
+        """没有可绘制线段时写入最小的不可见数据"""
+        self.set_points(np.array([ORIGIN, ORIGIN + np.array([0.001, 0, 0])]))
+        if self.has_points():
+            n_points = 2
+            self.data['tail_progress'][:, 0] = np.zeros(n_points)
+            self.data['tail_width'][:, 0] = np.full(n_points, 0.001)
+            self.data['glow_intensity'][:, 0] = np.zeros(n_points)
+            self.data['rgba'][:] = np.tile([1, 1, 1, 0], (n_points, 1))
+            zero_dirs = np.zeros((n_points, 3), dtype=np.float32)
+            self.data['prev_dir'][:] = zero_dirs
+            self.data['next_dir'][:] = zero_dirs
+
+    def _upload_vertex_data(self, n_verts: int) -> None:
+        """把预分配缓冲区的前 n_verts 个顶点一次性写入 data"""
+        active_slice = slice(0, n_verts)
+        self.set_points(self._line_points_buffer[active_slice].copy())
+
+        if self.has_points():
+            self.data['tail_progress'][:, 0] = self._progress_buffer[active_slice]
+            self.data['tail_width'][:, 0] = self._width_buffer[active_slice]
+            self.data['glow_intensity'][:, 0] = self._glow_buffer[active_slice]
+            self.data['prev_dir'][:] = self._prev_dir_buffer[active_slice]
+            self.data['next_dir'][:] = self._next_dir_buffer[active_slice]
+
+            # 组合 RGBA（原地操作）
+            rgba_view = self._rgba_cache[:n_verts]
+            rgba_view[:, :3] = self._color_buffer[active_slice]
+            rgba_view[:, 3] = self._opacity_buffer[active_slice]
+            self.data['rgba'][:] = rgba_view
+
     def _update_all_tail_data(self) -> None:
         """批量更新所有轨迹的渲染数据 - 超级优化版本，最小化内存分配和循环"""
+        if self.batch_mode:
+            self._update_batch_tail_data()
+            return
+
         # 第一阶段：快速验证和数据收集（最小化临时对象）
         n_valid = 0
         for tail_idx in range(self.n_tails):
@@ -929,16 +1426,7 @@ class MultiTracingTails(PMobject):
         
         if n_valid == 0:
             # 创建最小数据
-            self.set_points(np.array([ORIGIN, ORIGIN + np.array([0.001, 0, 0])]))
-            if self.has_points():
-                n_points = 2
-                self.data['tail_progress'][:, 0] = np.zeros(n_points)
-                self.data['tail_width'][:, 0] = np.full(n_points, 0.001)
-                self.data['glow_intensity'][:, 0] = np.zeros(n_points)
-                self.data['rgba'][:] = np.tile([1, 1, 1, 0], (n_points, 1))
-                zero_dirs = np.zeros((n_points, 3), dtype=np.float32)
-                self.data['prev_dir'][:] = zero_dirs
-                self.data['next_dir'][:] = zero_dirs
+            self._set_empty_tail_data()
             return
         
         # 第二阶段：预估总顶点数并确保容量
@@ -1006,19 +1494,7 @@ class MultiTracingTails(PMobject):
             
             # 获取颜色（处理不同的颜色格式）
             if tail_idx < len(self.colors):
-                tail_color = self.colors[tail_idx]
-                # 如果已经是 numpy 数组（RGB格式），直接使用
-                if isinstance(tail_color, np.ndarray):
-                    if len(tail_color) == 3:
-                        color_rgb = tail_color.astype(np.float32)
-                    elif len(tail_color) == 4:
-                        color_rgb = tail_color[:3].astype(np.float32)
-                    else:
-                        color_rgb = np.array([1.0, 1.0, 1.0], dtype=np.float32)
-                else:
-                    # 使用 color_to_rgba 转换
-                    color_rgba = color_to_rgba(tail_color)
-                    color_rgb = np.array([color_rgba[0], color_rgba[1], color_rgba[2]], dtype=np.float32)
+                color_rgb = _color_to_rgb(self.colors[tail_idx])
             else:
                 # 默认白色
                 color_rgb = np.array([1.0, 1.0, 1.0], dtype=np.float32)
@@ -1060,21 +1536,7 @@ class MultiTracingTails(PMobject):
         if point_idx == 0:
             return
         
-        active_slice = slice(0, point_idx)
-        self.set_points(self._line_points_buffer[active_slice].copy())
-        
-        if self.has_points():
-            self.data['tail_progress'][:, 0] = self._progress_buffer[active_slice]
-            self.data['tail_width'][:, 0] = self._width_buffer[active_slice]
-            self.data['glow_intensity'][:, 0] = self._glow_buffer[active_slice]
-            self.data['prev_dir'][:] = self._prev_dir_buffer[active_slice]
-            self.data['next_dir'][:] = self._next_dir_buffer[active_slice]
-            
-            # 组合 RGBA（原地操作）
-            rgba_view = self._rgba_cache[:point_idx]
-            rgba_view[:, :3] = self._color_buffer[active_slice]
-            rgba_view[:, 3] = self._opacity_buffer[active_slice]
-            self.data['rgba'][:] = rgba_view
+        self._upload_vertex_data(point_idx)
 
     def _apply_smoothing_pipeline(self, points: np.ndarray) -> np.ndarray:
         if len(points) < 3:
@@ -1134,6 +1596,11 @@ class MultiTracingTails(PMobject):
         return smoothed
 
     def _resize_tail_histories(self) -> None:
+        if self.batch_mode:
+            self._batch_store.resize(self._history_capacity)
+            new_capacity = max(2, self.n_tails * max(2, self._history_capacity - 1) * 2)
+            self._allocate_gpu_cache(new_capacity)
+            return
         for idx in range(self.n_tails):
             points_snapshot = list(self.tail_histories[idx])[-self._history_capacity:]
             times_snapshot = list(self.tail_time_histories[idx])[-self._history_capacity:]
@@ -1166,3 +1633,241 @@ class MultiTracingTails(PMobject):
             self._history_capacity = new_capacity
             self._resize_tail_histories()
         return self
+
+
+class IncrementalTracingTails(PMobject):
+    """
+    增量上传的多轨迹尾迹
+
+    顶点缓冲常驻：每条轨迹占 (max_tail_length - 1) 个线段槽位，所有轨迹共享
+    一个环形写指针；缓冲按槽位主序排列（同一槽位的各条轨迹相邻）。每帧只写入
+    新追加的一段（以及上一段末端的 next_dir）和 time uniform，即当前槽位与上一
+    槽位两段连续顶点，直接写进已有 VBO；tail_progress、宽度、透明度与辉光由
+    shader 根据顶点的 birth_time 推导，过期线段在几何着色器中丢弃。每帧上传量
+    只与轨迹条数有关，与尾迹长度无关（缓冲首次创建、与其他对象合批或颜色等整体
+    改动时仍整块上传一次）。
+
+    已写入的线段不会再改动，因此不支持平滑（等价于 jagged 模式）。
+    输入方式与 MultiTracingTails 相同：traced_functions、initial_positions
+    （每帧 update_all_tails(dt, positions)）或 position_provider。
+    """
+
+    shader_folder: str = str(Path(Path(__file__).parent.parent, "tracing_tail_incremental_shader"))
+    render_primitive: int = moderngl.LINES
+
+    data_dtype: Sequence[Tuple[str, type, Tuple[int]]] = [
+        ('point', np.float32, (3,)),
+        ('rgba', np.float32, (4,)),
+        ('birth_time', np.float32, (1,)),      # 顶点写入时刻，shader 据此计算进度
+        ('prev_dir', np.float32, (3,)),
+        ('next_dir', np.float32, (3,)),
+    ]
+
+    # 未写入/已清除槽位的出生时间：进度恒为 1，被 shader 丢弃
+    DEAD_TIME: float = -1e9
+
+    def __init__(
+        self,
+        traced_functions: Optional[Sequence[Callable[[], Vect3]]] = None,
+        colors: Optional[Sequence[ManimColor]] = None,
+        max_tail_length: int = 100,
+        tail_lifetime: float = 2.0,
+        opacity_fade: Tuple[float, float] = (1.0, 0.0),
+        width_fade: Tuple[float, float] = (0.04, 0.01),
+        glow_factor: float = 2.0,
+        glow_falloff: float = 0.5,
+        anti_alias_width: float = 0.05,
+        teleport_threshold: float = 3.0,
+        initial_positions: Optional[Vect3Array] = None,
+        position_provider: Callable[[], Vect3Array] | np.ndarray | SharedPositionSource | None = None,
+        **kwargs
+    ):
+        if traced_functions is None and initial_positions is None and position_provider is None:
+            raise ValueError("IncrementalTracingTails 需要 traced_functions、initial_positions 或 position_provider")
+        self.traced_functions = traced_functions
+        self._owns_position_source = not isinstance(position_provider, SharedPositionSource)
+        if position_provider is None or traced_functions is not None:
+            self._position_source = None
+        elif self._owns_position_source:
+            self._position_source = SharedPositionSource(position_provider)
+        else:
+            self._position_source = position_provider
+
+        if traced_functions is not None:
+            initial_positions = self._read_traced_functions(np.zeros((len(traced_functions), 3), dtype=np.float32))
+        elif initial_positions is None:
+            initial_positions = self._position_source.positions
+        initial_positions = np.array(initial_positions, dtype=np.float32).reshape(-1, 3)
+
+        self.n_tails = len(initial_positions)
+        self.max_tail_length = max_tail_length
+        self.n_slots = max(1, int(max_tail_length) - 1)
+        self.tail_lifetime = tail_lifetime
+        self.opacity_fade = opacity_fade
+        self.width_fade = width_fade
+        self.glow_factor = glow_factor
+        self.glow_falloff = glow_falloff
+        self.anti_alias_width = float(anti_alias_width)
+        self.teleport_threshold = float(teleport_threshold)
+        if colors is None:
+            colors = [np.array([1.0, 0.5, 0.2]) for _ in range(self.n_tails)]
+        self.colors = colors
+
+        self.current_time = 0.0
+        self._slot = 0
+        self._last_points = initial_positions
+        self._last_dirs = np.tile(np.array([1.0, 0.0, 0.0], dtype=np.float32), (self.n_tails, 1))
+        self._has_segment = np.zeros(self.n_tails, dtype=bool)
+        # 槽位主序：第 k 个槽位占顶点 [k * n_tails * 2, (k + 1) * n_tails * 2)，轨迹 i 的起点在其中偏移 2i
+        self._tail_offsets = (np.arange(self.n_tails) * 2).astype(np.intp)
+
+        super().__init__(**kwargs)
+        self._init_vertex_buffer()
+
+    def init_uniforms(self) -> None:
+        super().init_uniforms()
+        self.uniforms["time"] = 0.0
+        self.uniforms["tail_lifetime"] = self.tail_lifetime
+        self.uniforms["glow_factor"] = self.glow_factor
+        self.uniforms["glow_falloff"] = self.glow_falloff
+        self.uniforms["anti_alias_width"] = self.anti_alias_width
+        self.uniforms["width_start"], self.uniforms["width_end"] = map(float, self.width_fade)
+        self.uniforms["opacity_start"], self.uniforms["opacity_end"] = map(float, self.opacity_fade)
+
+    def _init_vertex_buffer(self) -> None:
+        """一次性分配常驻顶点缓冲，所有槽位初始为过期状态"""
+        self.set_points(np.tile(np.repeat(self._last_points, 2, axis=0), (self.n_slots, 1)))
+        self.data['birth_time'][:] = self.DEAD_TIME
+        self.data['prev_dir'][:] = self._last_dirs[0]
+        self.data['next_dir'][:] = self._last_dirs[0]
+        self._write_colors()
+
+    def _write_colors(self) -> None:
+        rgb = np.ones((self.n_tails, 3), dtype=np.float32)
+        for idx, color in enumerate(self.colors[:self.n_tails]):
+            rgb[idx] = _color_to_rgb(color)
+        self.data['rgba'][:, :3] = np.tile(np.repeat(rgb, 2, axis=0), (self.n_slots, 1))
+        self.data['rgba'][:, 3] = 1.0
+
+    def _slot_rows(self, slot: int) -> slice:
+        block = self.n_tails * 2
+        return slice(slot * block, (slot + 1) * block)
+
+    def _can_write_in_place(self) -> bool:
+        """已有 VBO 是否恰好保存本对象的顶点（未与其他对象合批，且正被渲染组使用）"""
+        wrapper = self.shader_wrapper
+        if wrapper is None or wrapper.vbo is None or len(wrapper.vert_data) != len(self.data):
+            return False
+        # 场景为每批对象建一个渲染组 Group；待整体重读的祖先无需检查
+        return all(
+            ancestor._data_has_changed
+            or any(w is wrapper for w in getattr(ancestor, "shader_wrappers", ()))
+            for ancestor in self.get_ancestors()
+        )
+
+    def _upload_rows(self, row_slices: Sequence[slice]) -> None:
+        """只把改动的槽位写入已有 VBO；无法原地写入时退回整体上传"""
+        if not self._can_write_in_place():
+            self.note_changed_data()
+            return
+        vbo = self.shader_wrapper.vbo
+        itemsize = self.data.itemsize
+        for rows in row_slices:
+            vbo.write(self.data[rows].tobytes(), offset=rows.start * itemsize)
+
+    def _read_traced_functions(self, fallback: np.ndarray) -> np.ndarray:
+        points = fallback.copy()
+        for i, func in enumerate(self.traced_functions):
+            try:
+                points[i] = func()
+            except Exception:
+                points[i] = np.nan
+        return points
+
+    def update_all_tails(self, dt: float, positions: Optional[Vect3Array] = None) -> Self:
+        """
+        追加一帧：只写入每条轨迹的最新线段
+
+        Args:
+            dt: 时间步长
+            positions: 本帧 (n_tails, 3) 位置；省略时从 traced_functions 或 position_provider 读取
+        """
+        if dt == 0:
+            return self
+
+        if positions is None:
+            if self.traced_functions is not None:
+                positions = self._read_traced_functions(self._last_points)
+            elif self._position_source is not None:
+                source = self._position_source
+                positions = source.refresh() if self._owns_position_source else source.current()
+            else:
+                raise ValueError("update_all_tails 需要传入 positions 或设置 position_provider")
+
+        prev_time = self.current_time
+        self.current_time += dt
+        new_points = np.asarray(positions, dtype=np.float32).reshape(self.n_tails, 3)
+        last_points = self._last_points
+
+        finite = np.all(np.isfinite(new_points), axis=1)
+        if not np.all(finite):
+            new_points = np.where(finite[:, None], new_points, last_points)
+
+        seg = new_points - last_points
+        dist = np.linalg.norm(seg, axis=1)
+        teleport = dist > self.teleport_threshold
+        moving = (dist >= 1e-6) & ~teleport
+        dirs = self._last_dirs.copy()
+        dirs[moving] = seg[moving] / dist[moving, None]
+        continues = self._has_segment & ~teleport
+
+        rows = self._slot_rows(self._slot)
+        changed = [rows]
+        start = rows.start + self._tail_offsets
+        end = start + 1
+        data = self.data
+        data['point'][start] = last_points
+        data['point'][end] = new_points
+        data['birth_time'][start, 0] = np.where(teleport, self.DEAD_TIME, prev_time)
+        data['birth_time'][end, 0] = np.where(teleport, self.DEAD_TIME, self.current_time)
+        data['prev_dir'][start] = np.where(continues[:, None], self._last_dirs, dirs)
+        data['next_dir'][start] = dirs
+        data['prev_dir'][end] = dirs
+        data['next_dir'][end] = dirs
+
+        # 上一段末端的 next_dir 指向新段，保持斜接连续
+        if self.n_slots > 1 and np.any(continues):
+            prev_rows = self._slot_rows((self._slot - 1) % self.n_slots)
+            data['next_dir'][prev_rows.start + self._tail_offsets[continues] + 1] = dirs[continues]
+            changed.append(prev_rows)
+
+        self._has_segment = (self._has_segment | moving) & ~teleport
+        self._last_points = new_points
+        self._last_dirs = dirs
+        self._slot = (self._slot + 1) % self.n_slots
+        self.uniforms["time"] = self.current_time
+        self._upload_rows(changed)
+        return self
+
+    def clear_tails(self) -> Self:
+        """清除所有尾迹（槽位标记为过期，缓冲不重建）"""
+        self.data['birth_time'][:] = self.DEAD_TIME
+        self._has_segment[:] = False
+        self.note_changed_data()
+        return self
+
+    def set_colors(self, colors: Sequence[ManimColor]) -> Self:
+        self.colors = colors
+        self._write_colors()
+        self.note_changed_data()
+        return self
+
+    def set_tail_lifetime(self, lifetime: float) -> Self:
+        self.tail_lifetime = lifetime
+        self.uniforms["tail_lifetime"] = lifetime
+        return self
+
+    def set_glow_factor(self, factor: float) -> Self:
+        self.glow_factor = factor
+        self.uniforms["glow_factor"] = factor
+        return self
@@ -0,0 +1,157 @@
+"""
+VMobject 弧长查找表（LUT）采样器
+
+从 Bezier 控制点一次性构建弧长 LUT（每条曲线细分若干步并累计弦长），
+之后任意一组比例 alpha 都只需一次 searchsorted + 一次向量化 Bezier 求值，
+替代逐点调用 point_from_proportion / quick_point_from_proportion。
+
+LUT 缓存在 VMobject 上，并以控制点数据的哈希校验，形状或位置变化后自动重建。
+
+使用方法:
+    from arc_length_sampler import sample_vmobject_by_arc_length, get_arc_length_lut
+
+    points = sample_vmobject_by_arc_length(circle, 200)      # (200, 3)
+    lut = get_arc_length_lut(circle)
+    positions = lut.evaluate(np.array([0.0, 0.25, 0.5]))   # 任意比例
+"""
+
+from __future__ import annotations
+
+from math import comb
+
+import numpy as np
+
+__all__ = [
+    "ArcLengthLUT",
+    "bezier_controls_from_points",
+    "get_arc_length_lut",
+    "sample_vmobject_by_arc_length",
+]
+
+
+DEFAULT_STEPS_PER_CURVE = 8
+
+
+def _bernstein_basis(degree: int, t: np.ndarray) -> np.ndarray:
+    """Bernstein 基函数矩阵 (len(t), degree + 1)"""
+    t = np.asarray(t, dtype=np.float64)[:, None]
+    k = np.arange(degree + 1)[None, :]
+    coeffs = np.array([comb(degree, i) for i in range(degree + 1)], dtype=np.float64)[None, :]
+    return coeffs * t ** k * (1.0 - t) ** (degree - k)
+
+
+def bezier_controls_from_points(points: np.ndarray) -> np.ndarray:
+    """
+    ManimGL 二次曲线点布局（锚点/控制点交替，相邻曲线共享锚点）-> (n_curves, 3, 3)
+
+    等价于 np.array(list(vmobject.get_bezier_tuples_from_points(points)))，
+    但直接切片，不经过逐曲线生成器。
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n_curves = (len(points) - 1) // 2
+    if n_curves <= 0:
+        return np.zeros((0, 3, 3), dtype=np.float64)
+    points = points[:2 * n_curves + 1]
+    return np.stack([points[0:-1:2], points[1::2], points[2::2]], axis=1)
+
+
+class ArcLengthLUT:
+    """
+    一组 Bezier 曲线的弧长查找表
+
+    每条曲线均匀细分 steps_per_curve 步，cumulative 为所有子段的累计长度。
+    ManimGL 二次曲线布局中用于连接子路径的"跳跃"曲线（handle 与起点重合）
+    长度记为 0，不会在其上采样。
+    """
+
+    def __init__(self, bezier_tuples: np.ndarray, steps_per_curve: int = DEFAULT_STEPS_PER_CURVE):
+        if not isinstance(bezier_tuples, np.ndarray):
+            # ManimGL 的 get_bezier_tuples() 返回生成器
+            bezier_tuples = list(bezier_tuples)
+        controls = np.asarray(bezier_tuples, dtype=np.float64)
+        if controls.ndim != 3 or controls.shape[0] == 0:
+            controls = np.zeros((0, 2, 3), dtype=np.float64)
+        self.controls = controls
+        self.degree = controls.shape[1] - 1
+        self.steps_per_curve = max(1, int(steps_per_curve))
+
+        n_curves = len(controls)
+        if n_curves == 0:
+            self.cumulative = np.zeros(1)
+            self.total = 0.0
+            return
+
+        ts = np.linspace(0.0, 1.0, self.steps_per_curve + 1)
+        samples = np.einsum("sk,nkd->nsd", _bernstein_basis(self.degree, ts), controls)
+        lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2)
+        if self.degree == 2:
+            jumps = np.all(controls[:, 1] == controls[:, 0], axis=1) & np.any(controls[:, 2] != controls[:, 0], axis=1)
+            lengths[jumps] = 0.0
+
+        self.cumulative = np.concatenate([[0.0], np.cumsum(lengths.ravel())])
+        self.total = float(self.cumulative[-1])
+
+    @classmethod
+    def from_points(cls, points: np.ndarray, steps_per_curve: int = DEFAULT_STEPS_PER_CURVE) -> ArcLengthLUT:
+        """由 VMobject 的点数组（或其子路径）直接构建"""
+        return cls(bezier_controls_from_points(points), steps_per_curve=steps_per_curve)
+
+    def __len__(self) -> int:
+        return len(self.controls)
+
+    def evaluate(self, alphas: np.ndarray) -> np.ndarray:
+        """按弧长比例 alphas（0~1）求曲线上的点，返回 (len(alphas), 3)"""
+        alphas = np.clip(np.asarray(alphas, dtype=np.float64).ravel(), 0.0, 1.0)
+        if len(self.controls) == 0:
+            return np.zeros((len(alphas), 3))
+        if self.total <= 0:
+            return np.repeat(self.controls[:1, 0], len(alphas), axis=0)
+
+        n_steps = len(self.cumulative) - 1
+        target = alphas * self.total
+        # side="right" 使落在零长度子段边界上的目标跳到下一段有效曲线
+        idx = np.clip(np.searchsorted(self.cumulative, target, side="right") - 1, 0, n_steps - 1)
+        seg_len = self.cumulative[idx + 1] - self.cumulative[idx]
+        local = np.where(seg_len > 0, (target - self.cumulative[idx]) / np.where(seg_len > 0, seg_len, 1.0), 0.0)
+
+        curve = idx // self.steps_per_curve
+        t = ((idx % self.steps_per_curve) + np.clip(local, 0.0, 1.0)) / self.steps_per_curve
+        basis = _bernstein_basis(self.degree, t)
+        return np.einsum("mk,mkd->md", basis, self.controls[curve])
+
+    def sample(self, count: int, endpoint: bool = False) -> np.ndarray:
+        """沿弧长均匀取 count 个点"""
+        return self.evaluate(np.linspace(0.0, 1.0, max(int(count), 0), endpoint=endpoint))
+
+
+def get_arc_length_lut(vmobject, steps_per_curve: int = DEFAULT_STEPS_PER_CURVE) -> ArcLengthLUT:
+    """
+    获取（必要时构建）VMobject 的弧长 LUT
+
+    缓存在 vmobject 上，以控制点数据的哈希校验；点被修改后自动重建。
+    """
+    points = vmobject.get_points()
+    signature = (points.shape, hash(points.tobytes()), steps_per_curve)
+    cached = getattr(vmobject, "_arc_length_lut_cache", None)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    lut = ArcLengthLUT.from_points(points, steps_per_curve=steps_per_curve)
+    try:
+        vmobject._arc_length_lut_cache = (signature, lut)
+    except AttributeError:
+        pass
+    return lut
+
+
+def sample_vmobject_by_arc_length(
+    vmobject,
+    count: int,
+    endpoint: bool = False,
+    steps_per_curve: int = DEFAULT_STEPS_PER_CURVE,
+) -> np.ndarray:
+    """沿 VMobject 弧长均匀采样 count 个点，返回 (count, 3) float32"""
+    if count <= 0 or not vmobject.has_points():
+        return np.zeros((0, 3), dtype=np.float32)
+    lut = get_arc_length_lut(vmobject, steps_per_curve)
+    return lut.sample(count, endpoint=endpoint).astype(np.float32)
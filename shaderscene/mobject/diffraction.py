@@ -69,6 +69,137 @@ def hsl_to_rgb(hsl):
     return rgb
 
 
+class ExposureField:
+    """
+    多点光源在一组屏幕点上的复振幅 Σ_j exp(i·2π·k·|c - s_j|)
+
+    - 距离矩阵 (N_dots, N_sources) 以 float32 缓存，屏幕点与光源都不动时复用，
+      频率/波数变化只重算相位项
+    - 按行分块计算，每块的差值与相位缓冲区预先分配，不再生成完整的
+      (N_dots, N_sources, 3) 差值张量与 complex128 指数矩阵
+    - n_threads > 1 时按块分给线程池（numpy 运算会释放 GIL）
+    """
+
+    def __init__(self, chunk_size: int = 1024, n_threads: int = 1, max_cached_elements: int = 2 ** 26):
+        """
+        Args:
+            chunk_size: 每块的屏幕点数
+            n_threads: 线程数
+            max_cached_elements: 距离矩阵的缓存上限（元素数），超过时每次重算距离
+        """
+        self.chunk_size = max(1, int(chunk_size))
+        self.n_threads = max(1, int(n_threads))
+        self.max_cached_elements = int(max_cached_elements)
+        self._centers = None
+        self._sources = None
+        self._distances = None
+        self._buffers = {}
+        self._pool = None
+
+    def _get_buffers(self, worker: int, n_sources: int):
+        buffers = self._buffers.get(worker)
+        if buffers is None or buffers[0].shape[:2] != (self.chunk_size, n_sources):
+            buffers = (
+                np.empty((self.chunk_size, n_sources, 3), dtype=np.float32),
+                np.empty((self.chunk_size, n_sources), dtype=np.float32),
+                np.empty((self.chunk_size, n_sources), dtype=np.float32),
+                np.empty((self.chunk_size, n_sources), dtype=np.float32),
+            )
+            self._buffers[worker] = buffers
+        return buffers
+
+    def _chunk_distances(self, centers, sources, start, stop, diff_buf, out):
+        n = stop - start
+        diff = diff_buf[:n]
+        np.subtract(centers[start:stop, None, :], sources[None, :, :], out=diff)
+        np.multiply(diff, diff, out=diff)
+        np.sum(diff, axis=2, out=out[:n])
+        np.sqrt(out[:n], out=out[:n])
+        return out[:n]
+
+    def _run_chunks(self, n_rows: int, work) -> None:
+        """work(worker, start, stop) 按块执行；多线程时每个线程处理间隔的块并使用自己的缓冲区"""
+        starts = range(0, n_rows, self.chunk_size)
+        n_workers = min(self.n_threads, len(starts))
+        if n_workers <= 1:
+            for start in starts:
+                work(0, start, min(start + self.chunk_size, n_rows))
+            return
+
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=self.n_threads)
+
+        def run_worker(worker):
+            for start in starts[worker::n_workers]:
+                work(worker, start, min(start + self.chunk_size, n_rows))
+
+        list(self._pool.map(run_worker, range(n_workers)))
+
+    def _update_distances(self, centers: np.ndarray, sources: np.ndarray) -> bool:
+        """屏幕点或光源变化时重算距离矩阵；返回距离是否可缓存"""
+        if (
+            self._distances is not None
+            and self._centers.shape == centers.shape
+            and self._sources.shape == sources.shape
+            and np.array_equal(self._centers, centers)
+            and np.array_equal(self._sources, sources)
+        ):
+            return True
+
+        self._centers = centers.copy()
+        self._sources = sources.copy()
+        if centers.shape[0] * sources.shape[0] > self.max_cached_elements:
+            self._distances = None
+            return False
+
+        distances = np.empty((len(centers), len(sources)), dtype=np.float32)
+
+        def work(worker, start, stop):
+            diff_buf = self._get_buffers(worker, len(sources))[0]
+            self._chunk_distances(centers, sources, start, stop, diff_buf, distances[start:stop])
+
+        self._run_chunks(len(centers), work)
+        self._distances = distances
+        return True
+
+    def amplitudes(self, centers: np.ndarray, sources: np.ndarray, wave_number: float) -> np.ndarray:
+        """返回每个屏幕点的复振幅（complex64，长度 N_dots）"""
+        centers = np.asarray(centers, dtype=np.float32)
+        sources = np.asarray(sources, dtype=np.float32)
+        result = np.zeros(len(centers), dtype=np.complex64)
+        if len(centers) == 0 or len(sources) == 0:
+            return result
+
+        cached = self._update_distances(centers, sources)
+        k = np.float32(TAU * wave_number)
+
+        def work(worker, start, stop):
+            diff_buf, dist_buf, phase_buf, trig_buf = self._get_buffers(worker, len(sources))
+            n = stop - start
+            if cached:
+                dists = self._distances[start:stop]
+            else:
+                dists = self._chunk_distances(centers, sources, start, stop, diff_buf, dist_buf)
+            phase = np.multiply(dists, k, out=phase_buf[:n])
+            result.real[start:stop] = np.cos(phase, out=trig_buf[:n]).sum(1)
+            result.imag[start:stop] = np.sin(phase, out=trig_buf[:n]).sum(1)
+
+        self._run_chunks(len(centers), work)
+        return result
+
+
+def get_exposure_field(dot_cloud, chunk_size: int = 1024, n_threads: int = 1) -> ExposureField:
+    """获取缓存在 dot_cloud 上的 ExposureField"""
+    field = getattr(dot_cloud, "_exposure_field", None)
+    if field is None:
+        field = ExposureField(chunk_size=chunk_size, n_threads=n_threads)
+        dot_cloud._exposure_field = field
+    field.chunk_size = max(1, int(chunk_size))
+    field.n_threads = max(1, int(n_threads))
+    return field
+
+
 class LightWaveSlice(Mobject):
     """
     光波切片可视化类
@@ -76,7 +207,7 @@ class LightWaveSlice(Mobject):
     该类使用 GPU Shader 实现多点光源的波干涉效应可视化。
     主要特性：
     1. 基于 GLSL Fragment Shader 的实时波计算
-    2. 支持多达 32 个点光源的同时渲染
+    2. 光源位置存放在浮点纹理中，光源数量不限（光栅、波带片可达数百个）
     3. 可调节波长、频率、衰减等物理参数
     4. 支持波的振幅显示和强度显示两种模式
     
@@ -101,6 +232,13 @@ class LightWaveSlice(Mobject):
     # 渲染图元类型：使用三角形条带进行高效渲染
     render_primitive: int = moderngl.TRIANGLE_STRIP
 
+    # 光源纹理每行的纹素数（超出时换行）
+    source_texture_width: int = 1024
+    # 与着色器一致：到原点距离不小于该值的光源视为平面波
+    plane_wave_threshold: float = 999.0
+    # wave_func 每块的 (点数 × 光源数) 上限
+    wave_func_chunk_elements: int = 2 ** 22
+
     def __init__(
         self,
         point_sources: DotCloud,
@@ -117,6 +255,10 @@ class LightWaveSlice(Mobject):
         self.shape = shape
         self.point_sources = point_sources
         self._is_paused = False
+        self._source_data = np.zeros((0, 3), dtype=np.float32)
+        self._sources_dirty = True
+        self._source_texture = None
+        self._source_wrapper = None
         super().__init__(**kwargs)
 
         if max_amp is None:
@@ -184,12 +326,52 @@ class LightWaveSlice(Mobject):
         return self
 
     def sync_points(self):
-        sources: DotCloud = self.point_sources
-        for n, point in enumerate(sources.get_points()):
-            self.set_uniform(**{f"point_source{n}": point})
-        self.set_uniform(n_sources=sources.get_num_points())
+        """光源点变化时才标记重新上传光源纹理"""
+        points = self.point_sources.get_points()
+        if points.shape != self._source_data.shape or not np.array_equal(points, self._source_data):
+            self._source_data = np.array(points, dtype=np.float32).reshape(-1, 3)
+            self._sources_dirty = True
+            self.set_uniform(n_sources=len(self._source_data))
         return self
 
+    def init_shader_wrapper(self, ctx: moderngl.Context):
+        super().init_shader_wrapper(ctx)
+        self._upload_sources(ctx)
+
+    def render(self, ctx: moderngl.Context, camera_uniforms: dict):
+        # 副本会拿到新的 ShaderWrapper，此时也需要自己的纹理
+        wrapper = self.shader_wrapper
+        if wrapper is not None and (self._sources_dirty or self._source_wrapper is not wrapper):
+            self._upload_sources(ctx)
+        super().render(ctx, camera_uniforms)
+
+    def _upload_sources(self, ctx: moderngl.Context):
+        """把光源位置写入 RGB32F 纹理（尺寸变化时重建纹理）"""
+        data = self._source_data
+        width = int(min(max(len(data), 1), self.source_texture_width))
+        rows = -(-max(len(data), 1) // width)
+
+        wrapper = self.shader_wrapper
+        texture = self._source_texture if self._source_wrapper is wrapper else None
+        if texture is None or texture.size != (width, rows):
+            if texture is not None:
+                texture.release()
+            texture = ctx.texture((width, rows), 3, dtype="f4")
+            texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+            tid = wrapper.texture_names_to_ids.get("point_source_texture")
+            if tid is None:
+                wrapper.add_texture("point_source_texture", texture)
+            else:
+                wrapper.textures = list(wrapper.textures)
+                wrapper.textures[tid] = texture
+            self._source_texture = texture
+            self._source_wrapper = wrapper
+
+        padded = np.zeros((width * rows, 3), dtype=np.float32)
+        padded[:len(data)] = data
+        texture.write(padded.tobytes())
+        self._sources_dirty = False
+
     def increment_time(self, dt):
         self.uniforms["time"] += self.uniforms["time_rate"] * dt
         return self
@@ -221,10 +403,25 @@ class LightWaveSlice(Mobject):
         frequency = self.uniforms["frequency"]
         decay_factor = self.uniforms["decay_factor"]
 
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        sources = np.asarray(self.point_sources.get_points(), dtype=np.float64).reshape(-1, 3)
         values = np.zeros(len(points))
-        for source_point in self.point_sources.get_points():
-            dists = np.linalg.norm(points - source_point, axis=1)
-            values += np.cos(TAU * (wave_number * dists - frequency * time)) * (dists + 1)**(-decay_factor)
+        if len(points) == 0 or len(sources) == 0:
+            return values
+
+        # 与着色器一致：远处光源按平面波计算投影距离
+        source_norms = np.linalg.norm(sources, axis=1)
+        plane = source_norms >= self.plane_wave_threshold
+        directions = sources[plane] / source_norms[plane, np.newaxis]
+
+        step = max(1, self.wave_func_chunk_elements // len(sources))
+        for start in range(0, len(points), step):
+            chunk = points[start:start + step]
+            dists = np.empty((len(chunk), len(sources)))
+            dists[:, ~plane] = np.linalg.norm(chunk[:, np.newaxis, :] - sources[np.newaxis, ~plane, :], axis=2)
+            dists[:, plane] = source_norms[plane] - chunk @ directions.T
+            terms = np.cos(TAU * (wave_number * dists - frequency * time)) * (dists + 1)**(-decay_factor)
+            values[start:start + step] = terms.sum(1)
         return values
 
 
@@ -3520,6 +3717,10 @@ class PlaneWaveThroughZonePlate(DiffractionGratingScene):
 
 
 class SuperpositionOfPoints(InteractiveScene):
+    # 曝光计算的分块大小与线程数（见 ExposureField）
+    exposure_chunk_size = 1024
+    exposure_threads = 1
+
     def construct(self):
         # Set up pi creature dot cloud
         frame = self.frame
@@ -3790,11 +3991,9 @@ class SuperpositionOfPoints(InteractiveScene):
         self.wait()
 
     def color_sheet_by_exposure(self, sheet_dots, point_sources, wave_number=16, opacity=0.5):
-        centers = sheet_dots.get_points()
-        diffs = centers[:, np.newaxis, :] - point_sources[np.newaxis, :, :]
-        distances = np.linalg.norm(diffs, axis=2)
-        amplitudes = np.exp(distances * TAU * 1j * wave_number).sum(1)
-        mags = abs(amplitudes)
+        field = get_exposure_field(sheet_dots, self.exposure_chunk_size, self.exposure_threads)
+        amplitudes = field.amplitudes(sheet_dots.get_points(), point_sources, wave_number)
+        mags = np.abs(amplitudes)
         max_amp = 2 * np.sqrt(len(point_sources))
         opacities = opacity * np.clip(mags / max_amp, 0, 1)
         sheet_dots.set_opacity(opacities)
@@ -4204,6 +4403,9 @@ class PointSourceDiffractionPattern(InteractiveScene):
     wave_length = 1.0
     use_hue = False
     max_mag = 3.0
+    # 曝光计算的分块大小与线程数（见 ExposureField）
+    exposure_chunk_size = 1024
+    exposure_threads = 1
 
     def setup(self):
         super().setup()
@@ -4248,10 +4450,9 @@ class PointSourceDiffractionPattern(InteractiveScene):
         max_mag = self.max_mag_tracker.get_value()
 
         centers = dot_cloud.get_points()
-        diffs = centers[:, np.newaxis, :] - point_sources[np.newaxis, :, :]
-        distances = np.linalg.norm(diffs, axis=2)
-        amplitudes = np.exp(distances * TAU * 1j * frequency).sum(1)
-        mags = abs(amplitudes)
+        field = get_exposure_field(dot_cloud, self.exposure_chunk_size, self.exposure_threads)
+        amplitudes = field.amplitudes(centers, point_sources, frequency)
+        mags = np.abs(amplitudes)
         opacities = 0.5 * np.clip(mags / max_mag, 0, 1)
 
         n = len(centers)
@@ -4259,7 +4460,7 @@ class PointSourceDiffractionPattern(InteractiveScene):
         rgbas[:, 3] = opacities
 
         if self.use_hue:
-            hues = (np.log(amplitudes).imag / TAU) % 1
+            hues = (np.angle(amplitudes) / TAU) % 1
             hsl = 0.5 * np.ones((n, 3))
             hsl[:, 0] = hues
             rgbas[:, :3] = hsl_to_rgb(hsl)
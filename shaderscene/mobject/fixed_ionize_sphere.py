@@ -26,6 +26,7 @@ class FixedIonizeSphere(ShaderSurface):
         self.radius = radius
         self.original_center = np.array(center)  # 保存原始中心点
         self.current_center = np.array(center)   # 当前中心点
+        self.sphere_mesh = (self.radius, self.current_center)  # 复用缓存的单位球网格
         
         # 定义球面UV函数
         def sphere_func(u, v):
@@ -39,6 +40,7 @@ class FixedIonizeSphere(ShaderSurface):
         
         super().__init__(
             uv_func=sphere_func,
+            vectorized=True,
             u_range=u_range,
             v_range=v_range,
             brightness=brightness,
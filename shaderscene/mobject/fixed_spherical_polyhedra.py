@@ -12,8 +12,13 @@ from pathlib import Path
 
 from manimlib import *
 
+try:
+    from .sphere_surface import VectorizedUVMixin
+except ImportError:
+    from sphere_surface import VectorizedUVMixin
 
-class FixedShaderSurface(Surface):
+
+class FixedShaderSurface(VectorizedUVMixin, Surface):
     """修复版的着色器表面基类"""
     shader_folder: str = str(Path(Path(__file__).parent.parent / "fixed_spherical_polyhedra_shader"))
 
@@ -23,9 +28,11 @@ class FixedShaderSurface(Surface):
             u_range=(0, 1),
             v_range=(0, 1),
             brightness=1.5,
+            vectorized=False,
             **kwargs
     ):
         self.passed_uv_func = uv_func
+        self.uv_func_vectorized = vectorized
         super().__init__(u_range=u_range, v_range=v_range, **kwargs)
 
         # 初始化shader uniforms - 修复：使用字典方式
@@ -73,6 +80,7 @@ class FixedSphericalPolyhedraSphere(FixedShaderSurface):
         self.radius = radius
         self.center = np.array(center)
         self.time_scale = time_scale
+        self.sphere_mesh = (self.radius, self.center)  # 复用缓存的单位球网格
         
         def sphere_func(u, v):
             # 球面参数方程
@@ -83,6 +91,7 @@ class FixedSphericalPolyhedraSphere(FixedShaderSurface):
         
         super().__init__(
             uv_func=sphere_func,
+            vectorized=True,
             u_range=u_range,
             v_range=v_range,
             resolution=resolution,
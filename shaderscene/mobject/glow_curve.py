@@ -15,17 +15,19 @@ __all__ = [
     "GlowCurve",
     "GlowParametricCurve",
     "GlowFunctionGraph",
+    "sample_curve_points",
+    "compute_curve_tangents",
+    "adaptive_sample_curve",
 ]
 
 import moderngl
 import numpy as np
 from pathlib import Path
 from manimlib.constants import WHITE, GREY_C
-from manimlib.constants import ORIGIN, TAU
+from manimlib.constants import ORIGIN, TAU, DEGREES, FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.types.point_cloud_mobject import PMobject
 from manimlib.utils.iterables import resize_with_interpolation
-from manimlib.utils.space_ops import get_norm
 
 from typing import TYPE_CHECKING
 
@@ -38,6 +40,270 @@ if TYPE_CHECKING:
 DEFAULT_GLOW_CURVE_WIDTH = 0.02
 DEFAULT_GLOW_WIDTH = 0.15
 DEFAULT_GLOW_FACTOR = 2.5
+# 1080p 下一个像素对应的场景单位长度（自适应采样的屏幕误差基准）
+DEFAULT_PIXEL_SIZE = FRAME_WIDTH / 1920
+
+
+def _evaluate_on_array(function: Callable[[float], Vect3], t_values: np.ndarray) -> np.ndarray | None:
+    """
+    尝试把整个 t 数组一次传给 function
+
+    支持返回 (n, 3)、(3, n) 数组或 [x(t), y(t), z(t)] 分量列表（标量分量会广播）。
+    函数不支持数组输入、返回形状不符或与逐点结果不一致时返回 None。
+    """
+    n = len(t_values)
+    try:
+        with np.errstate(all="ignore"):
+            result = function(t_values)
+        if isinstance(result, (list, tuple)):
+            if len(result) not in (2, 3):
+                return None
+            components = [np.broadcast_to(np.asarray(c, dtype=np.float64), (n,)) for c in result]
+            if len(components) == 2:
+                components.append(np.zeros(n))
+            points = np.stack(components, axis=1)
+        else:
+            arr = np.asarray(result, dtype=np.float64)
+            if arr.shape == (n, 3) and n != 3:
+                points = arr
+            elif arr.shape == (3, n):
+                points = arr.T
+            else:
+                return None
+        # 抽查首尾两点，防止函数对数组输入"静默地"给出错误结果
+        for idx in (0, n - 1):
+            expected = np.asarray(function(t_values[idx]), dtype=np.float64)
+            if not np.allclose(points[idx], expected, rtol=1e-5, atol=1e-6, equal_nan=True):
+                return None
+    except Exception:
+        return None
+    return points.astype(np.float32)
+
+
+def sample_curve_points(function: Callable[[float], Vect3], t_values: npt.ArrayLike) -> np.ndarray:
+    """
+    在 t_values 上对参数函数求值，返回 (n, 3) float32 点阵
+
+    函数支持数组输入（如 np.sin/np.cos 组成的表达式）时一次向量化求值，
+    否则回退为逐点调用。
+    """
+    t_values = np.asarray(t_values, dtype=np.float64)
+    if len(t_values) > 1:
+        points = _evaluate_on_array(function, t_values)
+        if points is not None:
+            return points
+    return np.array([function(t) for t in t_values], dtype=np.float32).reshape(-1, 3)
+
+
+def compute_curve_tangents(points: np.ndarray) -> np.ndarray:
+    """
+    向量化切线：内部点中心差分（退化时改用前向差分），端点单侧差分
+    """
+    n = len(points)
+    tangents = np.zeros_like(points)
+    if n < 2:
+        return tangents
+
+    def unit(vectors):
+        norms = np.linalg.norm(vectors, axis=-1)
+        ok = norms > 1e-8
+        out = np.zeros_like(vectors)
+        out[ok] = vectors[ok] / norms[ok, None]
+        return out, ok
+
+    # 中心差分；失败处改用前向差分（两者都失败则保持零向量）
+    central, central_ok = unit(points[2:] - points[:-2])
+    forward, _ = unit(points[2:] - points[1:-1])
+    tangents[1:-1] = np.where(central_ok[:, None], central, forward)
+
+    # 端点使用单侧差分
+    start, start_ok = unit(points[1:2] - points[0:1])
+    tangents[0] = start[0] if start_ok[0] else np.array([1.0, 0.0, 0.0])
+    end, end_ok = unit(points[-1:] - points[-2:-1])
+    tangents[-1] = end[0] if end_ok[0] else (tangents[-2] if n > 2 else tangents[0])
+    return tangents
+
+
+def _point_segment_distance(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """点 p 到线段 ab 的距离（逐行向量化）"""
+    ab = b - a
+    denom = np.einsum("ij,ij->i", ab, ab)
+    u = np.einsum("ij,ij->i", p - a, ab) / np.where(denom > 1e-20, denom, 1.0)
+    u = np.clip(u, 0.0, 1.0)
+    return np.linalg.norm(p - (a + u[:, None] * ab), axis=1)
+
+
+def _turn_angles(points: np.ndarray) -> np.ndarray:
+    """每个内部顶点处相邻两段的转角（弧度），长度 len(points) - 2"""
+    d1 = points[1:-1] - points[:-2]
+    d2 = points[2:] - points[1:-1]
+    n1 = np.linalg.norm(d1, axis=1)
+    n2 = np.linalg.norm(d2, axis=1)
+    cos = np.einsum("ij,ij->i", d1, d2) / np.maximum(n1 * n2, 1e-20)
+    return np.arccos(np.clip(cos, -1.0, 1.0))
+
+
+def _simplify_polyline(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Douglas-Peucker：返回需保留的点下标，保证被删点到折线的距离不超过 tolerance"""
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[[0, n - 1]] = True
+    finite = np.all(np.isfinite(points), axis=1)
+    keep[~finite] = True
+    # 非有限点（如极点）把曲线切成独立的片段
+    if not np.all(finite):
+        bad = np.flatnonzero(~finite)
+        keep[np.maximum(bad - 1, 0)] = True
+        keep[np.minimum(bad + 1, n - 1)] = True
+
+    stack = []
+    anchors = np.flatnonzero(keep)
+    for i, j in zip(anchors[:-1], anchors[1:]):
+        if j - i > 1 and finite[i] and finite[j]:
+            stack.append((i, j))
+    while stack:
+        i, j = stack.pop()
+        inner = points[i + 1:j]
+        dist = _point_segment_distance(inner, np.broadcast_to(points[i], inner.shape), np.broadcast_to(points[j], inner.shape))
+        k = int(np.argmax(dist))
+        if dist[k] > tolerance:
+            k += i + 1
+            keep[k] = True
+            if k - i > 1:
+                stack.append((i, k))
+            if j - k > 1:
+                stack.append((k, j))
+    return np.flatnonzero(keep)
+
+
+def adaptive_sample_curve(
+    function: Callable[[float], Vect3],
+    t_range: Tuple[float, float],
+    pixel_tolerance: float = 0.5,
+    pixel_size: float = DEFAULT_PIXEL_SIZE,
+    max_turn_angle: float = 8 * DEGREES,
+    initial_samples: int = 65,
+    max_samples: int = 20000,
+    max_depth: int = 16,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    按曲率与屏幕空间误差自适应采样参数曲线
+
+    1. 细化：从均匀网格出发，逐层对每个区间在中点求值（整层一次向量化），
+       中点到弦的距离超过 pixel_tolerance / 2 像素、或端点处转角超过
+       max_turn_angle（且弦长超过 1 像素）时在中点处二分；
+    2. 精简：对细化后的折线做 Douglas-Peucker（容差 pixel_tolerance / 2 像素），
+       删去直线段上的冗余点。
+
+    两步误差之和不超过 pixel_tolerance 像素，在该精度下与真实曲线视觉上一致。
+
+    Returns:
+        (t_values, points)
+    """
+    tol = pixel_tolerance * pixel_size
+    t_values = np.linspace(t_range[0], t_range[1], max(3, int(initial_samples)))
+    points = sample_curve_points(function, t_values)
+    active = np.ones(len(t_values) - 1, dtype=bool)
+
+    for _ in range(max_depth):
+        candidates = np.flatnonzero(active)
+        if len(candidates) == 0:
+            break
+        t_mid = 0.5 * (t_values[candidates] + t_values[candidates + 1])
+        p_mid = sample_curve_points(function, t_mid)
+        a, b = points[candidates], points[candidates + 1]
+        with np.errstate(invalid="ignore"):
+            error = _point_segment_distance(p_mid, a, b)
+            split = error > 0.5 * tol
+
+            # 曲率判据：区间任一端点处转角过大且区间在屏幕上仍长于 1 像素
+            angles = np.zeros(len(t_values))
+            angles[1:-1] = _turn_angles(points)
+            sharp = np.maximum(angles[candidates], angles[candidates + 1]) > max_turn_angle
+            split |= sharp & (np.linalg.norm(b - a, axis=1) > pixel_size)
+
+        budget = max_samples - len(t_values)
+        if budget <= 0 or not np.any(split):
+            break
+        chosen = candidates[split]
+        if len(chosen) > budget:
+            worst = np.argsort(-np.nan_to_num(error[split], nan=0.0))[:budget]
+            chosen = np.sort(chosen[worst])
+            split_mid = np.zeros(len(candidates), dtype=bool)
+            split_mid[np.searchsorted(candidates, chosen)] = True
+        else:
+            split_mid = split
+
+        # 在 chosen 区间后插入中点（中点已求值，无需重复计算）
+        insert_at = chosen + 1
+        t_values = np.insert(t_values, insert_at, t_mid[split_mid])
+        points = np.insert(points, insert_at, p_mid[split_mid], axis=0)
+        # 新一层只检查被二分出来的区间
+        new_index = insert_at + np.arange(len(chosen))
+        active = np.zeros(len(t_values) - 1, dtype=bool)
+        active[new_index - 1] = True
+        active[new_index] = True
+
+    keep = _simplify_polyline(points, 0.5 * tol)
+    return t_values[keep], points[keep]
+
+
+def _interleave_segments(points: np.ndarray, tangents: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """把相邻点交错展开为 LINES 顶点 [p0, p1, p1, p2, ...]"""
+    n_segments = max(len(points) - 1, 0)
+    line_points = np.empty((2 * n_segments, 3), dtype=np.float32)
+    line_tangents = np.empty((2 * n_segments, 3), dtype=np.float32)
+    line_points[0::2] = points[:-1]
+    line_points[1::2] = points[1:]
+    line_tangents[0::2] = tangents[:-1]
+    line_tangents[1::2] = tangents[1:]
+    return line_points, line_tangents
+
+
+def benchmark_curve_pipeline(sample_counts: Sequence[int] = (1_000, 10_000, 100_000), repeats: int = 3) -> list:
+    """
+    对比逐点循环与向量化管线（求值 + 切线 + 线段交错）的耗时
+
+    Returns:
+        [(n_samples, 循环耗时秒, 向量化耗时秒), ...]
+    """
+    import time
+
+    def spiral(t):
+        r = 0.5 + 0.2 * t
+        return np.array([r * np.cos(t), r * np.sin(t), 0.1 * t])
+
+    def legacy(t_values):
+        points = np.array([spiral(t) for t in t_values], dtype=np.float32)
+        tangents = np.zeros_like(points)
+        for i in range(1, len(points) - 1):
+            tangent = points[i + 1] - points[i - 1]
+            norm = np.linalg.norm(tangent)
+            if norm > 1e-8:
+                tangents[i] = tangent / norm
+        line_points, line_tangents = [], []
+        for i in range(len(points) - 1):
+            line_points += [points[i], points[i + 1]]
+            line_tangents += [tangents[i], tangents[i + 1]]
+        return np.array(line_points), np.array(line_tangents)
+
+    def vectorized(t_values):
+        points = sample_curve_points(spiral, t_values)
+        return _interleave_segments(points, compute_curve_tangents(points))
+
+    results = []
+    for n in sample_counts:
+        t_values = np.linspace(0, 6 * TAU, n)
+        timings = []
+        for pipeline in (legacy, vectorized):
+            best = float("inf")
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                pipeline(t_values)
+                best = min(best, time.perf_counter() - t0)
+            timings.append(best)
+        results.append((n, timings[0], timings[1]))
+    return results
 
 
 class GlowCurve(PMobject):
@@ -80,11 +346,16 @@ class GlowCurve(PMobject):
         core_width_ratio: float = 0.35,      # 过渡区域结束位置
         white_core_ratio: float = 0.12,      # 白色核心区域半径
         anti_alias_width: float = 1.5,
+        adaptive: bool = False,              # 按曲率/屏幕误差自适应采样（n_samples 仅作对比基准）
+        pixel_tolerance: float = 0.5,        # 自适应采样允许的屏幕误差（像素）
         **kwargs
     ):
         self.function = function
         self.t_range = t_range
         self.n_samples = n_samples
+        self.adaptive = adaptive
+        self.pixel_tolerance = pixel_tolerance
+        self.sampling_report = None
         self.curve_width = curve_width
         self.glow_width = glow_width
         self.base_glow_width = glow_width
@@ -110,49 +381,22 @@ class GlowCurve(PMobject):
         self.uniforms["white_core_ratio"] = self.white_core_ratio
         self.uniforms["anti_alias_width"] = self.anti_alias_width
 
+    def get_sampling_report(self) -> dict | None:
+        """
+        自适应采样的顶点统计（未启用 adaptive 时为 None）
+
+        uniform_vertices 为按 n_samples 均匀采样时的顶点数，
+        savings 为节省的比例（尖峰等需要加密时可能为负）。
+        """
+        return self.sampling_report
+
     def _compute_tangents(self, points: np.ndarray) -> np.ndarray:
         """
         计算曲线上每个点的切线方向
         
         使用中心差分法计算更平滑的切线，确保曲线宽度一致
         """
-        n = len(points)
-        tangents = np.zeros_like(points)
-        
-        if n < 2:
-            return tangents
-        
-        # 中心差分计算内部点的切线
-        for i in range(1, n - 1):
-            tangent = points[i + 1] - points[i - 1]
-            norm = get_norm(tangent)
-            if norm > 1e-8:
-                tangents[i] = tangent / norm
-            else:
-                # 如果中心差分失败，使用前向差分
-                tangent = points[i + 1] - points[i]
-                norm = get_norm(tangent)
-                if norm > 1e-8:
-                    tangents[i] = tangent / norm
-        
-        # 端点使用单侧差分
-        # 起点
-        tangent = points[1] - points[0]
-        norm = get_norm(tangent)
-        if norm > 1e-8:
-            tangents[0] = tangent / norm
-        else:
-            tangents[0] = np.array([1.0, 0.0, 0.0])
-        
-        # 终点
-        tangent = points[-1] - points[-2]
-        norm = get_norm(tangent)
-        if norm > 1e-8:
-            tangents[-1] = tangent / norm
-        else:
-            tangents[-1] = tangents[-2] if n > 1 else np.array([1.0, 0.0, 0.0])
-        
-        return tangents
+        return compute_curve_tangents(points)
 
     @Mobject.affects_data
     def set_points_from_function(
@@ -167,35 +411,39 @@ class GlowCurve(PMobject):
         if n_samples is None:
             n_samples = self.n_samples
         
-        # 生成参数值
-        t_values = np.linspace(t_range[0], t_range[1], n_samples)
-        
-        # 计算曲线点
-        curve_points = np.array([function(t) for t in t_values], dtype=np.float32)
+        if self.adaptive:
+            # 初始网格不低于均匀采样的 1/4，避免漏掉窄尖峰
+            _, curve_points = adaptive_sample_curve(
+                function, t_range,
+                pixel_tolerance=self.pixel_tolerance,
+                initial_samples=max(65, n_samples // 4),
+            )
+            uniform_vertices = 2 * max(n_samples - 1, 0)
+            adaptive_vertices = 2 * max(len(curve_points) - 1, 0)
+            self.sampling_report = {
+                "uniform_vertices": uniform_vertices,
+                "adaptive_vertices": adaptive_vertices,
+                "saved_vertices": uniform_vertices - adaptive_vertices,
+                "savings": 1.0 - adaptive_vertices / uniform_vertices if uniform_vertices else 0.0,
+            }
+        else:
+            # 生成参数值
+            t_values = np.linspace(t_range[0], t_range[1], n_samples)
+            
+            # 计算曲线点（支持数组输入的函数一次求值）
+            curve_points = sample_curve_points(function, t_values)
         
         # 计算切线
         tangents = self._compute_tangents(curve_points)
         
-        # 转换为线段端点
-        line_points = []
-        line_tangents = []
-        
-        for i in range(len(curve_points) - 1):
-            p1 = curve_points[i]
-            p2 = curve_points[i + 1]
-            t1 = tangents[i]
-            t2 = tangents[i + 1]
-            
-            line_points.append(p1)
-            line_points.append(p2)
-            line_tangents.append(t1)
-            line_tangents.append(t2)
+        # 转换为线段端点（交错展开，无逐段循环）
+        line_points, line_tangents = _interleave_segments(curve_points, tangents)
         
-        if line_points:
-            self.set_points(np.array(line_points, dtype=np.float32))
+        if len(line_points):
+            self.set_points(line_points)
             
             if self.has_points():
-                self.data['tangent'][:] = np.array(line_tangents, dtype=np.float32)
+                self.data['tangent'][:] = line_tangents
                 self.data['glow_width'][:, 0] = self.glow_width
         
         return self
@@ -363,7 +611,8 @@ class GlowFunctionGraph(GlowCurve):
     ):
         # 将 y=f(x) 转换为参数形式
         def parametric_func(x):
-            return np.array([x, function(x), 0], dtype=np.float32)
+            # 标量与数组输入均可（数组输入时返回 (3, n)，便于向量化采样）
+            return np.array([x, function(x), np.zeros_like(x)], dtype=np.float32)
         
         super().__init__(
             function=parametric_func,
@@ -417,3 +666,9 @@ def GlowSpiral(a: float = 0.5, b: float = 0.2, **kwargs):
 
 # 导入常量
 from manimlib.constants import TAU
+
+
+if __name__ == "__main__":
+    print(f"{'samples':>8} {'loop':>10} {'vectorized':>11} {'speedup':>8}")
+    for n, loop_time, vec_time in benchmark_curve_pipeline():
+        print(f"{n:>8} {loop_time * 1e3:>8.1f}ms {vec_time * 1e3:>9.2f}ms {loop_time / vec_time:>7.1f}x")
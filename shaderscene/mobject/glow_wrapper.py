@@ -16,6 +16,15 @@ from manimlib.utils.space_ops import get_norm
 
 from typing import Sequence, Iterable, Optional, Self
 
+try:
+    from .arc_length_sampler import sample_vmobject_by_arc_length
+    from .glyph_sample_cache import GlyphSampleCache
+    from .palette import BRIGHT_COLORS, DARK_COLORS, NEON_COLORS, get_palette
+except ImportError:
+    from arc_length_sampler import sample_vmobject_by_arc_length
+    from glyph_sample_cache import GlyphSampleCache
+    from palette import BRIGHT_COLORS, DARK_COLORS, NEON_COLORS, get_palette
+
 __all__ = [
     "GlowObjectPointCloud",
     "GlowLineStrip",
@@ -23,20 +32,10 @@ __all__ = [
 ]
 
 
-DEFAULT_BRIGHT_COLORS = [
-    "#FF0080", "#FF4000", "#FF8000", "#FFFF00",
-    "#80FF00", "#00FF80", "#0080FF", "#8000FF", "#FF0080"
-]
-
-DEFAULT_DARK_COLORS = [
-    "#2D1B69", "#4A0E4E", "#8B0000", "#B8860B",
-    "#006400", "#191970", "#4B0082", "#2D1B69"
-]
-
-DEFAULT_NEON_COLORS = [
-    "#FF006E", "#FB5607", "#FFBE0B", "#8338EC",
-    "#3A86FF", "#06FFA5", "#FF006E"
-]
+# 调色盘色标定义在 palette 模块，这里保留旧名称
+DEFAULT_BRIGHT_COLORS = BRIGHT_COLORS
+DEFAULT_DARK_COLORS = DARK_COLORS
+DEFAULT_NEON_COLORS = NEON_COLORS
 
 
 class GlowObjectPointCloud(PMobject):
@@ -191,17 +190,19 @@ class GlowLineStrip(PMobject):
         if n < 2:
             return tangents
         
-        # 内部点使用中心差分
-        for i in range(1, n - 1):
-            tangent = points[i + 1] - points[i - 1]
-            norm = get_norm(tangent)
-            if norm > 1e-8:
-                tangents[i] = tangent / norm
-            else:
-                tangent = points[i + 1] - points[i]
-                norm = get_norm(tangent)
-                if norm > 1e-8:
-                    tangents[i] = tangent / norm
+        # 内部点使用中心差分；中心差分退化时回退到前向差分
+        if n > 2:
+            central = points[2:] - points[:-2]
+            forward = points[2:] - points[1:-1]
+            central_norm = np.linalg.norm(central, axis=1)
+            forward_norm = np.linalg.norm(forward, axis=1)
+            use_central = central_norm > 1e-8
+            chosen = np.where(use_central[:, None], central, forward)
+            chosen_norm = np.where(use_central, central_norm, forward_norm)
+            valid = chosen_norm > 1e-8
+            tangents[1:-1] = np.where(
+                valid[:, None], chosen / np.where(valid, chosen_norm, 1.0)[:, None], 0.0
+            )
         
         # 端点处理
         if self.closed and n > 2:
@@ -247,22 +248,16 @@ class GlowLineStrip(PMobject):
         n_vertices = n_segments * 2
         self.resize_points(n_vertices)
         
-        # 填充数据
-        for i in range(n_segments):
-            j = (i + 1) % n_points
-            base_idx = i * 2
-            
-            # 起点
-            self.data["point"][base_idx] = points[i]
-            self.data["rgba"][base_idx] = colors[i]
-            self.data["glow_width"][base_idx, 0] = self.glow_width
-            self.data["tangent"][base_idx] = tangents[i]
-            
-            # 终点
-            self.data["point"][base_idx + 1] = points[j]
-            self.data["rgba"][base_idx + 1] = colors[j]
-            self.data["glow_width"][base_idx + 1, 0] = self.glow_width
-            self.data["tangent"][base_idx + 1] = tangents[j]
+        # 填充数据：偶数顶点为线段起点 i，奇数顶点为终点 (i + 1) % n
+        starts = np.arange(n_segments)
+        ends = (starts + 1) % n_points
+        self.data["point"][0::2] = points[starts]
+        self.data["point"][1::2] = points[ends]
+        self.data["rgba"][0::2] = colors[starts]
+        self.data["rgba"][1::2] = colors[ends]
+        self.data["tangent"][0::2] = tangents[starts]
+        self.data["tangent"][1::2] = tangents[ends]
+        self.data["glow_width"][:, 0] = self.glow_width
     
     def init_uniforms(self) -> None:
         super().init_uniforms()
@@ -335,6 +330,36 @@ def _format_rgba(value) -> np.ndarray:
     return rgba[:4]
 
 
+def _fit_similarity(src: np.ndarray, dst: np.ndarray):
+    """
+    拟合相似变换 dst ≈ scale * src @ R.T + shift（Umeyama 方法）
+
+    返回 (scale, rotation, shift, residual)，residual 为逐点最大误差；
+    src 退化（所有点重合）时返回 None。
+    """
+    src = np.asarray(src, dtype=np.float64)
+    dst = np.asarray(dst, dtype=np.float64)
+    src_center = src.mean(axis=0)
+    dst_center = dst.mean(axis=0)
+    src_c = src - src_center
+    dst_c = dst - dst_center
+
+    src_var = float(np.mean(np.sum(src_c * src_c, axis=1)))
+    if src_var < 1e-12:
+        return None
+
+    U, D, Vt = np.linalg.svd(dst_c.T @ src_c / len(src))
+    signs = np.ones(len(D))
+    if np.linalg.det(U) * np.linalg.det(Vt) < 0:
+        signs[-1] = -1.0
+    rotation = (U * signs) @ Vt
+    scale = float(np.sum(D * signs) / src_var)
+    shift = dst_center - scale * rotation @ src_center
+
+    residual = float(np.max(np.linalg.norm(dst_c - scale * src_c @ rotation.T, axis=1)))
+    return scale, rotation, shift, residual
+
+
 def _format_color(color) -> np.ndarray:
     """将颜色值转换为 RGB 数组"""
     if isinstance(color, np.ndarray):
@@ -362,6 +387,11 @@ class GlowWrapperEffect(Group):
     - glow_factor: 辉光衰减因子
     - white_core_ratio: 白色核心强度
     - render_mode: "line" 或 "point"
+    - auto_update: 每帧跟随目标刷新。目标点数据未变化时跳过；整体平移/旋转/缩放时
+      直接变换缓存的辉光几何；只有形状变化时才重新采样
+    - color_scheme: "bright" / "dark" / "neon" / "cinematic" / "rainbow" 或颜色列表
+    - hue_shift_speed: 颜色方案沿调色盘循环流动的速度（每秒调色盘周期数），
+      每帧一次向量化查表
     
     使用示例：
     >>> glow = GlowWrapperEffect(circle, color=BLUE, size=0.3)
@@ -395,6 +425,9 @@ class GlowWrapperEffect(Group):
         color_scheme: str | Sequence[str] | None = None,
         jitter: float = 0.0,
         auto_update: bool = False,
+        rigid_tolerance: float = 1e-4,
+        sample_cache: GlyphSampleCache | None = None,
+        hue_shift_speed: float = 0.0,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -426,9 +459,22 @@ class GlowWrapperEffect(Group):
         self._curve_sample_factor = max(curve_sample_factor, 0.0)
         self._min_curve_samples = max(1, int(min_curve_samples))
         self._jitter = jitter
+        self._sample_cache = sample_cache
         
         # 颜色方案（用于渐变效果）
         self._color_scheme = color_scheme
+        self._hue_shift_speed = float(hue_shift_speed)
+        self._palette_phase = 0.0
+        self._palette_coords = None
+        
+        # 脏标记：目标族点数据快照，以及上次完整采样时的目标与辉光几何
+        # （相似变换总是相对上次采样拟合，避免逐帧累积误差）
+        self._rigid_tolerance = max(float(rigid_tolerance), 0.0)
+        self._target_structure = None
+        self._target_snapshot = None
+        self._reference_snapshot = None
+        self._glow_reference = None
+        self.refresh_stats = {"skipped": 0, "transformed": 0, "resampled": 0}
         
         # 创建辉光层
         self._build_glow()
@@ -436,6 +482,10 @@ class GlowWrapperEffect(Group):
         # 自动更新
         if auto_update:
             self.add_updater(lambda m, dt: m.refresh())
+        
+        # 色相流动
+        if self._hue_shift_speed and self._color_scheme is not None:
+            self.add_updater(lambda m, dt: m._advance_palette(dt))
 
     # ========================================================================
     # 核心方法：set / get / mix
@@ -687,7 +737,11 @@ class GlowWrapperEffect(Group):
         return points.astype(np.float32)
 
     def _sample_vmobject_perimeter(self, vmob: VMobject) -> Optional[np.ndarray]:
-        """沿 VMobject 周长采样"""
+        """
+        沿 VMobject 周长按弧长均匀采样（弧长 LUT 缓存在 vmob 上，一次向量化求值）
+
+        设置了 sample_cache 时按字形轮廓查缓存（文字辉光逐字形复用）。
+        """
         if vmob.get_num_points() == 0:
             return None
         
@@ -697,10 +751,12 @@ class GlowWrapperEffect(Group):
         if samples <= 0:
             return None
         
-        alphas = np.linspace(0.0, 1.0, samples, endpoint=False)
-        getter = getattr(vmob, "quick_point_from_proportion", vmob.point_from_proportion)
-        
-        return np.array([getter(float(a)) for a in alphas], dtype=np.float32)
+        if self._sample_cache is not None:
+            params = ("perimeter", samples)
+            return self._sample_cache.get_samples(
+                vmob, params, lambda m: sample_vmobject_by_arc_length(m, samples)
+            )
+        return sample_vmobject_by_arc_length(vmob, samples)
 
     def _generate_colors(self, count: int) -> np.ndarray:
         """生成颜色数组"""
@@ -715,33 +771,33 @@ class GlowWrapperEffect(Group):
         return np.tile(self._rgba, (count, 1))
 
     def _generate_gradient_colors(self, count: int) -> np.ndarray:
-        """生成渐变颜色"""
-        if isinstance(self._color_scheme, str):
-            if self._color_scheme == "bright":
-                palette = DEFAULT_BRIGHT_COLORS
-            elif self._color_scheme == "dark":
-                palette = DEFAULT_DARK_COLORS
-            elif self._color_scheme == "neon":
-                palette = DEFAULT_NEON_COLORS
-            else:
-                palette = [self._rgba]
-        else:
-            palette = list(self._color_scheme)
-        
-        if len(palette) == 1:
-            return np.tile(_format_rgba(palette[0]), (count, 1))
-        
-        colors = []
-        steps = len(palette) - 1
-        for i in range(count):
-            pos = i / max(count - 1, 1)
-            seg = min(int(pos * steps), steps - 1)
-            local_t = pos * steps - seg
-            c1 = _format_rgba(palette[seg])
-            c2 = _format_rgba(palette[seg + 1])
-            colors.append(_interpolate(c1, c2, local_t))
-        
-        return np.stack(colors, axis=0).astype(np.float32)
+        """生成渐变颜色（共享调色盘 LUT，一次向量化查表；未知方案名回退为单色）"""
+        palette = get_palette(self._color_scheme, default=self._rgba)
+        return palette.gradient(count, shift=self._palette_phase)
+
+    def _store_palette_coords(self, count: int) -> None:
+        """记录每个辉光顶点在调色盘上的位置，供色相流动逐帧查表"""
+        if self._color_scheme is None or count <= 0:
+            self._palette_coords = None
+            return
+        coords = np.arange(count) / max(count - 1, 1)
+        if self._render_mode == "line" and count >= 2:
+            n_segments = count if self.glow.closed else count - 1
+            idx = np.empty(n_segments * 2, dtype=np.int64)
+            idx[0::2] = np.arange(n_segments)
+            idx[1::2] = (idx[0::2] + 1) % count
+            coords = coords[idx]
+        self._palette_coords = coords
+
+    def _advance_palette(self, dt: float) -> None:
+        """色相流动：相位前进后整体重新查表"""
+        coords = self._palette_coords
+        if coords is None or len(coords) != len(self.glow.data):
+            return
+        self._palette_phase = (self._palette_phase + self._hue_shift_speed * dt) % 1.0
+        palette = get_palette(self._color_scheme, default=self._rgba)
+        self.glow.data["rgba"][:] = palette.sample(coords, shift=self._palette_phase)
+        self.glow.note_changed_data()
 
     def _build_glow(self) -> None:
         """构建辉光层"""
@@ -777,6 +833,60 @@ class GlowWrapperEffect(Group):
             )
         
         self.add(self.glow)
+        self._store_palette_coords(len(points))
+        self._remember_reference()
+
+    def _read_target_state(self):
+        """
+        读取目标族的结构签名与点数据快照
+
+        结构签名为 (成员 id, 点数) 元组，成员增删或点数变化都会使其失效。
+        """
+        if self.target is None:
+            return None, None
+        members = [m for m in self.target.get_family() if m.has_points()]
+        structure = tuple((id(m), m.get_num_points()) for m in members)
+        if not members:
+            return structure, np.zeros((0, 3), dtype=np.float32)
+        return structure, np.concatenate([m.get_points() for m in members], axis=0)
+
+    def _remember_reference(self) -> None:
+        """记录完整采样后的目标快照与辉光几何，作为后续相似变换的基准"""
+        self._target_structure, self._target_snapshot = self._read_target_state()
+        self._reference_snapshot = self._target_snapshot
+        self._glow_reference = {
+            key: self.glow.data[key].copy()
+            for key in ("point", "tangent")
+            if key in self.glow.data.dtype.names
+        }
+
+    def _apply_target_motion(self, snapshot: np.ndarray) -> bool:
+        """
+        目标整体做相似变换（平移/旋转/均匀缩放）时直接变换缓存的辉光几何
+
+        弧长采样对相似变换是等变的，因此结果与重新采样一致。
+        拟合残差超过容差（形状变化）时返回 False，由调用方重新采样。
+        """
+        reference = self._reference_snapshot
+        if reference is None or self._glow_reference is None or len(reference) < 2:
+            return False
+        if len(self._glow_reference["point"]) != len(self.glow.data):
+            return False
+
+        fit = _fit_similarity(reference, snapshot)
+        if fit is None:
+            return False
+        scale, rotation, shift, residual = fit
+        extent = float(np.max(np.linalg.norm(snapshot - snapshot.mean(axis=0), axis=1)))
+        if scale < 1e-6 or residual > self._rigid_tolerance * max(extent, 1e-6):
+            return False
+
+        ref_points = self._glow_reference["point"]
+        self.glow.data["point"][:] = scale * ref_points @ rotation.T + shift
+        if "tangent" in self._glow_reference:
+            self.glow.data["tangent"][:] = self._glow_reference["tangent"] @ rotation.T
+        self.glow.note_changed_data()
+        return True
 
     def _is_closed_path(self, points: np.ndarray) -> bool:
         """检测点集是否构成闭合路径"""
@@ -815,20 +925,48 @@ class GlowWrapperEffect(Group):
             self.glow.set_glow_factor(self._glow_factor)
             self.glow.set_white_core_ratio(self._white_core_ratio)
             self.glow.set_white_glow_ratio(self._white_glow_ratio)
+        
+        self._store_palette_coords(len(points))
+        self._remember_reference()
 
     # ========================================================================
     # 公共方法
     # ========================================================================
     
     def refresh(self) -> Self:
-        """刷新辉光（重新采样目标对象）"""
+        """
+        刷新辉光（跟随目标对象）
+
+        - 目标族点数据与上次相同：跳过
+        - 目标整体平移/旋转/均匀缩放：变换缓存的辉光几何
+        - 形状或结构变化：重新采样
+        """
+        if not hasattr(self, 'glow'):
+            return self
+        
+        structure, snapshot = self._read_target_state()
+        if snapshot is not None and structure == self._target_structure:
+            if np.array_equal(snapshot, self._target_snapshot):
+                self.refresh_stats["skipped"] += 1
+                return self
+            if self._apply_target_motion(snapshot):
+                self._target_snapshot = snapshot
+                self.refresh_stats["transformed"] += 1
+                return self
+        
+        self._update_glow()
+        self.refresh_stats["resampled"] += 1
+        return self
+
+    def resample(self) -> Self:
+        """强制重新采样目标对象"""
         self._update_glow()
         return self
 
     def surround(self, mob: Mobject) -> Self:
         """更换目标对象"""
         self.target = mob
-        return self.refresh()
+        return self.resample()
 
     def copy(self) -> "GlowWrapperEffect":
         """复制"""
@@ -850,6 +988,9 @@ class GlowWrapperEffect(Group):
             min_curve_samples=self._min_curve_samples,
             color_scheme=self._color_scheme,
             jitter=self._jitter,
+            rigid_tolerance=self._rigid_tolerance,
+            sample_cache=self._sample_cache,
+            hue_shift_speed=self._hue_shift_speed,
         )
         return clone
 
@@ -885,7 +1026,7 @@ class GlowWrapperEffect(Group):
     def set_color_scheme(self, scheme: str | Sequence[str]) -> Self:
         """设置颜色方案"""
         self._color_scheme = scheme
-        return self.refresh()
+        return self.resample()
 
     def mix_glow(
         self,
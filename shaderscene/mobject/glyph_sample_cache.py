@@ -0,0 +1,190 @@
+"""
+字形轮廓辉光采样缓存（跨渲染持久化）
+
+文字辉光需要沿每个字形轮廓按弧长采样，同一字符串每次渲染都会重复这项工作。
+本模块把每个字形的采样结果以"字形局部坐标"缓存：
+
+- 键：字形控制点相对首个锚点的量化坐标摘要 + 采样参数。
+  字形轮廓由 (字体, 字符, 字号) 唯一确定，因此摘要天然区分这三者，
+  同一字符出现在不同位置、不同字符串中都能命中；Tex 符号同样适用
+- 值：采样点减去首个锚点后的局部坐标，取出时加回当前锚点即可
+- 持久化到 assets/cache/glyph_samples.npz，进程退出时回写
+
+使用方法:
+    from glyph_sample_cache import get_glyph_sample_cache
+
+    cache = get_glyph_sample_cache()
+    points = cache.get_samples(glyph, ("perimeter", 30.0, 150), sampler)
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+__all__ = [
+    "GlyphSampleCache",
+    "get_glyph_sample_cache",
+    "DEFAULT_CACHE_PATH",
+]
+
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "assets", "cache", "glyph_samples.npz",
+)
+
+
+class GlyphSampleCache:
+    """
+    字形采样缓存
+
+    - 进程内为字典（按最近使用排序），超过 max_entries 时淘汰最久未用的条目
+    - save() 以 npz 原子写回；只有新增条目时才写
+    - 读取失败（文件损坏、版本不符）时视为空缓存
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        quantum: float = 1e-5,
+        max_entries: int = 50000,
+    ):
+        """
+        Args:
+            cache_path: 持久化文件路径；None 表示只在进程内缓存
+            quantum: 计算键时局部坐标的量化步长（吸收平移带来的浮点误差）
+            max_entries: 条目上限
+        """
+        self.cache_path = cache_path
+        self.quantum = float(quantum)
+        self.max_entries = max(1, int(max_entries))
+        self._entries = {}
+        self._dirty = False
+        self.stats = {"hits": 0, "misses": 0}
+        if cache_path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ==================== 键 ====================
+
+    def make_key(self, points: np.ndarray, params: tuple) -> str:
+        """字形控制点（相对首点、量化后）与采样参数的摘要"""
+        points = np.asarray(points, dtype=np.float64)
+        local = np.round((points - points[0]) / self.quantum).astype(np.int64)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((points.shape, tuple(params))).encode("utf-8"))
+        digest.update(local.tobytes())
+        return digest.hexdigest()
+
+    # ==================== 查询 ====================
+
+    def get_samples(
+        self,
+        vmobject,
+        params: tuple,
+        sampler: Callable[[object], np.ndarray],
+    ) -> np.ndarray:
+        """
+        获取 vmobject 的轮廓采样点（世界坐标，(N, 3) float32）
+
+        Args:
+            vmobject: 单个字形（或任意 VMobject）
+            params: 影响采样结果的参数元组，参与键计算
+            sampler: 未命中时调用 sampler(vmobject) 计算采样点
+        """
+        points = vmobject.get_points()
+        if len(points) == 0:
+            return np.zeros((0, 3), dtype=np.float32)
+
+        anchor = np.asarray(points[0], dtype=np.float32)
+        key = self.make_key(points, params)
+        local = self._entries.pop(key, None)
+        if local is not None:
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            samples = np.asarray(sampler(vmobject), dtype=np.float32).reshape(-1, 3)
+            local = samples - anchor
+            self._dirty = True
+        # 重新插入到末尾，字典顺序即最近使用顺序
+        self._entries[key] = local
+        if len(self._entries) > self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+
+        return local + anchor
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dirty = True
+
+    # ==================== 持久化 ====================
+
+    def _load(self) -> None:
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as data:
+                if int(data["version"]) != self.VERSION:
+                    return
+                keys = data["keys"]
+                offsets = data["offsets"]
+                points = data["points"]
+        except (OSError, ValueError, KeyError):
+            return
+
+        for i in range(max(len(keys) - self.max_entries, 0), len(keys)):
+            self._entries[str(keys[i])] = points[offsets[i]:offsets[i + 1]]
+
+    def save(self) -> None:
+        """有新增条目时原子写回 npz"""
+        if not self.cache_path or not self._dirty:
+            return
+
+        keys = list(self._entries.keys())
+        arrays = [self._entries[k] for k in keys]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        if arrays:
+            offsets[1:] = np.cumsum([len(a) for a in arrays])
+            points = np.concatenate(arrays, axis=0).astype(np.float32)
+        else:
+            points = np.zeros((0, 3), dtype=np.float32)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        tmp = self.cache_path + ".tmp.npz"
+        np.savez(
+            tmp,
+            version=np.array(self.VERSION),
+            keys=np.array(keys, dtype="U32"),
+            offsets=offsets,
+            points=points,
+        )
+        os.replace(tmp, self.cache_path)
+        self._dirty = False
+
+
+_default_cache: Optional[GlyphSampleCache] = None
+
+
+def get_glyph_sample_cache() -> GlyphSampleCache:
+    """进程共享的默认缓存（assets/cache/glyph_samples.npz），退出时自动写回"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = GlyphSampleCache(DEFAULT_CACHE_PATH)
+        atexit.register(_save_default_cache)
+    return _default_cache
+
+
+def _save_default_cache() -> None:
+    if _default_cache is None:
+        return
+    try:
+        _default_cache.save()
+    except OSError as e:
+        print(f"⚠️ 字形采样缓存写回失败: {e}")
@@ -22,6 +22,7 @@ class IonizeSphere(ShaderSurface):
     ):
         self.radius = radius
         self.center = np.array(center)
+        self.sphere_mesh = (self.radius, self.center)  # 复用缓存的单位球网格
         
         # 定义球面UV函数
         def sphere_func(u, v):
@@ -35,6 +36,7 @@ class IonizeSphere(ShaderSurface):
         
         super().__init__(
             uv_func=sphere_func,
+            vectorized=True,
             u_range=u_range,
             v_range=v_range,
             brightness=brightness,
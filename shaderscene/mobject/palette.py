@@ -0,0 +1,240 @@
+"""
+共享调色盘：预计算 float32 查找表（LUT），数组进、数组出
+
+辉光包裹、闪烁边框、彗尾演示原先各自逐点解析 HEX、逐点插值。
+这里每个调色盘只解析一次色标，预计算 LUT，之后任意一组位置 t 都是
+一次向量化查表；带 shift 时沿调色盘循环平移（色相流动），每帧也只是一次查表。
+
+命名方案:
+    "bright"    明亮彩虹
+    "dark"      深色彩虹
+    "neon"      霓虹
+    "cinematic" 柔和电影彩虹（含段中间调增强）
+    "rainbow"   色相环 红→黄→绿→青→蓝→紫→红
+
+使用方法:
+    from palette import get_palette
+
+    palette = get_palette("neon")
+    colors = palette.gradient(500)                  # (500, 4) float32
+    colors = palette.sample(t, shift=time * 0.2)    # 色相随时间流动
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from manimlib.utils.color import color_to_rgba
+
+from typing import Optional, Sequence
+
+__all__ = [
+    "Palette",
+    "PALETTE_SCHEMES",
+    "get_palette",
+    "rgb_array_to_hex",
+]
+
+
+BRIGHT_COLORS = [
+    "#FF0080", "#FF4000", "#FF8000", "#FFFF00",
+    "#80FF00", "#00FF80", "#0080FF", "#8000FF", "#FF0080"
+]
+
+DARK_COLORS = [
+    "#2D1B69", "#4A0E4E", "#8B0000", "#B8860B",
+    "#006400", "#191970", "#4B0082", "#2D1B69"
+]
+
+NEON_COLORS = [
+    "#FF006E", "#FB5607", "#FFBE0B", "#8338EC",
+    "#3A86FF", "#06FFA5", "#FF006E"
+]
+
+CINEMATIC_COLORS = [
+    "#570487", "#8A0538", "#0D8307", "#044A88", "#A66408", "#000C8C"
+]
+
+# 电影彩虹各段中点附近轻微混入的中间调
+CINEMATIC_MID_COLORS = ["#DB6DF9", "#FD82B1", "#9668F3", "#79BEF7", "#786FEF"]
+
+RAINBOW_COLORS = [
+    "#FF0000", "#FFFF00", "#00FF00", "#00FFFF", "#0000FF", "#FF00FF", "#FF0000"
+]
+
+PALETTE_SCHEMES = {
+    "bright": BRIGHT_COLORS,
+    "dark": DARK_COLORS,
+    "neon": NEON_COLORS,
+    "cinematic": CINEMATIC_COLORS,
+    "rainbow": RAINBOW_COLORS,
+}
+
+
+def _parse_rgba(color) -> np.ndarray:
+    """HEX / RGB / RGBA / ManimGL 颜色 -> RGBA float32"""
+    if isinstance(color, str) and color.startswith("#") and len(color) in (7, 9):
+        values = [int(color[i:i + 2], 16) / 255.0 for i in range(1, len(color), 2)]
+        rgba = np.array(values + [1.0] * (4 - len(values)), dtype=np.float32)
+    elif isinstance(color, (np.ndarray, list, tuple)):
+        rgba = np.asarray(color, dtype=np.float32).ravel()
+        if len(rgba) == 3:
+            rgba = np.append(rgba, np.float32(1.0))
+    else:
+        rgba = np.array(color_to_rgba(color), dtype=np.float32)
+    return rgba[:4].astype(np.float32)
+
+
+def _interpolate_stops(c1: np.ndarray, c2: np.ndarray, t: np.ndarray, interpolation: str) -> np.ndarray:
+    """色标插值：linear 为线性；rms 与 ManimGL interpolate_color 一致（平方空间插值）"""
+    t = t[:, None]
+    if interpolation == "rms":
+        rgb = np.sqrt(c1[:, :3] ** 2 * (1 - t) + c2[:, :3] ** 2 * t)
+        alpha = c1[:, 3:] * (1 - t) + c2[:, 3:] * t
+        return np.concatenate([rgb, alpha], axis=1)
+    return c1 * (1 - t) + c2 * t
+
+
+def rgb_array_to_hex(rgb: np.ndarray) -> list:
+    """(N, 3+) 颜色数组 -> HEX 字符串列表"""
+    values = np.clip(np.round(np.asarray(rgb)[:, :3] * 255), 0, 255).astype(int)
+    return ["#{:02X}{:02X}{:02X}".format(*row) for row in values]
+
+
+class Palette:
+    """
+    均匀分布色标的渐变调色盘
+
+    LUT 每段 lut_resolution 个条目，段边界恰好落在 LUT 网格上，
+    因此线性调色盘查表与逐点插值结果一致。
+    """
+
+    def __init__(
+        self,
+        colors: Sequence,
+        interpolation: str = "linear",
+        lut_resolution: int = 256,
+    ):
+        """
+        Args:
+            colors: 色标（HEX、RGB、RGBA 或 ManimGL 颜色）
+            interpolation: "linear" 线性插值；"rms" 与 ManimGL interpolate_color 一致
+            lut_resolution: 每段 LUT 条目数
+        """
+        if interpolation not in ("linear", "rms"):
+            raise ValueError(f"interpolation must be 'linear' or 'rms', got '{interpolation}'")
+        self.stops = np.stack([_parse_rgba(c) for c in colors]).astype(np.float32)
+        if len(self.stops) == 0:
+            raise ValueError("Palette 至少需要 1 个颜色")
+        self.interpolation = interpolation
+
+        steps = max(len(self.stops) - 1, 1)
+        pos = np.linspace(0.0, 1.0, steps * max(int(lut_resolution), 1) + 1)
+        self.lut = self._evaluate_stops(pos)
+
+    @classmethod
+    def from_lut(cls, lut: np.ndarray, stops: Optional[np.ndarray] = None) -> "Palette":
+        """直接使用预计算的 LUT（(L, 4) RGBA）"""
+        palette = cls.__new__(cls)
+        palette.lut = np.asarray(lut, dtype=np.float32)
+        palette.stops = palette.lut[[0, -1]] if stops is None else np.asarray(stops, dtype=np.float32)
+        palette.interpolation = "lut"
+        return palette
+
+    def _evaluate_stops(self, pos: np.ndarray) -> np.ndarray:
+        """按原始色标精确插值（用于构建 LUT）"""
+        if len(self.stops) == 1:
+            return np.repeat(self.stops, len(pos), axis=0)
+        steps = len(self.stops) - 1
+        seg = np.minimum((pos * steps).astype(np.int64), steps - 1)
+        local_t = pos * steps - seg
+        return _interpolate_stops(self.stops[seg], self.stops[seg + 1], local_t, self.interpolation).astype(np.float32)
+
+    def sample(self, t, shift: float = 0.0) -> np.ndarray:
+        """
+        按位置 t（0~1）查表，返回 (N, 4) float32
+
+        shift 非零时沿调色盘循环平移（t + shift 取模），适合首尾同色的循环调色盘。
+        """
+        t = np.asarray(t, dtype=np.float64).ravel()
+        if shift:
+            t = np.mod(t + shift, 1.0)
+        else:
+            t = np.clip(t, 0.0, 1.0)
+
+        last = len(self.lut) - 1
+        if last == 0:
+            return np.repeat(self.lut, len(t), axis=0)
+        pos = t * last
+        idx = np.minimum(pos.astype(np.int64), last - 1)
+        frac = (pos - idx)[:, None].astype(np.float32)
+        return self.lut[idx] * (1 - frac) + self.lut[idx + 1] * frac
+
+    def gradient(self, count: int, shift: float = 0.0, endpoint: bool = True) -> np.ndarray:
+        """沿调色盘均匀取 count 个颜色，第 i 个位于 i / (count - 1)（endpoint=False 时为 i / count）"""
+        count = max(int(count), 0)
+        if endpoint:
+            t = np.arange(count) / max(count - 1, 1)
+        else:
+            t = np.arange(count) / max(count, 1)
+        return self.sample(t, shift=shift)
+
+    def hex_gradient(self, count: int, shift: float = 0.0, endpoint: bool = True) -> list:
+        """gradient 的 HEX 字符串版本（供只接受 HEX 的 ManimGL 接口使用）"""
+        return rgb_array_to_hex(self.gradient(count, shift=shift, endpoint=endpoint))
+
+
+def _build_cinematic_palette(lut_resolution: int = 256) -> Palette:
+    """柔和电影彩虹：平方空间插值，段进度 0.4~0.6 内再向中间调混合至多 10%"""
+    base = Palette(CINEMATIC_COLORS, interpolation="rms", lut_resolution=lut_resolution)
+    steps = len(CINEMATIC_COLORS) - 1
+    pos = np.linspace(0.0, 1.0, len(base.lut))
+    seg = np.minimum((pos * steps).astype(np.int64), steps - 1)
+    local_t = pos * steps - seg
+
+    mid = np.stack([_parse_rgba(c) for c in CINEMATIC_MID_COLORS])[seg]
+    mix = np.where((local_t > 0.4) & (local_t < 0.6), (1.0 - np.abs(local_t - 0.5) * 5) * 0.1, 0.0)
+    lut = _interpolate_stops(base.lut, mid, mix, "rms")
+    return Palette.from_lut(lut, stops=base.stops)
+
+
+_palette_cache = {}
+
+
+def get_palette(
+    scheme,
+    interpolation: str = "linear",
+    default=None,
+) -> Palette:
+    """
+    获取调色盘（命名方案与 HEX 列表会被缓存）
+
+    Args:
+        scheme: 方案名、颜色序列或 Palette
+        interpolation: "linear" 或 "rms"（"cinematic" 固定使用其自身的插值）
+        default: scheme 为未知名称时使用的单色；None 时抛出 KeyError
+    """
+    if isinstance(scheme, Palette):
+        return scheme
+
+    if isinstance(scheme, str):
+        if scheme not in PALETTE_SCHEMES:
+            if default is None:
+                raise KeyError(f"未知调色盘 '{scheme}'，可选: {', '.join(PALETTE_SCHEMES)}")
+            return Palette([default])
+        key = (scheme, "lut" if scheme == "cinematic" else interpolation)
+    else:
+        scheme = list(scheme)
+        if not all(isinstance(c, str) for c in scheme):
+            return Palette(scheme, interpolation=interpolation)
+        key = (tuple(scheme), interpolation)
+
+    palette = _palette_cache.get(key)
+    if palette is None:
+        if key[0] == "cinematic":
+            palette = _build_cinematic_palette()
+        else:
+            colors = PALETTE_SCHEMES[scheme] if isinstance(scheme, str) else scheme
+            palette = Palette(colors, interpolation=interpolation)
+        _palette_cache[key] = palette
+    return palette
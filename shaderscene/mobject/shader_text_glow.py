@@ -25,6 +25,13 @@ from manimlib import *
 from manimlib.mobject.types.point_cloud_mobject import PMobject
 from manimlib.utils.color import color_to_rgba
 
+try:
+    from .arc_length_sampler import get_arc_length_lut
+    from .glyph_sample_cache import GlyphSampleCache, get_glyph_sample_cache
+except ImportError:
+    from arc_length_sampler import get_arc_length_lut
+    from glyph_sample_cache import GlyphSampleCache, get_glyph_sample_cache
+
 
 __all__ = [
     "TextBloomPointCloud",
@@ -143,6 +150,7 @@ class ShaderTextGlow(Group):
         sample_rate: float = 30.0,  # 每单位长度采样点数
         min_samples: int = 100,
         max_samples: int = 2000,
+        sample_cache: GlyphSampleCache | bool | None = True,
         **kwargs,
     ):
         """
@@ -155,6 +163,7 @@ class ShaderTextGlow(Group):
         - white_core_strength: 白色核心强度
         - falloff_power: 边缘衰减
         - sample_rate: 采样密度
+        - sample_cache: 字形采样缓存；True 使用持久化的默认缓存，None/False 关闭
         """
         super().__init__(**kwargs)
         
@@ -168,43 +177,45 @@ class ShaderTextGlow(Group):
         self._sample_rate = sample_rate
         self._min_samples = min_samples
         self._max_samples = max_samples
+        if sample_cache is True:
+            sample_cache = get_glyph_sample_cache()
+        self._sample_cache = sample_cache or None
         
         self._build_glow()
     
+    def _sample_outline(self, member) -> np.ndarray:
+        """沿单个 VMobject 轮廓按弧长均匀采样（LUT 同时给出周长）"""
+        lut = get_arc_length_lut(member)
+        num_samples = int(lut.total * self._sample_rate)
+        num_samples = max(self._min_samples, min(num_samples, self._max_samples))
+        return lut.sample(num_samples)
+    
     def _sample_mobject(self) -> np.ndarray:
-        """从 mobject 轮廓采样点"""
-        points_list = []
+        """从 mobject 轮廓采样点（逐字形查缓存，未命中才采样）"""
+        batches = []
+        params = ("text_bloom", self._sample_rate, self._min_samples, self._max_samples)
         
         for member in self.target.get_family():
             if not hasattr(member, "get_points") or not member.has_points():
                 continue
             
             if hasattr(member, "get_num_curves"):
-                # VMobject: 沿曲线均匀采样
-                num_curves = member.get_num_curves()
-                if num_curves > 0:
-                    # 计算采样数量
-                    perimeter = sum(
-                        np.linalg.norm(member.get_nth_curve_points(i)[-1] - member.get_nth_curve_points(i)[0])
-                        for i in range(min(num_curves, 50))
-                    )
-                    num_samples = int(perimeter * self._sample_rate)
-                    num_samples = max(self._min_samples, min(num_samples, self._max_samples))
-                    
-                    # 采样
-                    alphas = np.linspace(0, 1, num_samples, endpoint=False)
-                    sampled = [member.point_from_proportion(a) for a in alphas]
-                    points_list.extend(sampled)
+                # VMobject: 每个字形单独采样
+                if member.get_num_curves() > 0:
+                    if self._sample_cache is not None:
+                        batches.append(self._sample_cache.get_samples(member, params, self._sample_outline))
+                    else:
+                        batches.append(self._sample_outline(member))
             else:
                 # 其他类型：使用原始点
                 pts = member.get_points()
                 stride = max(1, len(pts) // self._max_samples)
-                points_list.extend(pts[::stride])
+                batches.append(pts[::stride])
         
-        if not points_list:
+        if not batches:
             return np.array([[0, 0, 0]], dtype=np.float32)
         
-        return np.array(points_list, dtype=np.float32)
+        return np.concatenate(batches, axis=0).astype(np.float32)
     
     def _build_glow(self):
         """构建辉光层"""
@@ -23,6 +23,7 @@ class SpecialGeodesicSphere(ShaderSurface):
     ):
         self.radius = radius
         self.center = np.array(center)
+        self.sphere_mesh = (self.radius, self.center)  # 复用缓存的单位球网格
         
         def sphere_func(u, v):
             # 球面参数方程
@@ -33,6 +34,7 @@ class SpecialGeodesicSphere(ShaderSurface):
         
         super().__init__(
             uv_func=sphere_func,
+            vectorized=True,
             u_range=u_range,
             v_range=v_range,
             resolution=resolution,
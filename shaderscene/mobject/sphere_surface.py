@@ -3,7 +3,118 @@ from numpy import *
 from typing import Callable, Iterable, Tuple
 from pathlib import Path
 
-class ShaderSurface(Surface):
+# 单位球网格缓存: (nu, nv, u_range, v_range, epsilon) -> (points, du_points, dv_points)
+_UNIT_SPHERE_MESH_CACHE = {}
+
+
+def get_unit_sphere_mesh(resolution, u_range, v_range, epsilon):
+    """
+    获取单位球（半径 1，球心原点）的 uv 网格，按分辨率缓存
+
+    Returns:
+        (points, du_points, dv_points)，均为只读的 (nu * nv, 3) 数组
+    """
+    nu, nv = resolution
+    key = (nu, nv, tuple(u_range), tuple(v_range), epsilon)
+    mesh = _UNIT_SPHERE_MESH_CACHE.get(key)
+    if mesh is None:
+        u_grid, v_grid = np.meshgrid(
+            np.linspace(*u_range, nu), np.linspace(*v_range, nv), indexing="ij"
+        )
+
+        def unit_sphere(u, v):
+            return np.stack([
+                np.sin(v) * np.cos(u),
+                np.sin(v) * np.sin(u),
+                np.cos(v),
+            ], axis=-1).reshape(nu * nv, 3)
+
+        mesh = tuple(
+            unit_sphere(u, v)
+            for u, v in ((u_grid, v_grid), (u_grid + epsilon, v_grid), (u_grid, v_grid + epsilon))
+        )
+        for arr in mesh:
+            arr.flags.writeable = False
+        _UNIT_SPHERE_MESH_CACHE[key] = mesh
+    return mesh
+
+
+class VectorizedUVMixin:
+    """
+    Surface 网格的向量化生成（混入到 Surface 子类之前）
+
+    - uv_func_vectorized=True: uv_func 直接接收整张 u/v 网格（NumPy 广播），
+      返回 (3, nu, nv) / (nu, nv, 3) 或各分量数组，替代逐点调用
+    - sphere_mesh=(radius, center): 球面直接复用缓存的单位球网格，
+      只做一次缩放+平移，无需求值 uv_func
+
+    两个属性需在 Surface.__init__ 之前设置；都未设置时退回逐点求值。
+    """
+    uv_func_vectorized: bool = False
+    sphere_mesh = None
+
+    def init_points(self):
+        try:
+            if self.sphere_mesh is not None:
+                radius, center = self.sphere_mesh
+                center = np.asarray(center, dtype=float)
+                unit_meshes = get_unit_sphere_mesh(
+                    self.resolution, self.u_range, self.v_range, self.epsilon
+                )
+                meshes = [radius * mesh + center for mesh in unit_meshes]
+            elif self.uv_func_vectorized:
+                meshes = self._eval_uv_grids()
+            else:
+                return super().init_points()
+        except (ValueError, TypeError):
+            # uv_func 不支持数组输入时退回逐点求值
+            return super().init_points()
+        self._set_uv_meshes(*meshes)
+
+    def _eval_uv_grids(self):
+        """在整张 u/v 网格上一次性求值 uv_func"""
+        nu, nv = self.resolution
+        dim = self.dim
+        u_grid, v_grid = np.meshgrid(
+            np.linspace(*self.u_range, nu), np.linspace(*self.v_range, nv), indexing="ij"
+        )
+
+        def evaluate(u, v):
+            result = self.uv_func(u, v)
+            if isinstance(result, (list, tuple)) or np.asarray(result).dtype == object:
+                result = np.stack([
+                    np.broadcast_to(np.asarray(c, dtype=float), u.shape) for c in result
+                ], axis=-1)
+            result = np.asarray(result, dtype=float)
+            if result.shape == (dim, *u.shape):
+                result = np.moveaxis(result, 0, -1)
+            if result.shape != (*u.shape, dim):
+                raise ValueError(f"uv_func 向量化输出形状不符: {result.shape}")
+            return result.reshape(nu * nv, dim)
+
+        return [
+            evaluate(u, v)
+            for u, v in ((u_grid, v_grid), (u_grid + self.epsilon, v_grid), (u_grid, v_grid + self.epsilon))
+        ]
+
+    def _set_uv_meshes(self, points, du_points, dv_points):
+        """按当前 manimgl 版本的 Surface 数据布局写入网格"""
+        names = getattr(getattr(self.data, "dtype", None), "names", None) or ()
+        if "du_point" in names:
+            self.set_points(points)
+            self.data["du_point"][:] = du_points
+            self.data["dv_point"][:] = dv_points
+        elif "d_normal_point" in names:
+            normals = np.cross(du_points - points, dv_points - points)
+            norms = np.linalg.norm(normals, axis=1, keepdims=True)
+            normals = np.divide(normals, norms, out=np.zeros_like(normals), where=norms > 0)
+            self.set_points(points)
+            self.data["d_normal_point"][:] = points + getattr(self, "normal_nudge", self.epsilon) * normals
+        else:
+            self.set_points(np.vstack([points, du_points, dv_points]))
+
+
+class ShaderSurface(VectorizedUVMixin, Surface):
     """着色器表面基类，从 calabi_yau_manifold.py 中复制"""
     shader_folder: str = str(Path(Path(__file__).parent.parent / "sphere_surface"))
 
@@ -13,9 +124,16 @@ class ShaderSurface(Surface):
             u_range: tuple[float, float] = (0, 1),
             v_range: tuple[float, float] = (0, 1),
             brightness = 1.5,
+            vectorized: bool = False,
             **kwargs
     ):
+        """
+        Args:
+            uv_func: 参数方程 (u, v) -> [x, y, z]
+            vectorized: uv_func 是否支持整张网格输入（NumPy 广播），见 VectorizedUVMixin
+        """
         self.passed_uv_func = uv_func
+        self.uv_func_vectorized = vectorized
         super().__init__(u_range=u_range, v_range=v_range, **kwargs)
 
         # 初始化shader uniforms
@@ -48,6 +166,8 @@ class SphereSurface(ShaderSurface):
     ):
         self.radius = radius
         self.center = np.array(center)
+        # 网格直接取自缓存的单位球（仿射变换），不逐点求值
+        self.sphere_mesh = (self.radius, self.center)
         
         def sphere_func(u, v):
             # 球面参数方程
@@ -64,6 +184,7 @@ class SphereSurface(ShaderSurface):
             v_range=v_range,
             resolution=resolution,
             brightness=brightness,
+            vectorized=True,
             **kwargs
         )
 
@@ -26,6 +26,7 @@ class SphericalPolyhedraSphere(ShaderSurface):
     ):
         self.radius = radius
         self.center = np.array(center)
+        self.sphere_mesh = (self.radius, self.center)  # 复用缓存的单位球网格
         self.time_scale = time_scale
         
         def sphere_func(u, v):
@@ -37,6 +38,7 @@ class SphericalPolyhedraSphere(ShaderSurface):
         
         super().__init__(
             uv_func=sphere_func,
+            vectorized=True,
             u_range=u_range,
             v_range=v_range,
             resolution=resolution,
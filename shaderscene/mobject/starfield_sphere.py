@@ -5,7 +5,12 @@ from pathlib import Path
 import sys
 import os
 
-class StarfieldSphere(Surface):
+try:
+    from .sphere_surface import VectorizedUVMixin
+except ImportError:
+    from sphere_surface import VectorizedUVMixin
+
+class StarfieldSphere(VectorizedUVMixin, Surface):
     """
     星空效果的球面，使用多层星星渲染技术
     基于 Shadertoy 的星空效果，适配到球面坐标系
@@ -36,6 +41,7 @@ class StarfieldSphere(Surface):
         self.center = np.array(center)
         self.time_scale = time_scale
         self.star_density = star_density
+        self.sphere_mesh = (self.radius, self.center)  # 复用缓存的单位球网格
 
         def sphere_func(u, v):
             # 球面参数方程
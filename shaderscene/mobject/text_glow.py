@@ -23,6 +23,7 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 from mobject.glow_wrapper import GlowWrapperEffect
+from mobject.glyph_sample_cache import get_glyph_sample_cache
 
 
 __all__ = [
@@ -49,10 +50,14 @@ class TextGlow(Group):
         white_glow_ratio: float = 0.15, # 很低的白色辉光
         alpha: float = 0.35,            # 低透明度避免模糊
         render_mode: str = "point",     # 使用点模式
+        sample_cache=True,              # 字形采样缓存（True 为持久化默认缓存）
         **kwargs,
     ):
         super().__init__(**kwargs)
         
+        if sample_cache is True:
+            sample_cache = get_glyph_sample_cache()
+        
         # 创建辉光 - 减少采样密度，使用点模式
         self.glow = GlowWrapperEffect(
             text_obj,
@@ -66,6 +71,7 @@ class TextGlow(Group):
             curve_sample_factor=30,      # 减少采样密度
             min_curve_samples=150,       # 降低最小采样数
             core_width_ratio=0.15,       # 小过渡区域
+            sample_cache=sample_cache or None,
         )
         
         # 关闭深度测试，避免重叠辉光四边形产生棱刺
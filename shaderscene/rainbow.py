@@ -12,6 +12,7 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 # 导入我们的高性能 TracingTail
 from mobject.TracingTailPMobject import *
+from mobject.palette import get_palette
 
 # --- Taichi 设置 ---
 ti.init(arch=ti.gpu)  # 使用GPU加速
@@ -68,61 +69,6 @@ def compute_cardioid_torus_positions(time: float):
         
         positions[i] = ti.Vector([x, y, z])
 
-def _calculate_cinematic_rainbow_color(index, total_points):
-    """计算柔和彩虹渐变色 - 使用指定的柔和色调"""
-    import math
-    
-    # 模仿cardioid_torus.py的逻辑：确保整个系统只显示一轮完整的彩虹色
-    # 将粒子索引线性映射到色相值 (0-100%)
-    progress = index / total_points
-    
-    # 使用指定的柔和色彩: CDB4DB, FFC8DD, FFAFCC, BDE0FE, A2D2FF
-    soft_colors = [
-        "#570487",  # 柔和紫色
-        "#8A0538",  # 柔和粉色
-        "#0D8307",  # 柔和粉红
-        "#044A88",  # 柔和蓝色
-        "#A66408",  # 柔和天蓝
-        "#000C8C"   # 回到起始颜色形成循环
-    ]
-    
-    # 计算所在的颜色段
-    num_segments = len(soft_colors) - 1
-    segment_idx = int(progress * num_segments)
-    segment_idx = min(segment_idx, num_segments - 1)  # 确保索引有效
-    
-    # 计算在当前段内的进度 (0-1)
-    segment_progress = (progress * num_segments) - segment_idx
-    
-    # 在两个相邻颜色之间进行插值
-    color1 = soft_colors[segment_idx]
-    color2 = soft_colors[segment_idx + 1]
-    
-    # 使用ManimGL的颜色插值，加入轻微的中间调增强
-    base_color = interpolate_color(color1, color2, segment_progress)
-    
-    # 特殊过渡增强 - 让颜色过渡更加平滑
-    if 0.4 < segment_progress < 0.6:
-        # 在中间区域增加一些微妙的混合
-        mid_factor = 1.0 - abs(segment_progress - 0.5) * 5  # 0.4-0.6 映射到 0.5-0.0
-        
-        # 根据所在段选择适当的中间色调增强
-        if segment_idx == 0:  # 紫色到粉色
-            mid_color = "#DB6DF9"  # 更淡的紫粉色
-        elif segment_idx == 1:  # 粉色到粉红
-            mid_color = "#FD82B1"  # 中间粉红色
-        elif segment_idx == 2:  # 粉红到蓝色
-            mid_color = "#9668F3"  # 淡紫蓝色
-        elif segment_idx == 3:  # 蓝色到天蓝
-            mid_color = "#79BEF7"  # 浅蓝色
-        else:  # 天蓝到紫色
-            mid_color = "#786FEF"  # 淡紫蓝色
-            
-        # 轻微混合中间色调
-        base_color = interpolate_color(base_color, mid_color, mid_factor * 0.1)
-    
-    return base_color
-
 @ti.kernel
 def compute_cinematic_colors():
     """计算每个点的颜色 - 柔和彩虹色彩处理"""
@@ -220,11 +166,10 @@ def compute_cinematic_colors():
 
 # 预计算所有颜色使用电影级别彩虹插值
 print("正在预计算电影级别彩虹颜色...")
-for i in range(total_points):
-    color = _calculate_cinematic_rainbow_color(i, total_points)
-    # 将ManimGL颜色转换为RGB数组
-    rgb = color_to_rgb(color)
-    cinematic_colors[i] = [rgb[0], rgb[1], rgb[2]]
+# 柔和彩虹（含段中间调增强）由共享调色盘 LUT 一次查表得到
+cinematic_colors.from_numpy(
+    get_palette("cinematic").gradient(total_points, endpoint=False)[:, :3].astype(np.float32)
+)
 
 # 初始化
 compute_cinematic_colors()
@@ -128,19 +128,9 @@ class HighPerformanceTracingTailDemo(ThreeDScene):
         
         self.add(self.dot_cloud)
         
-        # 创建追踪函数
-        tracer_functions = []
-        for i in range(total_points):
-            def create_tracer(idx):
-                def tracer():
-                    current_positions = positions.to_numpy()
-                    return current_positions[idx] if idx < len(current_positions) else ORIGIN
-                return tracer
-            tracer_functions.append(create_tracer(i))
-        
         # 创建多轨迹管理器（使用固定参数）
         self.multi_tails = MultiTracingTails(
-            traced_functions=tracer_functions,
+            position_provider=positions.to_numpy,   # 批量来源：整场一次拷贝喂给所有轨迹
             colors=initial_colors,
             max_tail_length=100,
             tail_lifetime=1.8,
@@ -181,7 +171,7 @@ class HighPerformanceTracingTailDemo(ThreeDScene):
             self.dot_cloud.set_points(new_positions)
             
             # 3. GPU shader并行更新所有轨迹
-            self.multi_tails.update_all_tails(dt)
+            self.multi_tails.update_all_tails(dt, new_positions)
         
         self.dot_cloud.add_updater(ultra_high_performance_updater)
         
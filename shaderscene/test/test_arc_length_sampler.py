@@ -0,0 +1,67 @@
+"""
+弧长 LUT 采样器测试（需要 ManimGL）
+
+运行方式:
+    python -m pytest shaderscene/test/test_arc_length_sampler.py -q
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ManimGL 导入时解析命令行参数，避免把 pytest 的参数当作 manimgl 参数
+sys.argv = sys.argv[:1]
+pytest.importorskip("manimlib")
+from manimlib import Circle, Square, VMobject
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mobject"))
+from arc_length_sampler import ArcLengthLUT, get_arc_length_lut, sample_vmobject_by_arc_length
+
+
+ALPHAS = np.linspace(0.0, 1.0, 64, endpoint=False)
+
+
+def _quick_points(mob, alphas):
+    return np.array([mob.quick_point_from_proportion(a) for a in alphas])
+
+
+def test_square_matches_quick_point_from_proportion():
+    # 四条边等长，各为一条曲线：按弧长与按曲线均分完全一致
+    square = Square(side_length=2.0)
+    lut = get_arc_length_lut(square)
+    assert lut.total == pytest.approx(8.0)
+    np.testing.assert_allclose(lut.evaluate(ALPHAS), _quick_points(square, ALPHAS), atol=1e-9)
+
+
+def test_circle_close_to_quick_point_from_proportion():
+    # 各段曲线等长，仅曲线内部的参数化与弧长略有差异
+    circle = Circle(radius=1.0)
+    lut = get_arc_length_lut(circle)
+    # 与逐点密集采样的折线长度一致（ManimGL 用二次曲线逼近圆，略长于 2π）
+    dense = _quick_points(circle, np.linspace(0.0, 1.0, 4001))
+    assert lut.total == pytest.approx(np.linalg.norm(np.diff(dense, axis=0), axis=1).sum(), rel=1e-3)
+    np.testing.assert_allclose(lut.evaluate(ALPHAS), _quick_points(circle, ALPHAS), atol=1e-2)
+    points = sample_vmobject_by_arc_length(circle, 200)
+    assert points.shape == (200, 3)
+    np.testing.assert_allclose(np.linalg.norm(points[:, :2], axis=1), 1.0, atol=5e-3)
+
+
+def test_lut_accepts_bezier_tuple_generator():
+    square = Square()
+    from_generator = ArcLengthLUT(square.get_bezier_tuples())
+    from_points = ArcLengthLUT.from_points(square.get_points())
+    np.testing.assert_allclose(from_generator.cumulative, from_points.cumulative)
+
+
+def test_subpath_jumps_have_zero_length():
+    outer = Square(side_length=4.0)
+    inner = Square(side_length=2.0)
+    shape = VMobject()
+    shape.start_new_path(outer.get_points()[0])
+    shape.append_points(outer.get_points()[1:])
+    shape.start_new_path(inner.get_points()[0])
+    shape.append_points(inner.get_points()[1:])
+    lut = get_arc_length_lut(shape)
+    assert lut.total == pytest.approx(16.0 + 8.0)
@@ -0,0 +1,42 @@
+#version 330
+
+// 增量上传版本：顶点只携带出生时间，进度/宽度/透明度/辉光在此推导
+uniform float time;
+uniform float tail_lifetime;
+uniform float glow_factor;
+uniform float glow_falloff;
+uniform float width_start;
+uniform float width_end;
+uniform float opacity_start;
+uniform float opacity_end;
+
+// 输入属性：轨迹点数据
+in vec3 point;
+in vec4 rgba;
+in float birth_time;
+in vec3 prev_dir;
+in vec3 next_dir;
+
+// 输出到几何着色器的变量（与 tracing_tail_glow_shader 保持一致）
+out vec3 v_point;
+out vec4 v_rgba;
+out float v_tail_progress;
+out float v_tail_width;
+out float v_glow_intensity;
+out vec3 v_prev_dir;
+out vec3 v_next_dir;
+
+void main(){
+    float progress = clamp((time - birth_time) / max(tail_lifetime, 1e-6), 0.0, 1.0);
+
+    v_point = point;
+    v_rgba = vec4(rgba.rgb, rgba.a * mix(opacity_start, opacity_end, progress));
+    v_tail_progress = progress;
+    v_tail_width = mix(width_start, width_end, progress);
+    v_glow_intensity = glow_factor * (1.0 - progress * glow_falloff);
+    v_prev_dir = prev_dir;
+    v_next_dir = next_dir;
+
+    // 基础顶点位置变换
+    gl_Position = vec4(point, 1.0);
+}
@@ -0,0 +1,385 @@
+"""
+离线音频预混（整段配乐一次合成，一次封装）
+
+ManimGL 的 add_sound 每次调用都会解码音频，并把它 overlay 到整条 pydub 音轨上；
+每次 overlay 都复制整条音轨，几百个音效 + 配音在 10 分钟视频里是 O(片段数 × 总时长)。
+这里改为渲染期间只记录 (时间, 路径, 增益) 事件，结束时在 NumPy 中一次混音：
+
+- 同一音效文件只解码一次（按 (路径, 大小, mtime) 缓存），并重采样到统一采样率/声道
+- WAV（PCM）直接解析，其他格式（MP3/M4A）通过 ffmpeg 解码
+- 按时间块混音（每块只叠加与之重叠的事件），内存占用与总时长无关
+- 输出一个 16-bit WAV，交给 ManimGL 作为唯一一段声音封装进视频
+
+增益与 ManimGL add_sound 一致，单位为 dB（pydub apply_gain）。
+
+使用方法:
+    from utils.audio_mixer import AudioTimeline
+
+    timeline = AudioTimeline(sample_rate=44100)
+    timeline.add(1.5, "pop.mp3", gain=0.6)
+    timeline.add(2.0, "line_001.mp3")
+    timeline.export_wav("soundtrack.wav")
+
+命令行基准（10 分钟视频：逐个 overlay vs 离线预混）:
+    python utils/audio_mixer.py --benchmark
+"""
+
+import os
+import subprocess
+import time
+import wave
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_SAMPLE_RATE = 44100
+DEFAULT_CHANNELS = 2
+
+
+# ==================== 解码 ====================
+
+def _convert_channels(samples: np.ndarray, channels: int) -> np.ndarray:
+    """(n, c) -> (n, channels)：单声道复制，多声道下混为单声道或取前几个声道"""
+    current = samples.shape[1]
+    if current == channels:
+        return samples
+    if current == 1:
+        return np.repeat(samples, channels, axis=1)
+    if channels == 1:
+        return samples.mean(axis=1, keepdims=True)
+    return samples[:, :channels]
+
+
+def resample(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """线性插值重采样 (n, c) float32"""
+    if src_rate == dst_rate or len(samples) == 0:
+        return samples
+    n_out = int(round(len(samples) * dst_rate / src_rate))
+    positions = np.arange(n_out, dtype=np.float64) * (src_rate / dst_rate)
+    source = np.arange(len(samples), dtype=np.float64)
+    out = np.empty((n_out, samples.shape[1]), dtype=np.float32)
+    for channel in range(samples.shape[1]):
+        out[:, channel] = np.interp(positions, source, samples[:, channel])
+    return out
+
+
+def _decode_wav(path: str) -> Optional[Tuple[np.ndarray, int]]:
+    """PCM WAV -> ((n, c) float32, 采样率)；非 PCM（如浮点 WAV）返回 None"""
+    try:
+        with wave.open(path, "rb") as f:
+            channels = f.getnchannels()
+            width = f.getsampwidth()
+            rate = f.getframerate()
+            raw = f.readframes(f.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    if width == 1:
+        data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        data = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        ints = np.where(ints >= 1 << 23, ints - (1 << 24), ints)
+        data = ints.astype(np.float32) / float(1 << 23)
+    elif width == 4:
+        data = (np.frombuffer(raw, dtype="<i4").astype(np.float64) / 2 ** 31).astype(np.float32)
+    else:
+        return None
+    return data.reshape(-1, channels), rate
+
+
+def _decode_ffmpeg(path: str, sample_rate: int, channels: int) -> Optional[np.ndarray]:
+    """ffmpeg 解码并重采样为 (n, channels) float32"""
+    command = [
+        "ffmpeg", "-v", "error", "-i", path,
+        "-f", "f32le", "-acodec", "pcm_f32le",
+        "-ac", str(channels), "-ar", str(sample_rate), "-",
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, timeout=120)
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"⚠️ ffmpeg 解码失败: {os.path.basename(path)} ({e})")
+        return None
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", "replace").strip().splitlines()
+        print(f"⚠️ ffmpeg 解码失败: {os.path.basename(path)} ({message[-1] if message else result.returncode})")
+        return None
+    return np.frombuffer(result.stdout, dtype="<f4").reshape(-1, channels)
+
+
+def decode_audio(path: str, sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 channels: int = DEFAULT_CHANNELS) -> Optional[np.ndarray]:
+    """
+    解码音频为 (n, channels) float32（-1~1），采样率统一为 sample_rate
+
+    Returns:
+        样本数组；无法解码时返回 None
+    """
+    if path.lower().endswith(".wav"):
+        decoded = _decode_wav(path)
+        if decoded is not None:
+            samples, rate = decoded
+            samples = _convert_channels(samples, channels)
+            return np.ascontiguousarray(resample(samples, rate, sample_rate), dtype=np.float32)
+    return _decode_ffmpeg(path, sample_rate, channels)
+
+
+class ClipCache:
+    """
+    已解码片段缓存
+
+    键为 (绝对路径, 大小, mtime_ns, 采样率, 声道数)，文件改动后自动失效；
+    超出 max_bytes 时按插入顺序淘汰最早的片段。
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 ** 2):
+        self.max_bytes = max_bytes
+        self._clips: Dict[tuple, Optional[np.ndarray]] = {}
+        self._bytes = 0
+        self.stats = {"hits": 0, "decoded": 0}
+
+    def get(self, path: str, sample_rate: int, channels: int) -> Optional[np.ndarray]:
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (path, st.st_size, st.st_mtime_ns, sample_rate, channels)
+        if key in self._clips:
+            self.stats["hits"] += 1
+            return self._clips[key]
+
+        clip = decode_audio(path, sample_rate, channels)
+        self.stats["decoded"] += 1
+        self._clips[key] = clip
+        if clip is not None:
+            self._bytes += clip.nbytes
+            while self._bytes > self.max_bytes and len(self._clips) > 1:
+                oldest = next(iter(self._clips))
+                evicted = self._clips.pop(oldest)
+                if evicted is not None:
+                    self._bytes -= evicted.nbytes
+        return clip
+
+    def clear(self) -> None:
+        self._clips.clear()
+        self._bytes = 0
+
+
+_shared_clip_cache: Optional[ClipCache] = None
+
+
+def get_clip_cache() -> ClipCache:
+    """进程内共享的片段缓存（同一进程渲染多个场景时复用音效解码结果）"""
+    global _shared_clip_cache
+    if _shared_clip_cache is None:
+        _shared_clip_cache = ClipCache()
+    return _shared_clip_cache
+
+
+# ==================== 时间线 ====================
+
+class AudioTimeline:
+    """
+    音频事件时间线
+
+    渲染期间 add() 只记录事件；mix() / export_wav() 时统一解码与混音。
+    多个片段重叠时直接相加，最后统一限幅到 [-1, 1]。
+    """
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = DEFAULT_CHANNELS,
+                 clip_cache: Optional[ClipCache] = None, block_seconds: float = 10.0):
+        """
+        Args:
+            sample_rate: 输出采样率
+            channels: 输出声道数
+            clip_cache: 片段缓存，默认使用进程内共享缓存
+            block_seconds: 混音块时长（秒）
+        """
+        self.sample_rate = int(sample_rate)
+        self.channels = int(channels)
+        self.clip_cache = clip_cache or get_clip_cache()
+        self.block_size = max(int(block_seconds * self.sample_rate), 1)
+        self.events: List[Tuple[float, str, float]] = []
+
+    def add(self, time: float, path: str, gain: Optional[float] = None) -> None:
+        """
+        记录一个声音事件
+
+        Args:
+            time: 开始时间（秒，≥ 0）
+            path: 音频文件路径
+            gain: 增益（dB），None 为 0
+        """
+        if time < 0:
+            raise ValueError(f"声音开始时间不能为负: {time}")
+        self.events.append((float(time), path, float(gain or 0.0)))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def clear(self) -> None:
+        self.events.clear()
+
+    def _resolve_events(self):
+        """解码事件片段，返回 (起始样本, 结束样本, 片段, 线性增益) 的数组与列表"""
+        starts, ends, clips, gains = [], [], [], []
+        for time_sec, path, gain_db in self.events:
+            clip = self.clip_cache.get(path, self.sample_rate, self.channels)
+            if clip is None or len(clip) == 0:
+                continue
+            start = int(round(time_sec * self.sample_rate))
+            starts.append(start)
+            ends.append(start + len(clip))
+            clips.append(clip)
+            gains.append(10.0 ** (gain_db / 20.0))
+        return np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64), clips, gains
+
+    def iter_blocks(self, min_duration: float = 0.0):
+        """按块生成混音结果 (block_size, channels) float32（未限幅）"""
+        starts, ends, clips, gains = self._resolve_events()
+        total = max(int(ends.max()) if len(ends) else 0, int(round(min_duration * self.sample_rate)))
+        for block_start in range(0, total, self.block_size):
+            block_end = min(block_start + self.block_size, total)
+            block = np.zeros((block_end - block_start, self.channels), dtype=np.float32)
+            for i in np.flatnonzero((starts < block_end) & (ends > block_start)):
+                lo = max(int(starts[i]), block_start)
+                hi = min(int(ends[i]), block_end)
+                segment = clips[i][lo - starts[i]:hi - starts[i]]
+                if gains[i] == 1.0:
+                    block[lo - block_start:hi - block_start] += segment
+                else:
+                    block[lo - block_start:hi - block_start] += segment * np.float32(gains[i])
+            yield block
+
+    def mix(self, min_duration: float = 0.0) -> np.ndarray:
+        """完整混音 (n, channels) float32，已限幅"""
+        blocks = list(self.iter_blocks(min_duration))
+        if not blocks:
+            return np.zeros((0, self.channels), dtype=np.float32)
+        return np.clip(np.concatenate(blocks), -1.0, 1.0)
+
+    def export_wav(self, path: str, min_duration: float = 0.0) -> Optional[str]:
+        """
+        混音并写出 16-bit PCM WAV（逐块写入）
+
+        Returns:
+            path；没有可用事件时不写文件，返回 None
+        """
+        n_frames = 0
+        with wave.open(path, "wb") as f:
+            f.setnchannels(self.channels)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            for block in self.iter_blocks(min_duration):
+                pcm = np.clip(block, -1.0, 1.0) * 32767.0
+                f.writeframes(np.round(pcm).astype("<i2").tobytes())
+                n_frames += len(block)
+        if n_frames == 0:
+            os.remove(path)
+            return None
+        return path
+
+
+# ==================== 基准 ====================
+
+def _write_test_wav(path: str, seconds: float, frequency: float, sample_rate: int, channels: int) -> None:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = 0.3 * np.sin(2 * np.pi * frequency * t) * np.exp(-3 * t / seconds)
+    pcm = np.repeat((tone * 32767).astype("<i2")[:, None], channels, axis=1)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+
+
+def benchmark_premix(duration: float = 600.0, n_effects: int = 400, n_voice: int = 150,
+                     seed: int = 0) -> dict:
+    """
+    10 分钟视频的音轨构建耗时：ManimGL 式逐个 overlay vs 离线预混
+
+    音效为 44.1kHz 立体声 0.3s 片段（8 种循环使用），配音为 24kHz 单声道 3s 片段（各不相同，
+    需要重采样）。两条路径都以 SceneFileWriter 导出最终 WAV 结束，之后的 ffmpeg 封装是同一次调用。
+    pydub 未安装时只测预混路径。
+
+    Returns:
+        {"events", "overlay_s", "premix_s", "speedup"}（overlay_s / speedup 可能为 None）
+    """
+    import tempfile
+
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        effects = []
+        for i in range(8):
+            path = os.path.join(tmp, f"effect_{i}.wav")
+            _write_test_wav(path, 0.3, 440 + 110 * i, 44100, 2)
+            effects.append(path)
+        events = [(float(t), effects[i % len(effects)], 0.6)
+                  for i, t in enumerate(rng.uniform(0, duration - 1, n_effects))]
+        for i, t in enumerate(np.linspace(0, duration - 4, n_voice)):
+            path = os.path.join(tmp, f"voice_{i:03d}.wav")
+            _write_test_wav(path, 3.0, 200 + i, 24000, 1)
+            events.append((float(t), path, 0.0))
+        events.sort()
+
+        overlay = None
+        try:
+            from pydub import AudioSegment
+        except ImportError:
+            AudioSegment = None
+        if AudioSegment is not None:
+            # 与 SceneFileWriter.add_audio_segment 相同的逐个 overlay
+            t0 = time.perf_counter()
+            segment = AudioSegment.silent()
+            for t, path, gain in events:
+                clip = AudioSegment.from_file(path).apply_gain(gain)
+                new_end = t + clip.duration_seconds
+                if new_end > segment.duration_seconds:
+                    segment = segment.append(
+                        AudioSegment.silent(int(np.ceil((new_end - segment.duration_seconds) * 1000))),
+                        crossfade=0,
+                    )
+                segment = segment.overlay(clip, position=int(1000 * t))
+            segment.export(os.path.join(tmp, "overlay.wav"), format="wav")
+            overlay = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        timeline = AudioTimeline(sample_rate=44100, channels=2, clip_cache=ClipCache())
+        for t, path, gain in events:
+            timeline.add(t, path, gain)
+        mixed_path = timeline.export_wav(os.path.join(tmp, "premix.wav"))
+        if AudioSegment is not None:
+            # 预混结果作为唯一一段声音交给 SceneFileWriter，再由它导出
+            mixed = AudioSegment.from_file(mixed_path)
+            segment = AudioSegment.silent().append(
+                AudioSegment.silent(int(np.ceil(mixed.duration_seconds * 1000))), crossfade=0,
+            )
+            segment = segment.overlay(mixed, position=0)
+            segment.export(os.path.join(tmp, "final.wav"), format="wav")
+        premix = time.perf_counter() - t0
+
+    return {
+        "events": len(events),
+        "overlay_s": overlay,
+        "premix_s": premix,
+        "speedup": overlay / max(premix, 1e-9) if overlay is not None else None,
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        result = benchmark_premix()
+        print(f"🎵 事件数: {result['events']}")
+        if result["overlay_s"] is not None:
+            print(f"逐个 overlay: {result['overlay_s']:.2f}s")
+        else:
+            print("逐个 overlay: 跳过（pydub 未安装）")
+        print(f"离线预混: {result['premix_s']:.2f}s")
+        if result["speedup"] is not None:
+            print(f"加速: {result['speedup']:.1f}x")
@@ -0,0 +1,407 @@
+"""
+音频时长探测（纯 Python，只读帧头）
+
+不解码音频即可得到精确时长（微秒）：
+- MP3: 跳过 ID3v2，优先读取 Xing/Info/VBRI 帧数（并扣除 LAME 编码延迟/填充），
+       否则逐帧遍历帧头累加采样数
+- WAV: 解析 RIFF fmt/data 块
+- MP4/M4A（部分音效以 .mp3 扩展名保存）: 读取音轨 mdhd 的时长与时间刻度
+
+配合 DurationIndex 把结果按内容哈希写入旁路索引文件，
+重复渲染时连帧头都不用再解析。
+
+使用方法:
+    from utils.audio_probe import probe_duration_us, DurationIndex
+
+    us = probe_duration_us("line.mp3")          # 失败返回 None
+    index = DurationIndex("durations.json")
+    seconds = index.get_seconds("line.mp3")     # 命中索引或探测后写入
+"""
+
+import hashlib
+import json
+import os
+import struct
+from typing import Optional
+
+
+# ==================== MP3 ====================
+
+# 比特率表 (kbps)，索引 [版本组][层][bitrate_index]
+# 版本组: 0 = MPEG-1, 1 = MPEG-2/2.5；层: 1/2/3
+_BITRATES = {
+    (0, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (0, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (0, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (1, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (1, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (1, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+# 采样率表，键为版本位: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+_SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000],
+}
+
+
+def _parse_frame_header(data: bytes, pos: int):
+    """
+    解析 MP3 帧头
+
+    Returns:
+        (frame_length, samples_per_frame, sample_rate, version_bits, channel_mode)，
+        非法帧头返回 None
+    """
+    if pos + 4 > len(data):
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (b1 >> 3) & 0x03
+    layer_bits = (b1 >> 1) & 0x03
+    bitrate_index = (b2 >> 4) & 0x0F
+    sr_index = (b2 >> 2) & 0x03
+    padding = (b2 >> 1) & 0x01
+    channel_mode = (b3 >> 6) & 0x03
+
+    # 保留值 / 自由格式不支持
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sr_index == 3:
+        return None
+
+    layer = 4 - layer_bits
+    group = 0 if version_bits == 3 else 1
+    bitrate = _BITRATES[(group, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][sr_index]
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or group == 0:
+        samples = 1152
+        length = 144 * bitrate // sample_rate + padding
+    else:
+        samples = 576
+        length = 72 * bitrate // sample_rate + padding
+
+    if length < 4:
+        return None
+    return length, samples, sample_rate, version_bits, channel_mode
+
+
+def _skip_id3v2(data: bytes) -> int:
+    """返回 ID3v2 标签之后的偏移（可能有多个连续标签）"""
+    pos = 0
+    while data[pos:pos + 3] == b"ID3" and pos + 10 <= len(data):
+        flags = data[pos + 5]
+        size = 0
+        for b in data[pos + 6:pos + 10]:
+            size = (size << 7) | (b & 0x7F)
+        pos += 10 + size + (10 if flags & 0x10 else 0)
+    return pos
+
+
+def _find_first_frame(data: bytes, pos: int):
+    """查找第一个有效帧（要求紧随其后的帧头也合法，避免误同步）"""
+    end = len(data) - 4
+    while pos < end:
+        pos = data.find(b"\xFF", pos)
+        if pos < 0 or pos >= end:
+            return None, None
+        header = _parse_frame_header(data, pos)
+        if header:
+            nxt = pos + header[0]
+            if nxt >= len(data) - 4 or _parse_frame_header(data, nxt):
+                return pos, header
+        pos += 1
+    return None, None
+
+
+def _vbr_frame_count(data: bytes, pos: int, header):
+    """
+    读取 Xing/Info 或 VBRI 头
+
+    Returns:
+        (音频帧数, 编码延迟+填充采样数)，没有 VBR 头返回 None
+    """
+    _, _, _, version_bits, channel_mode = header
+    mono = channel_mode == 3
+    if version_bits == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+
+    xing = pos + 4 + side_info
+    tag = data[xing:xing + 4]
+    if tag in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if not flags & 0x01:
+            return None
+        frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+        offset = xing + 8 + 4
+        if flags & 0x02:
+            offset += 4
+        if flags & 0x04:
+            offset += 100
+        if flags & 0x08:
+            offset += 4
+        # LAME 扩展标签：偏移 21 处 24 位 = 12 位延迟 + 12 位填充
+        gap = 0
+        if data[offset:offset + 4] in (b"LAME", b"Lavf", b"Lavc"):
+            raw = data[offset + 21:offset + 24]
+            if len(raw) == 3:
+                delay = (raw[0] << 4) | (raw[1] >> 4)
+                pad = ((raw[1] & 0x0F) << 8) | raw[2]
+                gap = delay + pad
+        return frames, gap
+
+    vbri = pos + 4 + 32
+    if data[vbri:vbri + 4] == b"VBRI":
+        frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+        return frames, 0
+    return None
+
+
+def mp3_duration_us(data: bytes) -> Optional[int]:
+    """MP3 数据的精确时长（微秒），无法解析返回 None"""
+    pos, header = _find_first_frame(data, _skip_id3v2(data))
+    if pos is None:
+        return None
+    sample_rate = header[2]
+    samples_per_frame = header[1]
+
+    vbr = _vbr_frame_count(data, pos, header)
+    if vbr is not None:
+        frames, gap = vbr
+        samples = max(frames * samples_per_frame - gap, 0)
+        return samples * 1_000_000 // sample_rate
+
+    samples = 0
+    end = len(data)
+    while pos < end - 4:
+        frame = _parse_frame_header(data, pos)
+        if frame is None:
+            if data[pos:pos + 3] == b"TAG":  # ID3v1
+                break
+            # 失步：向后重新寻找帧头
+            pos, frame = _find_first_frame(data, pos + 1)
+            if pos is None:
+                break
+        if pos + frame[0] > end:
+            break  # 截断的末帧不计入
+        samples += frame[1]
+        pos += frame[0]
+    return samples * 1_000_000 // sample_rate
+
+
+# ==================== WAV ====================
+
+def wav_duration_us(data: bytes) -> Optional[int]:
+    """WAV（RIFF/WAVE）数据的精确时长（微秒），无法解析返回 None"""
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    pos = 12
+    block_align = sample_rate = None
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        size = struct.unpack("<I", data[pos + 4:pos + 8])[0]
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            _, _, sample_rate, _, block_align = struct.unpack("<HHIIH", data[body:body + 14])
+        elif chunk_id == b"data":
+            if not block_align or not sample_rate:
+                return None
+            # 流式写入的 WAV 可能把 data 大小写成 0 或 0xFFFFFFFF
+            available = len(data) - body
+            if size == 0 or size > available:
+                size = available
+            frames = size // block_align
+            return frames * 1_000_000 // sample_rate
+        pos = body + size + (size & 1)
+    return None
+
+
+# ==================== MP4 / M4A ====================
+
+_MP4_CONTAINERS = {b"moov", b"trak", b"mdia"}
+
+
+def _iter_boxes(data: bytes, start: int, end: int):
+    """遍历 [start, end) 内的 MP4 box，产出 (类型, 内容起点, box 终点)"""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", data[pos + 8:pos + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield box_type, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _find_box(data: bytes, box_path: tuple, start: int, end: int) -> Optional[int]:
+    """按路径查找 box，返回其内容起点"""
+    for box_type, body, box_end in _iter_boxes(data, start, end):
+        if box_type == box_path[0]:
+            if len(box_path) == 1:
+                return body
+            if box_type in _MP4_CONTAINERS:
+                found = _find_box(data, box_path[1:], body, box_end)
+                if found is not None:
+                    return found
+    return None
+
+
+def mp4_duration_us(data: bytes) -> Optional[int]:
+    """MP4/M4A 数据的时长（微秒）：优先音轨 mdhd，其次 mvhd"""
+    for box_path in ((b"moov", b"trak", b"mdia", b"mdhd"), (b"moov", b"mvhd")):
+        body = _find_box(data, box_path, 0, len(data))
+        if body is None:
+            continue
+        version = data[body]
+        if version == 1:
+            timescale, duration = struct.unpack(">IQ", data[body + 20:body + 32])
+        else:
+            timescale, duration = struct.unpack(">II", data[body + 12:body + 20])
+        if timescale:
+            return duration * 1_000_000 // timescale
+    return None
+
+
+# ==================== 统一入口 ====================
+
+def probe_duration_us(path: str, data: bytes = None) -> Optional[int]:
+    """
+    探测音频时长（微秒）
+
+    按文件头识别 WAV / MP4 / MP3，不依赖扩展名。
+
+    Args:
+        path: 音频文件路径
+        data: 已读入的文件内容（可选，避免重复读取）
+
+    Returns:
+        时长（微秒），无法识别返回 None
+    """
+    if data is None:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+    if data[:4] == b"RIFF":
+        return wav_duration_us(data)
+    if data[4:8] == b"ftyp":
+        return mp4_duration_us(data)
+    return mp3_duration_us(data)
+
+
+def probe_sample_rate(path: str, data: bytes = None) -> Optional[int]:
+    """
+    探测采样率（Hz）：WAV 读 fmt 块，MP4 读音轨 mdhd 时间刻度，MP3 读首帧帧头
+
+    Returns:
+        采样率，无法识别返回 None
+    """
+    if data is None:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+    if data[:4] == b"RIFF":
+        pos = 12
+        while pos + 8 <= len(data):
+            size = struct.unpack("<I", data[pos + 4:pos + 8])[0]
+            if data[pos:pos + 4] == b"fmt ":
+                return struct.unpack("<I", data[pos + 12:pos + 16])[0] or None
+            pos += 8 + size + (size & 1)
+        return None
+    if data[4:8] == b"ftyp":
+        body = _find_box(data, (b"moov", b"trak", b"mdia", b"mdhd"), 0, len(data))
+        if body is None:
+            return None
+        offset = 20 if data[body] == 1 else 12
+        return struct.unpack(">I", data[body + offset:body + offset + 4])[0] or None
+    _, header = _find_first_frame(data, _skip_id3v2(data))
+    return None if header is None else header[2]
+
+
+class DurationIndex:
+    """
+    时长旁路索引：内容哈希 -> 微秒
+
+    - 按文件内容（blake2b）寻址，文件改名/移动/复制仍命中
+    - 进程内再按 (path, size, mtime_ns) 记忆，命中时不读文件
+    - 只在有新条目时回写 JSON
+    """
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self._entries = {}
+        self._stat_memo = {}
+        self._dirty = False
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f).get("durations_us", {})
+        except (OSError, ValueError):
+            self._entries = {}
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get_us(self, path: str) -> Optional[int]:
+        """获取时长（微秒）：进程内记忆 -> 索引 -> 帧头探测"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stat_key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        if stat_key in self._stat_memo:
+            return self._stat_memo[stat_key]
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        key = self.content_hash(data)
+        duration = self._entries.get(key)
+        if duration is None:
+            duration = probe_duration_us(path, data)
+            if duration is None:
+                return None
+            self._entries[key] = duration
+            self._dirty = True
+            self.save()
+        self._stat_memo[stat_key] = duration
+        return duration
+
+    def get_seconds(self, path: str) -> Optional[float]:
+        us = self.get_us(path)
+        return None if us is None else us / 1_000_000
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "durations_us": self._entries}, f, sort_keys=True)
+        os.replace(tmp, self.index_path)
+        self._dirty = False
+
+
+if __name__ == "__main__":
+    import sys
+
+    for p in sys.argv[1:]:
+        us = probe_duration_us(p)
+        print(f"{p}: {'无法解析' if us is None else f'{us / 1e6:.6f}s'}")
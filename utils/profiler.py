@@ -0,0 +1,207 @@
+"""
+热点剖析器（Chrome trace_event 导出）
+
+高精度计时（perf_counter_ns）记录嵌套的耗时区间，可导出为 Chrome trace JSON
+（chrome://tracing 或 https://ui.perfetto.dev 打开），并按分段打印 Top-N 摘要。
+
+- Profiler.wrap(func) 包装任意函数；Profiler.span(name) 为上下文管理器
+- 每个区间同时记录总耗时与自身耗时（扣除嵌套子区间）
+- instrument_updaters() 把 mobject 的 updater 替换为计时包装，
+  包装与原函数比较相等、保留 __code__ / 签名，remove_updater 与 dt 参数检测照常工作
+- 不启用时调用方不安装任何包装，没有额外开销
+
+使用方法:
+    from utils.profiler import Profiler
+
+    profiler = Profiler()
+    build = profiler.wrap(build, "build", "mobject")
+    with profiler.span("render", "render"):
+        ...
+    profiler.export_chrome_trace("scene.trace.json")
+    profiler.print_summary(top_n=10)
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class Profiler:
+    """
+    嵌套区间计时器
+
+    events: [(名称, 类别, 开始 ns, 总耗时 ns, 自身耗时 ns, 分段, 线程 id), ...]
+    每个线程各自维护嵌套栈。
+    """
+
+    def __init__(self):
+        self.events: List[tuple] = []
+        self.section = "main"
+        self.sections: List[tuple] = [("main", time.perf_counter_ns())]
+        self._origin = time.perf_counter_ns()
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self) -> None:
+        self._stack().append([time.perf_counter_ns(), 0])
+
+    def end(self, name: str, category: str = "") -> None:
+        stack = self._stack()
+        start, child = stack.pop()
+        duration = time.perf_counter_ns() - start
+        if stack:
+            stack[-1][1] += duration
+        self.events.append((name, category, start, duration, duration - child,
+                            self.section, threading.get_ident()))
+
+    @contextmanager
+    def span(self, name: str, category: str = ""):
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end(name, category)
+
+    def wrap(self, func: Callable, name: Optional[str] = None, category: str = "") -> Callable:
+        """返回计时包装后的函数"""
+        name = name or getattr(func, "__qualname__", repr(func))
+
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            self.begin()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.end(name, category)
+
+        return profiled
+
+    def set_section(self, name: str) -> None:
+        """之后记录的区间归入分段 name"""
+        self.section = name
+        self.sections.append((name, time.perf_counter_ns()))
+
+    # ==================== 导出 ====================
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome trace_event 格式（完整事件 "X"，时间单位微秒）"""
+        pid = os.getpid()
+        trace = [
+            {
+                "name": name, "cat": category or "default", "ph": "X",
+                "ts": (start - self._origin) / 1000, "dur": duration / 1000,
+                "pid": pid, "tid": tid,
+                "args": {"section": section, "self_ms": self_ns / 1e6},
+            }
+            for name, category, start, duration, self_ns, section, tid in self.events
+        ]
+        trace += [
+            {"name": f"section: {name}", "ph": "i", "s": "p",
+             "ts": (start - self._origin) / 1000, "pid": pid, "tid": 0}
+            for name, start in self.sections
+        ]
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        return path
+
+    def summary(self, top_n: int = 10) -> Dict[str, List[dict]]:
+        """
+        按分段汇总，每段按自身耗时降序取前 top_n
+
+        Returns:
+            {分段: [{"name", "category", "count", "total_ms", "self_ms"}, ...]}
+        """
+        table: Dict[str, Dict[str, dict]] = {}
+        for name, category, _, duration, self_ns, section, _ in self.events:
+            row = table.setdefault(section, {}).setdefault(
+                name, {"name": name, "category": category, "count": 0, "total_ms": 0.0, "self_ms": 0.0}
+            )
+            row["count"] += 1
+            row["total_ms"] += duration / 1e6
+            row["self_ms"] += self_ns / 1e6
+        return {
+            section: sorted(rows.values(), key=lambda r: r["self_ms"], reverse=True)[:top_n]
+            for section, rows in table.items()
+        }
+
+    def print_summary(self, top_n: int = 10) -> None:
+        for section, rows in self.summary(top_n).items():
+            print(f"⏱️ [{section}] Top {len(rows)}（按自身耗时）")
+            for row in rows:
+                print(f"   {row['self_ms']:>10.1f} ms  总 {row['total_ms']:>10.1f} ms  "
+                      f"×{row['count']:<6} {row['category']:<9} {row['name']}")
+
+
+# ==================== updater 计时 ====================
+
+class _TimedUpdater:
+    """
+    updater 计时包装
+
+    与原函数比较相等（remove_updater 可用原函数移除），并暴露原函数的 __code__ 与签名，
+    ManimGL 按 "dt" in __code__.co_varnames / 参数个数区分时间相关 updater 的逻辑不受影响。
+    """
+
+    def __init__(self, profiler: Profiler, func: Callable, name: str):
+        self._profiler = profiler
+        self.__wrapped__ = func
+        self.__name__ = getattr(func, "__name__", name)
+        self._name = name
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            self.__code__ = code
+        try:
+            self.__signature__ = inspect.signature(func)
+        except (TypeError, ValueError):
+            pass
+
+    def __call__(self, *args, **kwargs):
+        self._profiler.begin()
+        try:
+            return self.__wrapped__(*args, **kwargs)
+        finally:
+            self._profiler.end(self._name, "updater")
+
+    def __eq__(self, other):
+        if isinstance(other, _TimedUpdater):
+            other = other.__wrapped__
+        return self.__wrapped__ == other
+
+    def __hash__(self):
+        return hash(self.__wrapped__)
+
+
+_UPDATER_LISTS = ("updaters", "time_based_updaters", "non_time_updaters")
+
+
+def instrument_updaters(profiler: Profiler, mobjects) -> None:
+    """把 mobjects 家族中尚未包装的 updater 替换为计时包装（可每帧调用，已包装的跳过）"""
+    for mob in mobjects:
+        has_updaters = getattr(mob, "has_updaters", True)
+        if callable(has_updaters):
+            has_updaters = has_updaters()
+        if not has_updaters:
+            continue
+        for member in mob.get_family():
+            for attr in _UPDATER_LISTS:
+                updaters = getattr(member, attr, None)
+                if not updaters:
+                    continue
+                for i, func in enumerate(updaters):
+                    if not isinstance(func, _TimedUpdater):
+                        name = f"{type(member).__name__}.{getattr(func, '__name__', 'updater')}"
+                        updaters[i] = _TimedUpdater(profiler, func, name)
@@ -0,0 +1,127 @@
+"""
+Tex/Text 并行预热（基于 ManimGL 自带的磁盘缓存）
+
+ManimGL 1.7 已经用 cache_on_disk（diskcache，目录为 get_cache_dir()）按完整内容
+缓存 full_tex_to_svg / markup_to_svg 的结果，跨场景、跨渲染复用，本模块不另建 SVG 缓存。
+它只解决搭建场景时 Tex 按出现顺序串行编译的问题：prewarm_tex() 先在进程池中并行构建
+一组字符串，编译结果写进这份内置缓存，主进程随后构建时直接命中。
+
+- 每个预热成功的请求在同一个 diskcache 中记一条标记；未改动的脚本重新渲染时全部命中标记，
+  不启动进程池。clear_cache() 清空缓存时标记一并清除
+- 标记不含 LaTeX 模板等全局配置：配置改动后标记可能过期，主进程届时按需编译，结果不受影响
+- 子进程重新打开 diskcache（fork 继承的 SQLite 连接不能在进程间共用）
+
+使用方法:
+    from utils.tex_cache import prewarm_tex
+
+    prewarm_tex([r"E = mc^2", r"\\int_0^1 x^2 dx"], font_size=32)
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+
+VERSION = 1
+_MARKER_TAG = "auto_manim.prewarm_tex"
+
+
+def _disk_cache():
+    """ManimGL cache_on_disk 使用的 diskcache 实例；当前版本没有时返回 None"""
+    try:
+        from manimlib.utils import cache
+    except ImportError:
+        return None
+    return getattr(cache, "_cache", None)
+
+
+def request_key(kind: str, string: str, mob_kwargs: dict) -> str:
+    payload = json.dumps(
+        [VERSION, kind, string, sorted(mob_kwargs.items())],
+        ensure_ascii=False, default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_prewarmed(kind: str, string: str, mob_kwargs: dict) -> bool:
+    disk_cache = _disk_cache()
+    return disk_cache is not None and bool(disk_cache.get((_MARKER_TAG, request_key(kind, string, mob_kwargs))))
+
+
+def _build_mobject(kind: str, string: str, mob_kwargs: dict):
+    from manimlib import Tex, TexText, Text
+    cls = {"tex": Tex, "textext": TexText, "text": Text}[kind]
+    return cls(string, **mob_kwargs)
+
+
+def _compile_request(kind: str, string: str, mob_kwargs: dict) -> Optional[str]:
+    """构建一次（编译结果写入内置缓存），返回错误信息"""
+    try:
+        _build_mobject(kind, string, mob_kwargs)
+        return None
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def _init_worker() -> None:
+    """进程池初始化：换用本进程自己的 diskcache 连接"""
+    from diskcache import Cache
+    from manimlib.utils import cache
+    cache._cache = Cache(cache.get_cache_dir(), size_limit=cache.CACHE_SIZE)
+
+
+def prewarm_tex(
+    strings: List[str],
+    kind: str = "tex",
+    processes: Optional[int] = None,
+    **mob_kwargs,
+) -> Dict[str, int]:
+    """
+    在进程池中预编译一组字符串
+
+    Args:
+        strings: Tex（或 Text / TexText）字符串
+        kind: "tex" / "textext" / "text"
+        processes: 进程数，默认 min(CPU 数, 待编译数)；1 表示在本进程内编译
+        **mob_kwargs: 传给 Tex/Text 的参数（t2c、isolate 等会影响 LaTeX 内容）
+
+    Returns:
+        {"total", "cached", "compiled", "failed"}
+    """
+    if kind not in ("tex", "textext", "text"):
+        raise ValueError(f"kind must be 'tex', 'textext' or 'text', got '{kind}'")
+    report = {"total": 0, "cached": 0, "compiled": 0, "failed": 0}
+    disk_cache = _disk_cache()
+    if disk_cache is None:
+        print("⚠️ 当前 ManimGL 没有 cache_on_disk 磁盘缓存，跳过 Tex 预热")
+        return report
+
+    pending = {}
+    for string in dict.fromkeys(strings):
+        report["total"] += 1
+        key = request_key(kind, string, mob_kwargs)
+        if disk_cache.get((_MARKER_TAG, key)):
+            report["cached"] += 1
+        else:
+            pending[key] = string
+    if not pending:
+        return report
+
+    n_processes = processes or min(os.cpu_count() or 1, len(pending))
+    if n_processes <= 1 or len(pending) == 1:
+        errors = [_compile_request(kind, s, mob_kwargs) for s in pending.values()]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_processes, initializer=_init_worker) as pool:
+            futures = [pool.submit(_compile_request, kind, s, mob_kwargs) for s in pending.values()]
+            errors = [f.result() for f in futures]
+
+    for (key, string), error in zip(pending.items(), errors):
+        if error is not None:
+            report["failed"] += 1
+            print(f"⚠️ Tex 预热失败: {string[:40]} ({error})")
+            continue
+        disk_cache.set((_MARKER_TAG, key), True)
+        report["compiled"] += 1
+    return report
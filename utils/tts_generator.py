@@ -7,11 +7,82 @@ TTS 配音生成工具
     
     tts = TTSGenerator()
     await tts.generate("你好世界", "output.mp3")
+    
+    # 并发批量合成（有界并发）
+    await tts.generate_batch(["第一句", "第二句"], "out_dir", max_concurrency=8)
+    
+    # 离线替身后端（无需联网，用于基准测试）
+    tts = TTSGenerator(backend=OfflineTTSBackend(latency=0.3))
 """
 
 import asyncio
 import os
-import edge_tts
+import time
+import uuid
+
+try:
+    import edge_tts
+except ImportError:
+    edge_tts = None
+
+
+# ==================== 合成后端 ====================
+
+class EdgeTTSBackend:
+    """
+    edge-tts 在线合成后端（默认）
+    
+    后端协议：提供 async synthesize(text, output_path, voice, rate, pitch)，
+    将音频写入 output_path。
+    """
+    
+    async def synthesize(self, text: str, output_path: str, voice: str, rate: str, pitch: str) -> None:
+        if edge_tts is None:
+            raise ImportError("edge-tts 未安装，请运行: pip install edge-tts")
+        communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
+        await communicate.save(output_path)
+
+
+class OfflineTTSBackend:
+    """
+    离线替身后端：写入静音 MP3 帧并模拟网络往返延迟
+    
+    生成的文件是合法的 MPEG-1 Layer III 流（44.1kHz / 128kbps 静音帧），
+    时长与文本长度成正比，可被 pydub / ffmpeg 正常解码。
+    用于离线测试与并发合成的基准测试。
+    """
+    
+    # MPEG-1 Layer III, 128kbps, 44.1kHz, 无 CRC, 单声道
+    _FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0xC4])
+    _FRAME_SIZE = 417             # 144 * 128000 / 44100
+    _FRAME_DURATION = 1152 / 44100
+    
+    def __init__(self, latency: float = 0.2, seconds_per_char: float = 0.22):
+        """
+        Args:
+            latency: 每次合成模拟的往返延迟（秒）
+            seconds_per_char: 每个字符对应的音频时长（秒）
+        """
+        self.latency = latency
+        self.seconds_per_char = seconds_per_char
+        self.calls = 0
+    
+    async def synthesize(self, text: str, output_path: str, voice: str, rate: str, pitch: str) -> None:
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        duration = max(len(text), 1) * self.seconds_per_char
+        n_frames = max(1, int(round(duration / self._FRAME_DURATION)))
+        frame = self._FRAME_HEADER + bytes(self._FRAME_SIZE - len(self._FRAME_HEADER))
+        with open(output_path, "wb") as f:
+            f.write(frame * n_frames)
+
+
+# ==================== 生成器 ====================
+
+def _temp_path(output_path: str) -> str:
+    """output_path 同目录下的唯一临时文件名（同进程并发合成同一路径也不冲突）"""
+    return f"{output_path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
 
 
 class TTSGenerator:
@@ -28,7 +99,10 @@ class TTSGenerator:
     # 默认语音
     DEFAULT_VOICE = "zh-CN-XiaoxiaoNeural"
     
-    def __init__(self, voice: str = None, rate: str = "+0%", pitch: str = "+0Hz"):
+    # 批量合成默认并发数
+    DEFAULT_MAX_CONCURRENCY = 8
+    
+    def __init__(self, voice: str = None, rate: str = "+0%", pitch: str = "+0Hz", backend=None):
         """
         初始化 TTS 生成器
         
@@ -36,10 +110,12 @@ class TTSGenerator:
             voice: 语音名称（默认 zh-CN-XiaoxiaoNeural）
             rate: 语速调节（如 "+10%", "-20%"）
             pitch: 音调调节（如 "+5Hz", "-10Hz"）
+            backend: 合成后端（默认 EdgeTTSBackend），见 OfflineTTSBackend
         """
         self.voice = voice or self.DEFAULT_VOICE
         self.rate = rate
         self.pitch = pitch
+        self.backend = backend or EdgeTTSBackend()
     
     async def generate(self, text: str, output_path: str) -> str:
         """
@@ -51,18 +127,22 @@ class TTSGenerator:
             
         Returns:
             输出文件的绝对路径
-        """
-        communicate = edge_tts.Communicate(
-            text,
-            self.voice,
-            rate=self.rate,
-            pitch=self.pitch
-        )
         
+        先写入同目录的临时文件，合成成功后 os.replace 到 output_path：
+        失败或中断不会在 output_path 留下不完整的文件（内容寻址缓存以文件存在为命中）。
+        """
         # 确保输出目录存在
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
         
-        await communicate.save(output_path)
+        tmp_path = _temp_path(output_path)
+        try:
+            await self.backend.synthesize(text, tmp_path, self.voice, self.rate, self.pitch)
+            if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
+                raise RuntimeError(f"合成结果为空: {text[:20]}")
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         return os.path.abspath(output_path)
     
     async def generate_with_subtitle(
@@ -86,6 +166,9 @@ class TTSGenerator:
             base = os.path.splitext(audio_path)[0]
             subtitle_path = base + ".srt"
         
+        if edge_tts is None:
+            raise ImportError("edge-tts 未安装，请运行: pip install edge-tts")
+        
         communicate = edge_tts.Communicate(
             text,
             self.voice,
@@ -97,12 +180,18 @@ class TTSGenerator:
         
         submaker = edge_tts.SubMaker()
         
-        with open(audio_path, "wb") as f:
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    f.write(chunk["data"])
-                elif chunk["type"] == "WordBoundary":
-                    submaker.feed(chunk)
+        tmp_path = _temp_path(audio_path)
+        try:
+            with open(tmp_path, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        f.write(chunk["data"])
+                    elif chunk["type"] == "WordBoundary":
+                        submaker.feed(chunk)
+            os.replace(tmp_path, audio_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         
         with open(subtitle_path, "w", encoding="utf-8") as f:
             f.write(submaker.generate_subs())
@@ -113,32 +202,54 @@ class TTSGenerator:
         self, 
         subtitles: list, 
         output_dir: str,
-        prefix: str = "line"
+        prefix: str = "line",
+        max_concurrency: int = None,
+        skip_existing: bool = False,
+        raise_on_error: bool = True
     ) -> list:
         """
-        批量生成配音文件
+        批量生成配音文件（有界并发）
+        
+        使用 asyncio.Semaphore 限制同时进行的合成请求数，
+        结果顺序与输入顺序一致。
         
         Args:
             subtitles: 字幕列表 [{"text": "...", "id": 1}, ...]
+                       字典可带 "path" 字段指定输出路径（覆盖 prefix 命名）
             output_dir: 输出目录
             prefix: 文件名前缀
+            max_concurrency: 最大并发数（默认 DEFAULT_MAX_CONCURRENCY）
+            skip_existing: 输出文件已存在时跳过合成
+            raise_on_error: False 时单条失败不中断批量，对应位置返回 None
             
         Returns:
             生成的文件路径列表
         """
         os.makedirs(output_dir, exist_ok=True)
-        results = []
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.DEFAULT_MAX_CONCURRENCY))
         
-        for i, sub in enumerate(subtitles):
+        async def run_one(i, sub):
             text = sub.get("text", sub) if isinstance(sub, dict) else sub
             idx = sub.get("id", i + 1) if isinstance(sub, dict) else i + 1
+            output_path = sub.get("path") if isinstance(sub, dict) else None
+            if output_path is None:
+                output_path = os.path.join(output_dir, f"{prefix}_{idx:03d}.mp3")
+            
+            if skip_existing and os.path.exists(output_path):
+                return output_path
             
-            output_path = os.path.join(output_dir, f"{prefix}_{idx:03d}.mp3")
-            await self.generate(text, output_path)
-            results.append(output_path)
+            async with semaphore:
+                try:
+                    await self.generate(text, output_path)
+                except Exception as e:
+                    if raise_on_error:
+                        raise
+                    print(f"❌ 生成失败: {output_path} ({e})")
+                    return None
             print(f"✅ 生成: {output_path}")
+            return output_path
         
-        return results
+        return list(await asyncio.gather(*(run_one(i, sub) for i, sub in enumerate(subtitles))))
     
     @staticmethod
     async def list_voices(language: str = "zh") -> list:
@@ -151,6 +262,8 @@ class TTSGenerator:
         Returns:
             语音列表
         """
+        if edge_tts is None:
+            raise ImportError("edge-tts 未安装，请运行: pip install edge-tts")
         voices = await edge_tts.list_voices()
         if language:
             voices = [v for v in voices if language.lower() in v["Locale"].lower()]
@@ -180,7 +293,8 @@ def generate_voice(text: str, output_path: str, voice: str = None) -> str:
     return asyncio.run(tts.generate(text, output_path))
 
 
-def generate_voice_batch(subtitles: list, output_dir: str, voice: str = None) -> list:
+def generate_voice_batch(subtitles: list, output_dir: str, voice: str = None,
+                         max_concurrency: int = None, backend=None) -> list:
     """
     批量生成配音（同步版本）
     
@@ -188,12 +302,51 @@ def generate_voice_batch(subtitles: list, output_dir: str, voice: str = None) ->
         subtitles: 字幕列表
         output_dir: 输出目录
         voice: 语音（可选）
+        max_concurrency: 最大并发数（可选）
+        backend: 合成后端（可选）
         
     Returns:
         输出文件路径列表
     """
-    tts = TTSGenerator(voice=voice)
-    return asyncio.run(tts.generate_batch(subtitles, output_dir))
+    tts = TTSGenerator(voice=voice, backend=backend)
+    return asyncio.run(tts.generate_batch(subtitles, output_dir, max_concurrency=max_concurrency))
+
+
+def benchmark_batch(n_lines: int = 60, latency: float = 0.2, max_concurrency: int = 8,
+                    output_dir: str = None) -> dict:
+    """
+    离线基准测试：串行逐条合成 vs 有界并发批量合成
+    
+    Args:
+        n_lines: 文本条数
+        latency: 替身后端的模拟往返延迟（秒）
+        max_concurrency: 并发数
+        output_dir: 输出目录（默认临时目录）
+        
+    Returns:
+        {"serial": 秒, "concurrent": 秒, "speedup": 倍数}
+    """
+    import tempfile
+    
+    texts = [f"第 {i} 句测试文本，用于并发合成基准" for i in range(n_lines)]
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir = output_dir or tmp
+        
+        tts = TTSGenerator(backend=OfflineTTSBackend(latency=latency))
+        serial_dir = os.path.join(base_dir, "serial")
+        os.makedirs(serial_dir, exist_ok=True)
+        t0 = time.perf_counter()
+        for i, text in enumerate(texts):
+            asyncio.run(tts.generate(text, os.path.join(serial_dir, f"line_{i:03d}.mp3")))
+        serial = time.perf_counter() - t0
+        
+        t0 = time.perf_counter()
+        asyncio.run(tts.generate_batch(
+            texts, os.path.join(base_dir, "concurrent"), max_concurrency=max_concurrency
+        ))
+        concurrent = time.perf_counter() - t0
+    
+    return {"serial": serial, "concurrent": concurrent, "speedup": serial / max(concurrent, 1e-9)}
 
 
 # ==================== 测试 ====================
@@ -201,6 +354,12 @@ def generate_voice_batch(subtitles: list, output_dir: str, voice: str = None) ->
 if __name__ == "__main__":
     import sys
     
+    if "--offline-bench" in sys.argv:
+        result = benchmark_batch()
+        print(f"串行: {result['serial']:.2f}s  并发: {result['concurrent']:.2f}s  "
+              f"加速: {result['speedup']:.1f}x")
+        sys.exit(0)
+    
     # 设置输出目录
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
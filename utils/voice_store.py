@@ -0,0 +1,297 @@
+"""
+配音内容寻址存储（跨场景共享）
+
+按 (text, voice, rate, pitch) 的完整哈希存储音频 blob，
+场景通过清单（manifest）把行号映射到 blob：
+- 场景改名、插入一行、跨场景复用同一句话都不会触发重新合成
+- blob 的 mtime 作为最近访问时间，按总大小做 LRU 淘汰
+- gc 命令清理没有任何清单引用的 blob（场景完整渲染后清单会删去不再使用的行）
+- blob 一律先写临时文件再原子替换，存在即完整
+
+目录结构:
+    assets/sounds/voice/_store/ab/ab3f...e1.mp3     # blob
+    assets/sounds/voice/<ClassName>/manifest.json   # 场景清单
+
+使用方法:
+    from utils.voice_store import VoiceStore
+
+    store = VoiceStore(voice_root)
+    key = store.make_key("你好世界", "zh-CN-XiaoxiaoNeural")
+    path = store.blob_path(key)
+    if not store.has(key):
+        ...  # 合成到 path
+    store.touch(key)
+
+命令行:
+    python utils/voice_store.py gc [--max-size 2G] [--dry-run]
+    python utils/voice_store.py stats
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+
+class VoiceStore:
+    """
+    内容寻址配音存储
+
+    - blob 文件名为 sha256 全哈希，两级目录分桶
+    - 访问时更新 mtime（LRU 依据）
+    - 本进程访问过的 blob 视为已固定，不会被自动淘汰
+    """
+
+    STORE_DIRNAME = "_store"
+    MANIFEST_NAME = "manifest.json"
+    DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2GB
+    STALE_TEMP_SECONDS = 24 * 3600  # gc 清理超过此时长的残留临时文件（被中断的合成）
+
+    def __init__(self, voice_root: str, max_bytes: int = None, ext: str = ".mp3"):
+        """
+        Args:
+            voice_root: 配音根目录（assets/sounds/voice）
+            max_bytes: 存储上限（字节），超出后按 LRU 淘汰；0 表示不限
+            ext: blob 扩展名
+        """
+        self.voice_root = os.path.abspath(voice_root)
+        self.store_dir = os.path.join(self.voice_root, self.STORE_DIRNAME)
+        self.max_bytes = self.DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.ext = ext
+        self._pinned = set()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    # ==================== blob ====================
+
+    @staticmethod
+    def make_key(text: str, voice: str, rate: str = "+0%", pitch: str = "+0Hz") -> str:
+        """(text, voice, rate, pitch) 的完整 sha256 哈希"""
+        payload = json.dumps([text, voice, rate, pitch], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def blob_path(self, key: str) -> str:
+        """blob 的存储路径（不保证存在）"""
+        return os.path.join(self.store_dir, key[:2], key + self.ext)
+
+    def has(self, key: str) -> bool:
+        path = self.blob_path(key)
+        return os.path.exists(path) and os.path.getsize(path) > 0
+
+    def touch(self, key: str) -> None:
+        """标记 blob 被使用：更新 mtime 并固定到本进程"""
+        self._pinned.add(key)
+        try:
+            os.utime(self.blob_path(key), None)
+        except OSError:
+            pass
+
+    def prepare(self, key: str) -> str:
+        """确保 blob 所在目录存在，返回写入路径"""
+        path = self.blob_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def import_file(self, key: str, source: str) -> str:
+        """把已有音频文件复制为 blob（临时文件 + 原子替换）"""
+        path = self.prepare(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return path
+
+    def iter_blobs(self):
+        """遍历 (key, path, size, mtime)"""
+        if not os.path.isdir(self.store_dir):
+            return
+        for bucket in os.listdir(self.store_dir):
+            bucket_dir = os.path.join(self.store_dir, bucket)
+            if not os.path.isdir(bucket_dir):
+                continue
+            for name in os.listdir(bucket_dir):
+                if not name.endswith(self.ext):
+                    continue
+                path = os.path.join(bucket_dir, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield name[:-len(self.ext)], path, st.st_size, st.st_mtime
+
+    def total_size(self) -> int:
+        return sum(size for _, _, size, _ in self.iter_blobs())
+
+    def iter_stale_temps(self, max_age: float = None):
+        """遍历被中断的写入留下的临时文件（早于 max_age 秒）"""
+        if not os.path.isdir(self.store_dir):
+            return
+        cutoff = time.time() - (self.STALE_TEMP_SECONDS if max_age is None else max_age)
+        for bucket in os.listdir(self.store_dir):
+            bucket_dir = os.path.join(self.store_dir, bucket)
+            if not os.path.isdir(bucket_dir):
+                continue
+            for name in os.listdir(bucket_dir):
+                if not name.endswith(".tmp"):
+                    continue
+                path = os.path.join(bucket_dir, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        yield path
+                except OSError:
+                    continue
+
+    # ==================== 清单 ====================
+
+    def manifest_path(self, scene_name: str) -> str:
+        return os.path.join(self.voice_root, scene_name, self.MANIFEST_NAME)
+
+    def load_manifest(self, scene_name: str) -> dict:
+        """读取场景清单 {行号(str): {"key": ..., "text": ...}}"""
+        path = self.manifest_path(scene_name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("lines", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, scene_name: str, lines: dict, keep: set = None) -> None:
+        """
+        写入场景清单
+
+        Args:
+            lines: {行号(str): {"key": ..., "text": ...}}
+            keep: 给定时只保留这些行号（原地删除 lines 中的其余行），
+                被删行引用的 blob 随后可被 gc 回收
+        """
+        if keep is not None:
+            for line in set(lines) - set(keep):
+                del lines[line]
+        path = self.manifest_path(scene_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "lines": lines}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+
+    def referenced_keys(self) -> set:
+        """所有场景清单引用的 blob"""
+        keys = set()
+        if not os.path.isdir(self.voice_root):
+            return keys
+        for name in os.listdir(self.voice_root):
+            if name == self.STORE_DIRNAME:
+                continue
+            if os.path.exists(self.manifest_path(name)):
+                keys.update(entry.get("key") for entry in self.load_manifest(name).values())
+        keys.discard(None)
+        return keys
+
+    # ==================== 淘汰与回收 ====================
+
+    def evict(self, max_bytes: int = None, dry_run: bool = False) -> list:
+        """
+        按 LRU（mtime 从旧到新）淘汰 blob，直到总大小不超过 max_bytes
+
+        本进程固定的 blob 不会被淘汰。
+
+        Returns:
+            被删除的 blob 路径列表
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if not limit:
+            return []
+
+        blobs = sorted(self.iter_blobs(), key=lambda b: b[3])
+        total = sum(b[2] for b in blobs)
+        removed = []
+        for key, path, size, _ in blobs:
+            if total <= limit:
+                break
+            if key in self._pinned:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            removed.append(path)
+            total -= size
+        return removed
+
+    def gc(self, max_bytes: int = None, dry_run: bool = False) -> list:
+        """
+        回收：删除残留临时文件与未被任何清单引用的 blob，再按 LRU 淘汰到容量上限
+
+        Returns:
+            被删除的文件路径列表
+        """
+        referenced = self.referenced_keys() | self._pinned
+        removed = []
+        for path in list(self.iter_stale_temps()):
+            if not dry_run:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            removed.append(path)
+        for key, path, _, _ in list(self.iter_blobs()):
+            if key in referenced:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            removed.append(path)
+        removed.extend(self.evict(max_bytes, dry_run=dry_run))
+        return removed
+
+
+def _parse_size(text: str) -> int:
+    """解析 "500M" / "2G" / "1048576" 为字节数"""
+    text = text.strip().upper()
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def default_voice_root() -> str:
+    """项目默认配音根目录 assets/sounds/voice"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(project_root, "assets", "sounds", "voice")
+
+
+# ==================== 命令行 ====================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="配音内容寻址存储管理")
+    parser.add_argument("command", choices=["gc", "stats"])
+    parser.add_argument("--root", default=default_voice_root(), help="配音根目录")
+    parser.add_argument("--max-size", default=None, help="容量上限，如 500M / 2G")
+    parser.add_argument("--dry-run", action="store_true", help="只列出将删除的文件")
+    args = parser.parse_args()
+
+    store = VoiceStore(args.root)
+
+    if args.command == "stats":
+        blobs = list(store.iter_blobs())
+        referenced = store.referenced_keys()
+        size = sum(b[2] for b in blobs)
+        print(f"📦 blob 数: {len(blobs)}  总大小: {size / 1024 ** 2:.1f} MB")
+        print(f"🔗 被清单引用: {sum(1 for b in blobs if b[0] in referenced)}")
+    else:
+        max_bytes = _parse_size(args.max_size) if args.max_size else None
+        t0 = time.perf_counter()
+        removed = store.gc(max_bytes=max_bytes, dry_run=args.dry_run)
+        action = "将删除" if args.dry_run else "已删除"
+        for path in removed:
+            print(f"  - {os.path.relpath(path, store.voice_root)}")
+        print(f"🗑️ {action} {len(removed)} 个 blob ({time.perf_counter() - t0:.2f}s)")